@@ -0,0 +1,122 @@
+"""
+Latency of the admin user directory of one large college.
+
+Pages through the users of the largest college in the database, the way
+GET /api/v1/user/college/{college_id} does, and times:
+
+    first    the first page, a keyset page plus the count capped at
+             DIRECTORY_COUNT_CAP
+    keyset   every following page, --pages deep, by cursor
+    offset   the same pages by LIMIT/OFFSET, what the directory used to do
+    count    the exact count the capped one replaces
+
+Needs a migrated database with a dataset of one large college, e.g.
+
+    python scripts/synthetic_data.py generate --out datasets/dir \\
+        --colleges 1 --users 100000
+    python scripts/synthetic_data.py load --dataset datasets/dir --truncate
+    python scripts/directory_benchmark.py --pages 200 --limit 50
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+import structlog
+from sqlalchemy import func, select
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.core import AsyncSessionLocal, engine
+from campus_bridge.data.models.user import User
+from campus_bridge.modules.users.repository.user_repository import UserRepository
+from campus_bridge.modules.users.service.user_service import UserService
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    latencies.sort()
+    print(
+        f"{name:<7} p50 {statistics.median(latencies) * 1000:.2f}ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f}ms"
+        f"  max {latencies[-1] * 1000:.2f}ms"
+    )
+
+
+async def _timed(statement) -> float:
+    async with AsyncSessionLocal() as session:
+        started = time.perf_counter()
+        (await session.execute(statement)).all()
+        return time.perf_counter() - started
+
+
+async def main(args: argparse.Namespace) -> None:
+    # one info line per page would drown the numbers
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    async with AsyncSessionLocal() as session:
+        largest = (
+            await session.execute(
+                select(User.college_id, func.count())
+                .where(~User.is_deleted)
+                .group_by(User.college_id)
+                .order_by(func.count().desc())
+                .limit(1)
+            )
+        ).first()
+    if largest is None:
+        raise SystemExit("no users, load a dataset first")
+    college_id, users = largest
+    print(
+        f"college {college_id}: {users} users, {args.limit} per page,"
+        f" count capped at {settings.DIRECTORY_COUNT_CAP}"
+    )
+
+    first, keyset = [], []
+    for round_ in range(args.rounds):
+        cursor = None
+        for page_number in range(args.pages):
+            async with AsyncSessionLocal() as session:
+                service = UserService(
+                    UserRepository(session), presence_tracker=None, people_index=None
+                )
+                started = time.perf_counter()
+                page = await service.get_users_by_college_id_or_role(
+                    college_id, limit=args.limit, cursor=cursor
+                )
+                elapsed = time.perf_counter() - started
+            # the first round warms the caches
+            if round_:
+                (keyset if cursor else first).append(elapsed)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+    print(f"{page_number + 1} pages deep")
+    _report("first", first)
+    _report("keyset", keyset)
+
+    base = (
+        select(User)
+        .where(User.college_id == college_id, ~User.is_deleted)
+        .order_by(User.created_at.desc(), User.id.desc())
+        .limit(args.limit)
+    )
+    offset = [
+        await _timed(base.offset(n * args.limit))
+        for _ in range(1, args.rounds)
+        for n in range(page_number + 1)
+    ]
+    _report("offset", offset)
+
+    exact = select(func.count()).where(User.college_id == college_id, ~User.is_deleted)
+    _report("count", [await _timed(exact) for _ in range(args.rounds * 5)])
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=200, help="pages deep")
+    parser.add_argument("--limit", type=int, default=50, help="users per page")
+    parser.add_argument("--rounds", type=int, default=4, help="first one warms up")
+    asyncio.run(main(parser.parse_args()))
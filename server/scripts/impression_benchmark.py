@@ -0,0 +1,53 @@
+"""
+Cost of recording feed impressions on the event loop.
+
+Serves --pages synthetic feed pages of --page-size posts, --rounds times
+over, into an ImpressionTracker and times `record`, the part that runs in
+every feed request. Flushes are not timed, they run in the background
+with one database round trip per batch:
+
+    python scripts/impression_benchmark.py --pages 500 --rounds 20
+"""
+
+import argparse
+import statistics
+import time
+from uuid import uuid4
+
+from campus_bridge.modules.feed.service.impression_tracker import ImpressionTracker
+
+
+def main(args: argparse.Namespace) -> None:
+    tracker = ImpressionTracker(
+        flush_interval_seconds=3600,
+        max_pending=10**9,
+        max_buffered=10**9,
+        max_backoff_seconds=3600,
+    )
+    pages = [[uuid4() for _ in range(args.page_size)] for _ in range(args.pages)]
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(args.rounds):
+        for page in pages:
+            at = time.perf_counter()
+            tracker.record(page)
+            latencies.append(time.perf_counter() - at)
+    elapsed = time.perf_counter() - started
+
+    impressions = args.rounds * args.pages * args.page_size
+    latencies.sort()
+    print(f"{impressions} impressions of {args.pages * args.page_size} posts")
+    print(
+        f"record  {impressions / elapsed:,.0f} impressions/s"
+        f"  p50 {statistics.median(latencies) * 1e6:.1f}us"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1e6:.1f}us per page"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,111 @@
+"""
+Latency of interest matches for one large college.
+
+Builds an InterestMatcher matrix over --students synthetic verified
+students of a single college (50k by default) and times, for --lookups of
+them:
+
+    build    the first match, which builds the college's sparse matrix
+    cold     a student's first matches, scored against the matrix
+    cached   the same student again, answered from the per-student cache
+
+Interests mix the hot topics of scripts/synthetic_data.py with a long tail
+of --vocabulary rarer ones, so some tag columns are dense and most are
+sparse. No database is needed, the profiles are served from memory:
+
+    python scripts/interest_benchmark.py --students 50000 --lookups 2000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from uuid import UUID, uuid4
+
+from synthetic_data import FIRST_NAMES, LAST_NAMES, TOPICS
+
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.modules.student.service.interest_matcher import InterestMatcher
+
+
+class _ProfileSource:
+    """Stands in for StudentRepository.get_interest_profiles"""
+
+    def __init__(self, rows: list):
+        self.rows = rows
+
+    async def get_interest_profiles(self, college_id: UUID) -> list:
+        return self.rows
+
+
+def _topics(rng: random.Random, vocabulary: int, count: int) -> list[str]:
+    # half from the hot topics, half from the long tail
+    return [
+        (
+            rng.choice(TOPICS)
+            if rng.random() < 0.5
+            else f"topic{rng.randrange(vocabulary)}"
+        )
+        for _ in range(count)
+    ]
+
+
+def _students(rng: random.Random, n: int, vocabulary: int) -> list:
+    return [
+        (
+            uuid4(),
+            uuid4(),
+            rng.choice(FIRST_NAMES),
+            rng.choice(LAST_NAMES),
+            rng.choice(list(BranchEnum)),
+            rng.randint(1, 4),
+            {"interests": _topics(rng, vocabulary, rng.randint(1, 6))},
+        )
+        for _ in range(n)
+    ]
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    latencies.sort()
+    print(
+        f"{name:<7} p50 {statistics.median(latencies) * 1000:.3f}ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.3f}ms"
+        f"  max {latencies[-1] * 1000:.3f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    source = _ProfileSource(_students(rng, args.students, args.vocabulary))
+    lookups = rng.sample(source.rows, args.lookups)
+    matcher = InterestMatcher(max_colleges=1, ttl_seconds=3600, top_k=args.top_k)
+    college_id = uuid4()
+
+    async def match(student) -> float:
+        student_id, *_, interests = student
+        started = time.perf_counter()
+        await matcher.matches(
+            source,
+            college_id=college_id,
+            student_id=student_id,
+            interests=interests,
+            limit=args.limit,
+        )
+        return time.perf_counter() - started
+
+    print(f"{args.students} students, {args.lookups} lookups, top {args.top_k}")
+    print(f"build   {await match(lookups[0]) * 1000:.1f}ms")
+    _report("cold", [await match(student) for student in lookups[1:]])
+    _report("cached", [await match(student) for student in lookups[1:]])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--students", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--vocabulary", type=int, default=2000, help="rare topics")
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=10, help="matches per request")
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,118 @@
+"""
+Latency of mentor recommendations for one large college.
+
+Builds a MentorMatcher index over --alumni synthetic alumni of a single
+college (100k by default) and times, for --students synthetic students:
+
+    build    the first recommendation, which indexes the college
+    cold     a student's first recommendation, scored against the index
+    cached   the same student again, answered from the per-student cache
+
+Expertise areas mix the hot topics of scripts/synthetic_data.py with a long
+tail of --vocabulary rarer ones, so some posting lists are long and most
+are short. No database is needed, the profiles are served from memory:
+
+    python scripts/mentor_benchmark.py --alumni 100000 --students 2000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from uuid import UUID, uuid4
+
+from synthetic_data import COMPANIES, DESIGNATIONS, TOPICS
+
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.modules.alumni.service.mentor_matcher import MentorMatcher
+
+
+class _ProfileSource:
+    """Stands in for AlumniRepository.get_mentor_profiles"""
+
+    def __init__(self, rows: list):
+        self.rows = rows
+
+    async def get_mentor_profiles(self, college_id: UUID) -> list:
+        return self.rows
+
+
+def _topics(rng: random.Random, vocabulary: int, count: int) -> list[str]:
+    # half from the hot topics, half from the long tail
+    return [
+        (
+            rng.choice(TOPICS)
+            if rng.random() < 0.5
+            else f"topic{rng.randrange(vocabulary)}"
+        )
+        for _ in range(count)
+    ]
+
+
+def _alumni(rng: random.Random, n: int, vocabulary: int) -> list:
+    return [
+        (
+            uuid4(),
+            uuid4(),
+            rng.randint(1995, 2025),
+            rng.choice(COMPANIES),
+            rng.choice(DESIGNATIONS),
+            rng.randint(0, 25),
+            {"expertise": _topics(rng, vocabulary, rng.randint(1, 4))},
+        )
+        for _ in range(n)
+    ]
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    latencies.sort()
+    print(
+        f"{name:<7} p50 {statistics.median(latencies) * 1000:.3f}ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.3f}ms"
+        f"  max {latencies[-1] * 1000:.3f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    source = _ProfileSource(_alumni(rng, args.alumni, args.vocabulary))
+    students = [
+        (
+            uuid4(),
+            {"interests": _topics(rng, args.vocabulary, rng.randint(1, 6))},
+            rng.choice(list(BranchEnum)),
+        )
+        for _ in range(args.students)
+    ]
+    matcher = MentorMatcher(max_colleges=1, ttl_seconds=3600, top_k=args.top_k)
+    college_id = uuid4()
+
+    async def recommend(student) -> float:
+        student_id, interests, branch = student
+        started = time.perf_counter()
+        await matcher.recommend(
+            source,
+            college_id=college_id,
+            student_id=student_id,
+            interests=interests,
+            branch=branch,
+            limit=args.limit,
+        )
+        return time.perf_counter() - started
+
+    print(f"{args.alumni} alumni, {args.students} students, top {args.top_k}")
+    print(f"build   {await recommend(students[0]) * 1000:.1f}ms")
+    _report("cold", [await recommend(student) for student in students[1:]])
+    _report("cached", [await recommend(student) for student in students[1:]])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--alumni", type=int, default=100_000)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--vocabulary", type=int, default=2000, help="rare topics")
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=10, help="mentors per request")
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,103 @@
+"""
+Latency of people typeahead search in one large college.
+
+Indexes --people synthetic students and alumni of a single college (50k by
+default) in a PeopleIndex and times, for --queries people picked at random,
+every prefix a user types while looking them up by first name, then by
+first and last name, e.g. "a", "ar", ..., "arjun", "arjun s", ...:
+
+    build    indexing the college, done off the event loop on first search
+    short    a typeahead query of one or two characters, matching the most
+    longer   a typeahead query of three characters or more
+
+No database is needed, the people are served from memory:
+
+    python scripts/search_benchmark.py --people 50000 --queries 500
+"""
+
+import argparse
+import random
+import statistics
+import time
+from uuid import uuid4
+
+from synthetic_data import FIRST_NAMES, LAST_NAMES
+
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.modules.search.service.people_index import (
+    PeopleIndex,
+    Person,
+    _CollegeIndex,
+)
+
+
+def _people(rng: random.Random, n: int) -> list[Person]:
+    people = []
+    for i in range(n):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        email = f"{first}.{last}{i}@college.example.edu".lower()
+        if rng.random() < 0.25:
+            # alumni are searchable by email only
+            people.append(Person(uuid4(), RoleEnum.ALUMNI, email, None, None))
+        else:
+            people.append(Person(uuid4(), RoleEnum.STUDENT, email, first, last))
+    return people
+
+
+def _typed(person: Person) -> list[str]:
+    # what the search box holds after each keystroke
+    name = (
+        f"{person.first_name} {person.last_name}"
+        if person.first_name
+        else person.email.split("@")[0]
+    ).lower()
+    return [
+        name[:end] for end in range(1, len(name) + 1) if not name[:end].endswith(" ")
+    ]
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    latencies.sort()
+    print(
+        f"{name:<7} p50 {statistics.median(latencies) * 1000:.3f}ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.3f}ms"
+        f"  max {latencies[-1] * 1000:.3f}ms"
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    people = _people(rng, args.people)
+    index = PeopleIndex(max_colleges=1, max_profiles=args.people, ttl_seconds=3600)
+    college_id = uuid4()
+
+    started = time.perf_counter()
+    # what PeopleIndex._build does once the rows are fetched
+    index._colleges[college_id] = _CollegeIndex(people)
+    build = time.perf_counter() - started
+
+    short, longer = [], []
+    for person in rng.sample(people, args.queries):
+        for query in _typed(person):
+            started = time.perf_counter()
+            index.search(college_id, query, args.limit)
+            elapsed = time.perf_counter() - started
+            (short if len(query) <= 2 else longer).append(elapsed)
+
+    print(
+        f"{args.people} people, {len(short) + len(longer)} queries,"
+        f" limit {args.limit}"
+    )
+    print(f"build   {build * 1000:.1f}ms")
+    _report("short", short)
+    _report("longer", longer)
+    _report("all", short + longer)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--people", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=500, help="people looked up")
+    parser.add_argument("--limit", type=int, default=10, help="results per query")
+    parser.add_argument("--seed", type=int, default=7)
+    main(parser.parse_args())
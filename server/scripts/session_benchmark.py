@@ -0,0 +1,144 @@
+"""
+Round trips and latency of request sessions, before and after read-only
+sessions.
+
+Replays the database work of a typical authenticated read, e.g.
+GET /api/v1/feed/public (the current user by id, then a page of public
+posts), through `get_async_session` the way each kind of endpoint gets it:
+
+    baseline   the previous session: a transaction, always committed
+    default    an unmarked endpoint: a transaction, rolled back if unwritten
+    read_only  @read_only(): autocommit, no BEGIN or COMMIT
+    snapshot   @read_only(snapshot=True): one REPEATABLE READ READ ONLY
+               transaction
+
+and counts what reaches the server: every statement, BEGIN, COMMIT,
+ROLLBACK and pool ping. Needs a migrated database with some users and
+posts, e.g. from scripts/synthetic_data.py:
+
+    python scripts/session_benchmark.py --requests 2000 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+from fastapi import Request
+from sqlalchemy import event, select
+
+from campus_bridge.data.database.core import AsyncSessionLocal, engine
+from campus_bridge.data.database.session import get_async_session, read_only
+from campus_bridge.data.models.user import User
+from campus_bridge.modules.feed.repository.feed_repository import FeedRepository
+from campus_bridge.modules.users.repository.user_repository import UserRepository
+
+round_trips: Counter = Counter()
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    round_trips["statement"] += 1
+
+
+def _count_query(record) -> None:
+    # asyncpg logs its own BEGIN / COMMIT / ROLLBACK and the pre-ping
+    round_trips[record.query.split()[0].strip(";").upper() or "PING"] += 1
+
+
+def _on_connect(dbapi_connection, connection_record) -> None:
+    dbapi_connection.driver_connection.add_query_logger(_count_query)
+
+
+async def _baseline_session():
+    async with AsyncSessionLocal() as session:
+        yield session
+        await session.commit()
+
+
+def _endpoint(mode: str):
+    async def endpoint():
+        pass
+
+    if mode == "read_only":
+        return read_only()(endpoint)
+    if mode == "snapshot":
+        return read_only(snapshot=True)(endpoint)
+    return endpoint
+
+
+async def _request(mode: str, user_id, limit: int) -> float:
+    if mode == "baseline":
+        sessions = _baseline_session()
+    else:
+        route = SimpleNamespace(endpoint=_endpoint(mode))
+        sessions = get_async_session(Request({"type": "http", "route": route}))
+
+    started = time.perf_counter()
+    session = await anext(sessions)
+    await UserRepository(session).get_user_by_id(user_id)
+    await FeedRepository(session).get_public_posts(limit=limit, cursor=None)
+    await anext(sessions, None)
+    return time.perf_counter() - started
+
+
+async def _run(mode: str, user_ids: list, requests: int, concurrency: int, limit: int):
+    latencies = []
+    # warm the pool and the statement caches first
+    queue = iter(range(concurrency * 10))
+
+    async def worker():
+        for n in queue:
+            latencies.append(await _request(mode, user_ids[n % len(user_ids)], limit))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    latencies.clear()
+    round_trips.clear()
+    queue = iter(range(requests))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    total = sum(round_trips.values())
+    detail = ", ".join(
+        f"{k}={v / requests:.2f}" for k, v in sorted(round_trips.items())
+    )
+    print(
+        f"{mode:<10} {total / requests:5.2f} round trips/request ({detail})\n"
+        f"{'':<10} p50 {statistics.median(latencies) * 1000:.2f}ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f}ms"
+        f"  {requests / elapsed:.0f} req/s"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+    event.listen(engine.sync_engine, "connect", _on_connect)
+    # connections opened from now on carry the query logger
+    await engine.dispose()
+
+    async with AsyncSessionLocal() as session:
+        user_ids = list(await session.scalars(select(User.id).limit(1000)))
+    if not user_ids:
+        raise SystemExit("no users, load a dataset first")
+
+    for mode in args.modes:
+        await _run(mode, user_ids, args.requests, args.concurrency, args.limit)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=10, help="posts per page")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["baseline", "default", "read_only", "snapshot"],
+        choices=["baseline", "default", "read_only", "snapshot"],
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,694 @@
+"""
+Synthetic CampusBridge dataset for scale and performance testing.
+
+Generate a dataset once, then load it into any number of databases:
+
+    python scripts/synthetic_data.py generate --out datasets/bench --users 1000000
+    python scripts/synthetic_data.py load --dataset datasets/bench --truncate
+
+`generate` writes every table as CSV shards of at most --shard-rows rows
+plus a manifest.json, in parallel, one process per shard. The same seed and
+sizes always give byte-identical files: row ids and the references between
+tables are pure functions of the seed and the row numbers, so no shard needs
+another one's output.
+
+`load` COPYs the shards into the database of DATABASE_URL, table by table in
+foreign key order and the shards of a table in parallel, then ANALYZEs. The
+schema must already be migrated (`alembic upgrade head`); the college stats
+triggers fire during the COPY and fill the stats tables.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.data.enums.post import PostTypeEnum, PostVisibilityEnum
+from campus_bridge.data.enums.reaction import ReactionTypeEnum
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.data.enums.state import StateEnum
+from campus_bridge.data.enums.tag import TagTypeEnum
+
+MASK64 = (1 << 64) - 1
+
+# table -> code mixed into its row ids
+TABLE_CODES = {
+    "colleges": 1,
+    "users": 2,
+    "students": 3,
+    "alumnis": 4,
+    "college_officials": 5,
+    "posts": 6,
+    "post_tags": 7,
+    "comments": 8,
+    "post_reactions": 9,
+}
+
+# fmt: off
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Aditya", "Ananya", "Arjun", "Divya", "Farhan", "Gauri",
+    "Harsh", "Ishita", "Kabir", "Kavya", "Meera", "Nikhil", "Pooja", "Priya",
+    "Rahul", "Riya", "Rohan", "Sanjana", "Siddharth", "Sneha", "Tanvi",
+    "Varun", "Vikram", "Zoya",
+]
+LAST_NAMES = [
+    "Agarwal", "Bhat", "Chopra", "Das", "Deshmukh", "Gupta", "Iyer", "Joshi",
+    "Khan", "Kulkarni", "Menon", "Mishra", "Nair", "Patel", "Pillai", "Rao",
+    "Reddy", "Shah", "Sharma", "Singh", "Verma", "Yadav",
+]
+CITIES = [
+    "Ahmedabad", "Bengaluru", "Bhopal", "Chennai", "Coimbatore", "Delhi",
+    "Hyderabad", "Indore", "Jaipur", "Kochi", "Kolkata", "Lucknow", "Mumbai",
+    "Mysuru", "Nagpur", "Patna", "Pune", "Ranchi", "Surat", "Vellore",
+]
+COLLEGE_PREFIXES = [
+    "Government", "National", "Sri", "Rajiv Gandhi", "Jawaharlal Nehru",
+    "Indian", "Modern", "Global", "St. Xavier's", "Birla", "Manipal", "Amity",
+]
+COLLEGE_KINDS = [
+    "Institute of Technology", "College of Engineering", "University",
+    "Arts and Science College", "Polytechnic", "Institute of Management",
+    "Medical College", "College of Pharmacy",
+]
+COMPANIES = [
+    "Infosys", "TCS", "Wipro", "HCL", "Tech Mahindra", "Google", "Microsoft",
+    "Amazon", "Flipkart", "Zoho", "Freshworks", "Swiggy", "Zomato", "Razorpay",
+    "Paytm", "Accenture", "Deloitte", "L&T", "Reliance", "ISRO",
+]
+DESIGNATIONS = [
+    "Software Engineer", "Senior Software Engineer", "Data Scientist",
+    "Product Manager", "Consultant", "Design Engineer", "Analyst",
+    "Engineering Manager", "Researcher",
+]
+TOPICS = [
+    "python", "ml", "webdev", "dsa", "robotics", "iot", "cloud", "devops",
+    "cybersecurity", "gate", "placements", "internship", "hackathon", "cricket",
+    "music", "photography", "startups", "design", "finance", "chess",
+]
+DEPARTMENTS = ["Administration", "Placement Cell", "Examinations", "Admissions"]
+# fmt: on
+
+POST_TYPES = [
+    (PostTypeEnum.TEXT, 0.55),
+    (PostTypeEnum.QUERY, 0.15),
+    (PostTypeEnum.OPPORTUNITY, 0.12),
+    (PostTypeEnum.EVENT, 0.1),
+    (PostTypeEnum.ANNOUNCEMENT, 0.08),
+]
+
+
+@dataclass(frozen=True)
+class Sizes:
+    colleges: int
+    users: int
+    students: int
+    alumni: int
+    officials: int
+    posts: int
+    comments: int
+    reactions: int
+
+    @property
+    def posters(self) -> int:
+        # every user but the admin (the last one) writes and reacts
+        return self.users - 1
+
+
+@dataclass(frozen=True)
+class Shard:
+    table: str
+    number: int
+    start: int
+    stop: int
+
+
+def _mix(value: int) -> int:
+    # splitmix64 finalizer, a bijection on 64 bits
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def row_id(table: str, n: int) -> str:
+    """
+    Id of row `n` of a table: random looking like uuid4, so indexes see the
+    same insert pattern as production, but computable from anywhere
+    """
+    key = (TABLE_CODES[table] << 48) | n
+    high = (_mix(key) & 0xFFFFFFFFFFFF0FFF) | 0x4000
+    return f"{high:016x}{(0x8 << 60) | key:016x}"
+
+
+def _unit(seed: int, salt: int, n: int) -> float:
+    return (_mix(_mix(seed ^ salt) ^ n) >> 11) / (1 << 53)
+
+
+def college_of(seed: int, sizes: Sizes, user: int) -> int:
+    """College of a user; squaring the draw gives a few large colleges and a
+    long tail of small ones"""
+    return int(sizes.colleges * _unit(seed, 0xC011E6E, user) ** 2)
+
+
+def role_of(sizes: Sizes, user: int) -> RoleEnum:
+    """Users are numbered students first, then alumni, officials, one admin"""
+    if user < sizes.students:
+        return RoleEnum.STUDENT
+    if user < sizes.students + sizes.alumni:
+        return RoleEnum.ALUMNI
+    if user < sizes.posters:
+        return RoleEnum.OFFICIALS
+    return RoleEnum.ADMIN
+
+
+def _timestamp(until: datetime, days: int, rng: random.Random) -> str:
+    return (until - timedelta(seconds=rng.random() * days * 86400)).isoformat()
+
+
+def _zipf_topic(rng: random.Random) -> str:
+    # a handful of hot topics and a long tail, so trending has a head
+    return TOPICS[min(int(rng.paretovariate(1.2)) - 1, len(TOPICS) - 1)]
+
+
+# each generator yields the rows of one shard, `rng` is private to the shard
+def _colleges(shard, sizes, seed, until, days, rng):
+    states = list(StateEnum)
+    for n in range(shard.start, shard.stop):
+        created_at = _timestamp(until, days * 3, rng)
+        yield (
+            row_id("colleges", n),
+            f"{rng.choice(COLLEGE_PREFIXES)} {rng.choice(COLLEGE_KINDS)} {n + 1}",
+            rng.random() < 0.3,
+            rng.choice(states).name,
+            rng.choice(CITIES),
+            created_at,
+            created_at,
+            False,
+        )
+
+
+def _users(shard, sizes, seed, until, days, rng, password_hash):
+    for n in range(shard.start, shard.stop):
+        created_at = _timestamp(until, days, rng)
+        seen = rng.random() < 0.6
+        yield (
+            row_id("users", n),
+            row_id("colleges", college_of(seed, sizes, n)),
+            f"user{n}@campusbridge.test",
+            password_hash,
+            f"9{n:09d}",
+            role_of(sizes, n).name,
+            _timestamp(until, 30, rng) if seen else None,
+            created_at,
+            created_at,
+            False,
+            rng.random() < 0.85,
+        )
+
+
+def _profile(table, n, user, rng, until, days, verified):
+    # review columns stay empty, a profile is either verified or in the queue
+    created_at = _timestamp(until, days, rng)
+    # shaped like an upload's URL, the file itself is never stored
+    sha256 = hashlib.sha256(str(row_id(table, n)).encode()).hexdigest()
+    return (
+        row_id(table, n),
+        row_id("users", user),
+        f"/media/id-cards/{sha256[:2]}/{sha256}.jpg",
+        verified,
+        created_at,
+        created_at,
+    )
+
+
+def _students(shard, sizes, seed, until, days, rng):
+    branches = list(BranchEnum)
+    for n in range(shard.start, shard.stop):
+        interests = rng.sample(TOPICS, rng.randint(1, 5))
+        yield (
+            *_profile("students", n, n, rng, until, days, rng.random() < 0.8),
+            row_id("colleges", college_of(seed, sizes, n)),
+            rng.choice(FIRST_NAMES),
+            rng.choice(FIRST_NAMES) if rng.random() < 0.2 else None,
+            rng.choice(LAST_NAMES) if rng.random() < 0.95 else None,
+            f"R{n:09d}",
+            rng.choice(branches).name,
+            rng.randint(1, 4),
+            json.dumps({"interests": interests}),
+        )
+
+
+def _alumni(shard, sizes, seed, until, days, rng):
+    for n in range(shard.start, shard.stop):
+        user = sizes.students + n
+        graduation_year = until.year - rng.randint(0, 20)
+        yield (
+            *_profile("alumnis", n, user, rng, until, days, rng.random() < 0.8),
+            row_id("colleges", college_of(seed, sizes, user)),
+            graduation_year,
+            rng.choice(COMPANIES),
+            rng.choice(DESIGNATIONS),
+            max(until.year - graduation_year - rng.randint(0, 1), 0),
+            json.dumps({"expertise": rng.sample(TOPICS, rng.randint(1, 4))}),
+            rng.random() < 0.7,
+        )
+
+
+def _officials(shard, sizes, seed, until, days, rng):
+    for n in range(shard.start, shard.stop):
+        user = sizes.students + sizes.alumni + n
+        yield (
+            *_profile("college_officials", n, user, rng, until, days, True),
+            rng.choice(DEPARTMENTS),
+        )
+
+
+def _posts(shard, sizes, seed, until, days, rng):
+    """Posts, with their hashtags as post_tags rows interleaved"""
+    post_types = [post_type for post_type, _ in POST_TYPES]
+    weights = [weight for _, weight in POST_TYPES]
+    for n in range(shard.start, shard.stop):
+        author = rng.randrange(sizes.posters)
+        college_id = row_id("colleges", college_of(seed, sizes, author))
+        created_at = _timestamp(until, days, rng)
+        topics = list(dict.fromkeys(_zipf_topic(rng) for _ in range(rng.randint(0, 3))))
+        content = f"Post {n} about " + " ".join(f"#{topic}" for topic in topics)
+        yield "posts", (
+            row_id("posts", n),
+            row_id("users", author),
+            college_id,
+            content,
+            rng.choices(post_types, weights)[0].name,
+            (
+                PostVisibilityEnum.COLLEGE
+                if rng.random() < 0.7
+                else PostVisibilityEnum.PUBLIC
+            ).name,
+            rng.random() < 0.01,
+            "{}",
+            created_at,
+            created_at,
+            rng.random() < 0.02,
+        )
+        # at most three tags a post, so 3n numbers the tags of post n
+        for i, topic in enumerate(topics):
+            yield "post_tags", (
+                row_id("post_tags", n * 3 + i),
+                row_id("posts", n),
+                college_id,
+                TagTypeEnum.HASHTAG.name,
+                topic,
+                created_at,
+                created_at,
+            )
+
+
+def _comments(shard, sizes, seed, until, days, rng):
+    # replies point at an earlier comment of the same shard, so a shard never
+    # waits for another one to be loaded
+    recent: list[tuple[int, int]] = []
+    for n in range(shard.start, shard.stop):
+        parent = None
+        if recent and rng.random() < 0.3:
+            parent, post = rng.choice(recent)
+        else:
+            post = rng.randrange(sizes.posts)
+            recent.append((n, post))
+            if len(recent) > 1000:
+                recent.pop(0)
+        created_at = _timestamp(until, days, rng)
+        yield (
+            row_id("comments", n),
+            row_id("posts", post),
+            row_id("users", rng.randrange(sizes.posters)),
+            row_id("comments", parent) if parent is not None else None,
+            f"Comment {n}",
+            rng.random() < 0.01,
+            created_at,
+            created_at,
+            False,
+        )
+
+
+def _reactions(shard, sizes, seed, until, days, rng):
+    reactions = list(ReactionTypeEnum)
+    for n in range(shard.start, shard.stop):
+        # reaction n is the (n // posts)-th of post n % posts, and the i-th
+        # reaction of a post comes from the i-th user after a per post offset,
+        # so (post_id, user_id) never repeats
+        post, i = n % sizes.posts, n // sizes.posts
+        user = (_mix(seed ^ post) + i) % sizes.posters
+        created_at = _timestamp(until, days, rng)
+        yield (
+            row_id("post_reactions", n),
+            row_id("posts", post),
+            row_id("users", user),
+            rng.choice(reactions).name,
+            created_at,
+            created_at,
+        )
+
+
+PROFILE_COLUMNS = [
+    "id",
+    "user_id",
+    "id_card_url",
+    "is_verified",
+    "created_at",
+    "updated_at",
+]
+TIMESTAMPS = ["created_at", "updated_at"]
+
+# table -> (columns, rows generator, row count), in foreign key order
+TABLES = {
+    "colleges": (
+        ["id", "name", "is_government", "state", "city", *TIMESTAMPS, "is_deleted"],
+        _colleges,
+        lambda sizes: sizes.colleges,
+    ),
+    "users": (
+        [
+            "id",
+            "college_id",
+            "email",
+            "password",
+            "phone",
+            "role",
+            "last_seen_at",
+            *TIMESTAMPS,
+            "is_deleted",
+            "is_verified",
+        ],
+        _users,
+        lambda sizes: sizes.users,
+    ),
+    "students": (
+        [
+            *PROFILE_COLUMNS,
+            "college_id",
+            "first_name",
+            "middle_name",
+            "last_name",
+            "roll_number",
+            "branch",
+            "year_of_study",
+            "interests",
+        ],
+        _students,
+        lambda sizes: sizes.students,
+    ),
+    "alumnis": (
+        [
+            *PROFILE_COLUMNS,
+            "college_id",
+            "graduation_year",
+            "company",
+            "designation",
+            "experience_years",
+            "expertise_areas",
+            "is_available",
+        ],
+        _alumni,
+        lambda sizes: sizes.alumni,
+    ),
+    "college_officials": (
+        [*PROFILE_COLUMNS, "department"],
+        _officials,
+        lambda sizes: sizes.officials,
+    ),
+    "posts": (
+        [
+            "id",
+            "user_id",
+            "college_id",
+            "content",
+            "post_type",
+            "visibility",
+            "is_hidden",
+            "meta_data",
+            *TIMESTAMPS,
+            "is_deleted",
+        ],
+        _posts,
+        lambda sizes: sizes.posts,
+    ),
+    "post_tags": (
+        ["id", "post_id", "college_id", "tag_type", "tag", *TIMESTAMPS],
+        None,  # written alongside posts
+        lambda sizes: sizes.posts,
+    ),
+    "comments": (
+        [
+            "id",
+            "post_id",
+            "user_id",
+            "parent_id",
+            "content",
+            "is_hidden",
+            *TIMESTAMPS,
+            "is_deleted",
+        ],
+        _comments,
+        lambda sizes: sizes.comments,
+    ),
+    "post_reactions": (
+        ["id", "post_id", "user_id", "reaction", *TIMESTAMPS],
+        _reactions,
+        lambda sizes: sizes.reactions,
+    ),
+}
+
+
+def _password_hash(password: str, seed: int) -> str:
+    from passlib.hash import bcrypt
+
+    # a salt from the seed keeps the users shards reproducible
+    alphabet = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    rng = random.Random(f"{seed}:password")
+    salt = "".join(rng.choice(alphabet) for _ in range(21)) + rng.choice(".Oeu")
+    return bcrypt.using(salt=salt, rounds=12).hash(password)
+
+
+def _bools(row):
+    return ("t" if value is True else "f" if value is False else value for value in row)
+
+
+def _write_shard(
+    out: Path, shard: Shard, sizes: Sizes, seed: int, until: str, days: int, extra
+) -> dict[str, int]:
+    """Write one shard, returns rows written per file name"""
+    columns, rows, _ = TABLES[shard.table]
+    rng = random.Random(f"{seed}:{shard.table}:{shard.number}")
+    args = (shard, sizes, seed, datetime.fromisoformat(until), days, rng, *extra)
+
+    names = [shard.table] + (["post_tags"] if shard.table == "posts" else [])
+    files = {name: out / f"{name}.{shard.number:04d}.csv" for name in names}
+    handles = {name: path.open("w", newline="") for name, path in files.items()}
+    writers = {name: csv.writer(handle) for name, handle in handles.items()}
+    counts = dict.fromkeys((path.name for path in files.values()), 0)
+    try:
+        for row in rows(*args):
+            name, row = row if shard.table == "posts" else (shard.table, row)
+            # COPY csv reads an unquoted empty field as NULL
+            writers[name].writerow(
+                "" if value is None else value for value in _bools(row)
+            )
+            counts[files[name].name] += 1
+    finally:
+        for handle in handles.values():
+            handle.close()
+    return counts
+
+
+def generate(args: argparse.Namespace) -> None:
+    students = int(args.users * args.student_share)
+    alumni = int(args.users * args.alumni_share)
+    sizes = Sizes(
+        colleges=args.colleges,
+        users=args.users,
+        students=students,
+        alumni=alumni,
+        officials=args.users - 1 - students - alumni,
+        posts=args.posts,
+        comments=args.comments,
+        reactions=args.reactions,
+    )
+    if sizes.officials < 0:
+        sys.exit("--student-share and --alumni-share leave no room for officials")
+    if sizes.reactions > sizes.posts * sizes.posters:
+        sys.exit("more reactions than (post, user) pairs")
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    until = datetime.fromisoformat(args.until).replace(tzinfo=timezone.utc)
+    password_hash = _password_hash(args.password, args.seed)
+
+    shards = [
+        Shard(table, number, start, min(start + args.shard_rows, count(sizes)))
+        for table, (_, rows, count) in TABLES.items()
+        if rows is not None
+        for number, start in enumerate(range(0, count(sizes), args.shard_rows))
+    ]
+
+    started = time.perf_counter()
+    files: dict[str, int] = {}
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [
+            pool.submit(
+                _write_shard,
+                out,
+                shard,
+                sizes,
+                args.seed,
+                until.isoformat(),
+                args.days,
+                (password_hash,) if shard.table == "users" else (),
+            )
+            for shard in shards
+        ]
+        for future in futures:
+            files.update(future.result())
+
+    manifest = {
+        "seed": args.seed,
+        "until": until.isoformat(),
+        "days": args.days,
+        "password": args.password,
+        "sizes": asdict(sizes),
+        "tables": [
+            {
+                "table": table,
+                "columns": columns,
+                "files": [
+                    {"name": name, "rows": rows}
+                    for name, rows in sorted(files.items())
+                    if name.startswith(f"{table}.")
+                ],
+            }
+            for table, (columns, _, _) in TABLES.items()
+        ],
+    }
+    (out / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update((out / name).read_bytes())
+    print(
+        f"Wrote {sum(files.values())} rows in {len(files)} files to {out} "
+        f"in {time.perf_counter() - started:.1f}s (sha256 {digest.hexdigest()[:16]})"
+    )
+
+
+def _connect():
+    import psycopg2
+    from sqlalchemy.engine.url import make_url
+
+    from campus_bridge.config.settings.app import app_settings
+
+    url = make_url(app_settings.DATABASE_URL)
+    return psycopg2.connect(
+        dbname=url.database,
+        user=url.username,
+        password=url.password,
+        host=url.host,
+        port=url.port,
+    )
+
+
+def _copy_file(path: Path, table: str, columns: list[str]) -> int:
+    conn = _connect()
+    try:
+        with conn, conn.cursor() as cursor, path.open() as handle:
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                handle,
+            )
+            return cursor.rowcount
+    finally:
+        conn.close()
+
+
+def load(args: argparse.Namespace) -> None:
+    dataset = Path(args.dataset)
+    manifest = json.loads((dataset / "manifest.json").read_text())
+    tables = manifest["tables"]
+
+    if args.truncate:
+        conn = _connect()
+        with conn, conn.cursor() as cursor:
+            names = ", ".join(table["table"] for table in tables)
+            # the stats tables are derived from the profile tables
+            cursor.execute(
+                f"TRUNCATE {names}, college_role_stats, college_student_stats, "
+                "college_alumni_stats, post_impression_counters CASCADE"
+            )
+        conn.close()
+
+    # tables one after another for the foreign keys, shards of one in parallel
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        for table in tables:
+            started = time.perf_counter()
+            loaded = sum(
+                pool.map(
+                    lambda file: _copy_file(
+                        dataset / file["name"], table["table"], table["columns"]
+                    ),
+                    table["files"],
+                )
+            )
+            elapsed = time.perf_counter() - started
+            print(
+                f"{table['table']}: {loaded} rows in {elapsed:.1f}s "
+                f"({loaded / max(elapsed, 1e-9):,.0f} rows/s)"
+            )
+
+    conn = _connect()
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="write a dataset to a directory")
+    gen.add_argument("--out", required=True)
+    gen.add_argument("--seed", type=int, default=42)
+    gen.add_argument("--colleges", type=int, default=2_000)
+    gen.add_argument("--users", type=int, default=100_000)
+    gen.add_argument("--student-share", type=float, default=0.75)
+    gen.add_argument("--alumni-share", type=float, default=0.23)
+    gen.add_argument("--posts", type=int, default=200_000)
+    gen.add_argument("--comments", type=int, default=500_000)
+    gen.add_argument("--reactions", type=int, default=1_000_000)
+    gen.add_argument(
+        "--until", default="2026-10-01", help="newest timestamp (fixed for seeding)"
+    )
+    gen.add_argument("--days", type=int, default=365, help="span of timestamps")
+    gen.add_argument("--password", default="password123", help="of every user")
+    gen.add_argument("--shard-rows", type=int, default=1_000_000)
+    gen.add_argument("--jobs", type=int, default=None, help="default: CPU count")
+    gen.set_defaults(handler=generate)
+
+    ld = commands.add_parser("load", help="COPY a dataset into DATABASE_URL")
+    ld.add_argument("--dataset", required=True)
+    ld.add_argument("--jobs", type=int, default=4, help="parallel COPYs")
+    ld.add_argument("--truncate", action="store_true", help="empty the tables first")
+    ld.set_defaults(handler=load)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
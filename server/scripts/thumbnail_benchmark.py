@@ -0,0 +1,121 @@
+"""
+Throughput of the thumbnail stage and what it costs the event loop.
+
+Stores --images synthetic ID card photos of --width x --height pixels in a
+LocalBlobStore in a temporary directory, queues them all on a started
+ThumbnailService with --processes renderer processes, and waits for the
+queue to drain. Meanwhile a ticker measures how late the event loop runs a
+--tick-ms sleep, which stays near zero as long as no resizing happens on
+the loop itself. No database is needed:
+
+    python scripts/thumbnail_benchmark.py --images 200 --processes 4
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import random
+import statistics
+import tempfile
+import time
+from io import BytesIO
+
+import structlog
+from PIL import Image
+
+from campus_bridge.core.storage import LocalBlobStore
+from campus_bridge.modules.uploads.service.thumbnail_service import ThumbnailService
+from campus_bridge.utils.thumbnails import thumbnail_key
+
+
+def _photo(rng: random.Random, width: int, height: int) -> bytes:
+    # noise compresses badly, like a photo rather than a flat test pattern
+    image = Image.frombytes("RGB", (width, height), rng.randbytes(width * height * 3))
+    output = BytesIO()
+    image.save(output, "JPEG", quality=85)
+    return output.getvalue()
+
+
+async def _ticker(tick: float, lags: list[float], done: asyncio.Event) -> None:
+    while not done.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(tick)
+        lags.append(time.perf_counter() - started - tick)
+
+
+async def main(args: argparse.Namespace) -> None:
+    # one line per failed or generated image would drown the numbers
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    rng = random.Random(args.seed)
+    # a few distinct photos, each stored under as many keys as needed
+    photos = [_photo(rng, args.width, args.height) for _ in range(8)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = LocalBlobStore(directory, "/media")
+        jobs = []
+        for n in range(args.images):
+            sha256 = hashlib.sha256(n.to_bytes(8, "big")).hexdigest()
+            key = f"id-cards/{sha256[:2]}/{sha256}.jpg"
+            await store.put(key, photos[n % len(photos)])
+            jobs.append((sha256, key))
+
+        service = ThumbnailService(
+            store,
+            sizes=args.sizes,
+            processes=args.processes,
+            queue_size=args.images,
+        )
+        service.start()
+        lags: list[float] = []
+        done = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(args.tick_ms / 1000, lags, done))
+        try:
+            started = time.perf_counter()
+            for sha256, key in jobs:
+                service.enqueue(sha256, key)
+            await service._queue.join()
+            elapsed = time.perf_counter() - started
+        finally:
+            done.set()
+            await ticker
+            await service.stop()
+
+        generated = len(
+            await store.existing(
+                [
+                    thumbnail_key(sha256, size)
+                    for sha256, _ in jobs
+                    for size in args.sizes
+                ]
+            )
+        )
+
+    lags.sort()
+    print(
+        f"{args.images} images of {args.width}x{args.height},"
+        f" sizes {args.sizes}, {args.processes} processes"
+    )
+    print(
+        f"render  {args.images / elapsed:,.1f} images/s"
+        f"  {generated} of {args.images * len(args.sizes)} thumbnails stored"
+    )
+    print(
+        f"loop    lag p50 {statistics.median(lags) * 1000:.2f}ms"
+        f"  p99 {lags[int(len(lags) * 0.99) - 1] * 1000:.2f}ms"
+        f"  max {lags[-1] * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--images", type=int, default=200)
+    parser.add_argument("--width", type=int, default=2400)
+    parser.add_argument("--height", type=int, default=1600)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[160, 640])
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--tick-ms", type=float, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main(parser.parse_args()))
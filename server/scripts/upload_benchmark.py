@@ -0,0 +1,123 @@
+"""
+Memory and latency of concurrent ID card uploads.
+
+Sends --uploads synthetic multipart uploads of --size-mb each, --concurrency
+at a time, through UploadService.upload_id_card into a LocalBlobStore in a
+temporary directory, and reports the peak RSS growth of the process. The
+bodies arrive in --chunk-kb chunks the way the ASGI server hands them over,
+so a streaming upload should hold about one chunk per request rather than
+the whole file. No database is needed:
+
+    python scripts/upload_benchmark.py --uploads 64 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import resource
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import structlog
+from fastapi import Request
+
+from campus_bridge.core.storage import LocalBlobStore
+from campus_bridge.modules.uploads.service.thumbnail_service import ThumbnailService
+from campus_bridge.modules.uploads.service.upload_service import UploadService
+
+BOUNDARY = b"benchmark-boundary"
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+def _peak_rss_mb() -> float:
+    # kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _request(index: int, size: int, chunk: bytes) -> Request:
+    head = (
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="id.png"\r\n'
+        b"Content-Type: image/png\r\n\r\n"
+        # unique leading bytes, so no upload is a duplicate of another
+        + PNG_HEADER + index.to_bytes(8, "big")
+    )
+    tail = b"\r\n--" + BOUNDARY + b"--\r\n"
+    # the same chunk object is sent over and over, so the benchmark itself
+    # holds one chunk however large the files are
+    parts = [head, *[chunk] * (size // len(chunk)), tail]
+    messages = iter(parts)
+
+    async def receive():
+        body = next(messages)
+        return {"type": "http.request", "body": body, "more_body": body is not tail}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/uploads/id-card",
+        "headers": [
+            (b"content-type", b"multipart/form-data; boundary=" + BOUNDARY),
+            (b"content-length", str(sum(map(len, parts))).encode()),
+        ],
+    }
+    return Request(scope, receive)
+
+
+async def main(args: argparse.Namespace) -> None:
+    # one info line per upload would drown the numbers
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    size = args.size_mb * 1024 * 1024
+    chunk = os.urandom(args.chunk_kb * 1024)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = LocalBlobStore(directory, "/media")
+        # never started, queued thumbnail jobs are simply left in the queue
+        thumbnails = ThumbnailService(
+            store, sizes=[128], processes=1, queue_size=args.uploads
+        )
+        service = UploadService(None, store, thumbnails, max_bytes=size * 2)
+        user = SimpleNamespace(id=uuid4())
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def upload(index: int) -> float:
+            async with semaphore:
+                started = time.perf_counter()
+                await service.upload_id_card(_request(index, size, chunk), user)
+                return time.perf_counter() - started
+
+        baseline = _peak_rss_mb()
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(upload(i) for i in range(args.uploads)))
+        elapsed = time.perf_counter() - started
+        peak = _peak_rss_mb()
+
+    latencies = sorted(latencies)
+    print(
+        f"{args.uploads} uploads of {args.size_mb}MB,"
+        f" {args.concurrency} at a time, {args.chunk_kb}KB chunks"
+    )
+    print(
+        f"upload  {args.uploads * args.size_mb / elapsed:,.0f}MB/s"
+        f"  p50 {statistics.median(latencies) * 1000:.1f}ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f}ms"
+    )
+    print(
+        f"rss     peak +{peak - baseline:.1f}MB"
+        f" (buffered uploads would hold {args.concurrency * args.size_mb}MB)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--uploads", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--size-mb", type=int, default=5)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    asyncio.run(main(parser.parse_args()))
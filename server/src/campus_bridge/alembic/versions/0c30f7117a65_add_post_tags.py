@@ -0,0 +1,75 @@
+"""Add post tags
+
+Revision ID: 0c30f7117a65
+Revises: 7216f6dab2ed
+Create Date: 2026-10-19 17:41:55.219064
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0c30f7117a65"
+down_revision: Union[str, Sequence[str], None] = "7216f6dab2ed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "post_tags",
+        sa.Column("post_id", sa.UUID(), nullable=False),
+        sa.Column("college_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "tag_type",
+            sa.Enum("HASHTAG", "MENTION", name="enum_tag_type"),
+            nullable=False,
+        ),
+        sa.Column("tag", sa.String(length=100), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["college_id"],
+            ["colleges.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["post_id"],
+            ["posts.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("post_id", "tag_type", "tag", name="uq_post_tag"),
+    )
+    op.create_index(
+        "ix_post_tags_created_at_id",
+        "post_tags",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_post_tags_post_id"), "post_tags", ["post_id"], unique=False
+    )
+    op.create_index(
+        "ix_post_tags_tag_created_at",
+        "post_tags",
+        ["tag", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_post_tags_tag_created_at", table_name="post_tags")
+    op.drop_index(op.f("ix_post_tags_post_id"), table_name="post_tags")
+    op.drop_index("ix_post_tags_created_at_id", table_name="post_tags")
+    op.drop_table("post_tags")
+    sa.Enum(name="enum_tag_type").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,130 @@
+"""Add student college id
+
+Revision ID: 3d8b0f6a2c51
+Revises: a7c93e2b4d15
+Create Date: 2026-10-19 20:47:38.116052
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d8b0f6a2c51"
+down_revision: Union[str, Sequence[str], None] = "a7c93e2b4d15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("students", sa.Column("college_id", sa.UUID(), nullable=True))
+    op.execute(
+        """
+        UPDATE students
+        SET college_id = users.college_id
+        FROM users
+        WHERE users.id = students.user_id
+        """
+    )
+    op.alter_column("students", "college_id", nullable=False)
+    op.create_foreign_key(
+        "students_college_id_fkey",
+        "students",
+        "colleges",
+        ["college_id"],
+        ["id"],
+    )
+
+    # fail with the offending rows instead of a bare unique violation, an
+    # offline (--sql) run has no rows to look at and leaves it to the index
+    duplicates = []
+    if not context.is_offline_mode():
+        duplicates = (
+            op.get_bind()
+            .execute(
+                sa.text(
+                    """
+                    SELECT college_id, roll_number, count(*)
+                    FROM students
+                    GROUP BY college_id, roll_number
+                    HAVING count(*) > 1
+                    LIMIT 20
+                    """
+                )
+            )
+            .all()
+        )
+    if duplicates:
+        raise RuntimeError(
+            "Duplicate roll numbers within a college, resolve them before "
+            f"upgrading: {[tuple(map(str, row)) for row in duplicates]}"
+        )
+
+    op.create_index(
+        "uq_students_college_id_roll_number",
+        "students",
+        ["college_id", "roll_number"],
+        unique=True,
+        postgresql_include=["id", "user_id"],
+    )
+    op.create_index(
+        "ix_students_verified_college_created_at_id",
+        "students",
+        ["college_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_verified"),
+    )
+    # keyset pages of a college's student listing by branch (and year) or year
+    op.create_index(
+        "ix_students_verified_college_branch_year_created_at_id",
+        "students",
+        ["college_id", "branch", "year_of_study", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_verified"),
+    )
+    op.create_index(
+        "ix_students_verified_college_year_created_at_id",
+        "students",
+        ["college_id", "year_of_study", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_verified"),
+    )
+    # people search prefix ranges of verified students' lowercase names
+    op.create_index(
+        "ix_students_college_first_name_prefix",
+        "students",
+        ["college_id", sa.text('lower(first_name) COLLATE "C"')],
+        unique=False,
+        postgresql_where=sa.text("is_verified"),
+    )
+    op.create_index(
+        "ix_students_college_last_name_prefix",
+        "students",
+        ["college_id", sa.text('lower(last_name) COLLATE "C"')],
+        unique=False,
+        postgresql_where=sa.text("is_verified"),
+    )
+    op.drop_index(op.f("ix_students_roll_number"), table_name="students")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_students_roll_number"), "students", ["roll_number"], unique=False
+    )
+    op.drop_index("ix_students_college_last_name_prefix", table_name="students")
+    op.drop_index("ix_students_college_first_name_prefix", table_name="students")
+    op.drop_index(
+        "ix_students_verified_college_year_created_at_id", table_name="students"
+    )
+    op.drop_index(
+        "ix_students_verified_college_branch_year_created_at_id",
+        table_name="students",
+    )
+    op.drop_index("ix_students_verified_college_created_at_id", table_name="students")
+    op.drop_index("uq_students_college_id_roll_number", table_name="students")
+    op.drop_constraint("students_college_id_fkey", "students", type_="foreignkey")
+    op.drop_column("students", "college_id")
@@ -0,0 +1,93 @@
+"""Add trending tag events
+
+Revision ID: 4f9c2e7b1d30
+Revises: e47b2a9c6d18
+Create Date: 2026-10-20 10:12:37.481920
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f9c2e7b1d30"
+down_revision: Union[str, Sequence[str], None] = "e47b2a9c6d18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "trending_tag_events",
+        sa.Column("seq", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column(
+            "txid",
+            sa.BigInteger(),
+            server_default=sa.text("(pg_current_xact_id()::text)::bigint"),
+            nullable=False,
+        ),
+        sa.Column("college_id", sa.UUID(), nullable=False),
+        sa.Column("tag", sa.String(length=100), nullable=False),
+        sa.Column("is_public", sa.Boolean(), nullable=False),
+        sa.Column("delta", sa.SmallInteger(), nullable=False),
+        sa.Column("counted_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["college_id"],
+            ["colleges.id"],
+        ),
+        sa.PrimaryKeyConstraint("seq"),
+    )
+    op.create_index(
+        "ix_trending_tag_events_txid_seq",
+        "trending_tag_events",
+        ["txid", "seq"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_trending_tag_events_created_at",
+        "trending_tag_events",
+        ["created_at"],
+        unique=False,
+    )
+
+    # hashtags of visible posts of the last week, well over the default
+    # one-day trending window
+    op.execute(
+        """
+        INSERT INTO trending_tag_events
+            (college_id, tag, is_public, delta, counted_at, created_at)
+        SELECT pt.college_id, pt.tag, p.visibility = 'PUBLIC', 1,
+               pt.created_at, pt.created_at
+        FROM post_tags pt
+        JOIN posts p ON p.id = pt.post_id
+        WHERE pt.tag_type = 'HASHTAG'
+          AND NOT p.is_hidden
+          AND NOT p.is_deleted
+          AND pt.created_at > now() - interval '7 days'
+        ORDER BY pt.created_at, pt.id
+        """
+    )
+    # the outbox replaces tailing post_tags by (created_at, id)
+    op.drop_index("ix_post_tags_created_at_id", table_name="post_tags")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_post_tags_created_at_id",
+        "post_tags",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_trending_tag_events_created_at", table_name="trending_tag_events")
+    op.drop_index("ix_trending_tag_events_txid_seq", table_name="trending_tag_events")
+    op.drop_table("trending_tag_events")
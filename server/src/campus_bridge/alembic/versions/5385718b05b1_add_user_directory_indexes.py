@@ -0,0 +1,42 @@
+"""Add user directory indexes
+
+Revision ID: 5385718b05b1
+Revises: 0c30f7117a65
+Create Date: 2026-10-19 19:08:27.663140
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5385718b05b1"
+down_revision: Union[str, Sequence[str], None] = "0c30f7117a65"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_college_role_created_at_id",
+        "users",
+        ["college_id", "role", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+    op.create_index(
+        "ix_users_college_created_at_id",
+        "users",
+        ["college_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_college_created_at_id", table_name="users")
+    op.drop_index("ix_users_college_role_created_at_id", table_name="users")
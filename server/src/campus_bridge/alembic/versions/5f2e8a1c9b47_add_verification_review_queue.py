@@ -0,0 +1,75 @@
+"""Add verification review queue
+
+Revision ID: 5f2e8a1c9b47
+Revises: 3d8b0f6a2c51
+Create Date: 2026-10-19 21:12:05.482913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f2e8a1c9b47"
+down_revision: Union[str, Sequence[str], None] = "3d8b0f6a2c51"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROFILE_TABLES = ("students", "alumnis", "college_officials")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in PROFILE_TABLES:
+        op.add_column(table, sa.Column("review_claimed_by", sa.UUID(), nullable=True))
+        op.add_column(
+            table,
+            sa.Column(
+                "review_claim_expires_at", sa.DateTime(timezone=True), nullable=True
+            ),
+        )
+        op.add_column(table, sa.Column("reviewed_by", sa.UUID(), nullable=True))
+        op.add_column(
+            table, sa.Column("reviewed_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        op.add_column(
+            table, sa.Column("rejection_reason", sa.String(length=500), nullable=True)
+        )
+
+    op.create_index(
+        "ix_students_review_queue",
+        "students",
+        ["college_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_verified AND reviewed_at IS NULL"),
+    )
+    op.create_index(
+        "ix_alumnis_review_queue",
+        "alumnis",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_verified AND reviewed_at IS NULL"),
+    )
+    op.create_index(
+        "ix_college_officials_review_queue",
+        "college_officials",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_verified AND reviewed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_college_officials_review_queue", table_name="college_officials")
+    op.drop_index("ix_alumnis_review_queue", table_name="alumnis")
+    op.drop_index("ix_students_review_queue", table_name="students")
+
+    for table in PROFILE_TABLES:
+        op.drop_column(table, "rejection_reason")
+        op.drop_column(table, "reviewed_at")
+        op.drop_column(table, "reviewed_by")
+        op.drop_column(table, "review_claim_expires_at")
+        op.drop_column(table, "review_claimed_by")
@@ -0,0 +1,36 @@
+"""Add people search prefix indexes
+
+Revision ID: 6e1a3d5c7f90
+Revises: b2f4c81d9e37
+Create Date: 2026-10-19 20:02:51.904417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6e1a3d5c7f90"
+down_revision: Union[str, Sequence[str], None] = "b2f4c81d9e37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the students name indexes lead with students.college_id, they are
+    # created by 3d8b0f6a2c51 which adds that column
+    op.create_index(
+        "ix_users_college_email_prefix",
+        "users",
+        ["college_id", sa.text('lower(email) COLLATE "C"')],
+        unique=False,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_college_email_prefix", table_name="users")
@@ -0,0 +1,182 @@
+"""Add college stats
+
+Revision ID: 8b4d2f7e1a63
+Revises: 5f2e8a1c9b47
+Create Date: 2026-10-19 21:40:52.917304
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8b4d2f7e1a63"
+down_revision: Union[str, Sequence[str], None] = "5f2e8a1c9b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# stats table -> (source table, key columns, rows of a transition table `t`
+# as (college_id, *keys, total, verified))
+STATS = {
+    "college_role_stats": (
+        "users",
+        ("role",),
+        """
+        SELECT t.college_id, t.role, 1 AS total, t.is_verified::int AS verified
+        FROM {rows} t
+        WHERE NOT t.is_deleted
+        """,
+    ),
+    "college_student_stats": (
+        "students",
+        ("branch", "year_of_study"),
+        """
+        SELECT t.college_id, t.branch, t.year_of_study,
+            1 AS total, t.is_verified::int AS verified
+        FROM {rows} t
+        """,
+    ),
+    # alumni carry no college, it is read from the user at write time
+    "college_alumni_stats": (
+        "alumnis",
+        ("graduation_year",),
+        """
+        SELECT u.college_id, t.graduation_year,
+            1 AS total, t.is_verified::int AS verified
+        FROM {rows} t
+        JOIN users u ON u.id = t.user_id
+        """,
+    ),
+}
+
+
+def _apply_deltas(stats: str, keys: tuple[str, ...], deltas: str) -> str:
+    # rows are touched in key order so concurrent writers cannot deadlock
+    columns = ", ".join(("college_id", *keys))
+    return f"""
+        INSERT INTO {stats} AS s ({columns}, total, verified)
+        SELECT {columns}, sum(total), sum(verified)
+        FROM ({deltas}) d
+        GROUP BY {columns}
+        HAVING sum(total) <> 0 OR sum(verified) <> 0
+        ORDER BY {columns}
+        ON CONFLICT ({columns}) DO UPDATE
+        SET total = s.total + EXCLUDED.total,
+            verified = s.verified + EXCLUDED.verified;
+    """
+
+
+def _negated(keys: tuple[str, ...], rows: str) -> str:
+    columns = ", ".join(("college_id", *keys))
+    return f"SELECT {columns}, -total AS total, -verified AS verified FROM ({rows}) o"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    role_enum = postgresql.ENUM(name="enum_role", create_type=False)
+    branch_enum = postgresql.ENUM(name="enum_branch", create_type=False)
+
+    op.create_table(
+        "college_role_stats",
+        sa.Column("college_id", sa.UUID(), nullable=False),
+        sa.Column("role", role_enum, nullable=False),
+        sa.Column("total", sa.BigInteger(), nullable=False),
+        sa.Column("verified", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["college_id"],
+            ["colleges.id"],
+        ),
+        sa.PrimaryKeyConstraint("college_id", "role"),
+    )
+    op.create_table(
+        "college_student_stats",
+        sa.Column("college_id", sa.UUID(), nullable=False),
+        sa.Column("branch", branch_enum, nullable=False),
+        sa.Column("year_of_study", sa.Integer(), nullable=False),
+        sa.Column("total", sa.BigInteger(), nullable=False),
+        sa.Column("verified", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["college_id"],
+            ["colleges.id"],
+        ),
+        sa.PrimaryKeyConstraint("college_id", "branch", "year_of_study"),
+    )
+    op.create_table(
+        "college_alumni_stats",
+        sa.Column("college_id", sa.UUID(), nullable=False),
+        sa.Column("graduation_year", sa.Integer(), nullable=False),
+        sa.Column("total", sa.BigInteger(), nullable=False),
+        sa.Column("verified", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["college_id"],
+            ["colleges.id"],
+        ),
+        sa.PrimaryKeyConstraint("college_id", "graduation_year"),
+    )
+
+    for stats, (source, keys, rows) in STATS.items():
+        # triggers come first and the backfill runs under a lock that keeps
+        # writers out, so no write is counted twice or missed
+        op.execute(f"LOCK TABLE {source} IN SHARE MODE")
+
+        new_rows = rows.format(rows="new_rows")
+        old_rows = _negated(keys, rows.format(rows="old_rows"))
+        on_insert = _apply_deltas(stats, keys, new_rows)
+        on_delete = _apply_deltas(stats, keys, old_rows)
+        on_update = _apply_deltas(stats, keys, f"{new_rows} UNION ALL {old_rows}")
+        op.execute(
+            f"""
+            CREATE FUNCTION {stats}_apply() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    {on_insert}
+                ELSIF TG_OP = 'DELETE' THEN
+                    {on_delete}
+                ELSE
+                    {on_update}
+                END IF;
+                RETURN NULL;
+            END;
+            $$
+            """
+        )
+        # transition tables allow one event per trigger
+        op.execute(
+            f"""
+            CREATE TRIGGER {source}_{stats}_insert AFTER INSERT ON {source}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {stats}_apply()
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER {source}_{stats}_update AFTER UPDATE ON {source}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {stats}_apply()
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER {source}_{stats}_delete AFTER DELETE ON {source}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {stats}_apply()
+            """
+        )
+
+        op.execute(_apply_deltas(stats, keys, rows.format(rows=source)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for stats, (source, _, _) in STATS.items():
+        for event in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER {source}_{stats}_{event} ON {source}")
+        op.execute(f"DROP FUNCTION {stats}_apply()")
+
+    op.drop_table("college_alumni_stats")
+    op.drop_table("college_student_stats")
+    op.drop_table("college_role_stats")
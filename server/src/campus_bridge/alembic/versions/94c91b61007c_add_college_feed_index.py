@@ -0,0 +1,36 @@
+"""Add college feed index
+
+Revision ID: 94c91b61007c
+Revises: d8d93b97e0e9
+Create Date: 2026-10-19 15:20:41.532107
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "94c91b61007c"
+down_revision: Union[str, Sequence[str], None] = "d8d93b97e0e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_posts_college_feed",
+        "posts",
+        ["college_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text(
+            "visibility = 'COLLEGE' AND is_hidden IS false AND is_deleted IS false"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_college_feed", table_name="posts")
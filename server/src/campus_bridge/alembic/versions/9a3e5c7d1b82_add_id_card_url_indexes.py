@@ -0,0 +1,34 @@
+"""Add id card url indexes
+
+Revision ID: 9a3e5c7d1b82
+Revises: 4f9c2e7b1d30
+Create Date: 2026-10-21 09:04:18.260417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a3e5c7d1b82"
+down_revision: Union[str, Sequence[str], None] = "4f9c2e7b1d30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# the media route looks up who owns a file by its URL before serving it
+TABLES = ["students", "alumnis", "college_officials"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(
+            op.f(f"ix_{table}_id_card_url"), table, ["id_card_url"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_index(op.f(f"ix_{table}_id_card_url"), table_name=table)
@@ -0,0 +1,36 @@
+"""Add student listing indexes
+
+Revision ID: a7c93e2b4d15
+Revises: 6e1a3d5c7f90
+Create Date: 2026-10-19 20:24:13.570291
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c93e2b4d15"
+down_revision: Union[str, Sequence[str], None] = "6e1a3d5c7f90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_students_verified_created_at_id",
+        "students",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_verified"),
+    )
+    # the branch and year indexes lead with students.college_id, they are
+    # created by 3d8b0f6a2c51 which adds that column
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_students_verified_created_at_id", table_name="students")
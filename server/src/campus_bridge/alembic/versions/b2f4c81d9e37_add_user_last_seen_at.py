@@ -0,0 +1,31 @@
+"""Add user last seen at
+
+Revision ID: b2f4c81d9e37
+Revises: 5385718b05b1
+Create Date: 2026-10-19 19:41:06.218734
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2f4c81d9e37"
+down_revision: Union[str, Sequence[str], None] = "5385718b05b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "last_seen_at")
@@ -0,0 +1,124 @@
+"""Add alumni college id
+
+Revision ID: c61f3a9d8e24
+Revises: 8b4d2f7e1a63
+Create Date: 2026-10-19 22:08:31.640178
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c61f3a9d8e24"
+down_revision: Union[str, Sequence[str], None] = "8b4d2f7e1a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# the alumni stats trigger of 8b4d2f7e1a63, counting alumni under `{college}`
+ALUMNI_ROWS = """
+    SELECT {college} AS college_id, t.graduation_year,
+        {sign} AS total, {sign} * t.is_verified::int AS verified
+    FROM {rows} t {join}
+"""
+ALUMNI_DELTAS = """
+    INSERT INTO college_alumni_stats AS s
+        (college_id, graduation_year, total, verified)
+    SELECT college_id, graduation_year, sum(total), sum(verified)
+    FROM ({deltas}) d
+    GROUP BY college_id, graduation_year
+    HAVING sum(total) <> 0 OR sum(verified) <> 0
+    ORDER BY college_id, graduation_year
+    ON CONFLICT (college_id, graduation_year) DO UPDATE
+    SET total = s.total + EXCLUDED.total,
+        verified = s.verified + EXCLUDED.verified;
+"""
+
+
+def _alumni_stats_apply(college: str, join: str = "") -> str:
+    new_rows = ALUMNI_ROWS.format(college=college, sign=1, rows="new_rows", join=join)
+    old_rows = ALUMNI_ROWS.format(college=college, sign=-1, rows="old_rows", join=join)
+    on_insert = ALUMNI_DELTAS.format(deltas=new_rows)
+    on_delete = ALUMNI_DELTAS.format(deltas=old_rows)
+    on_update = ALUMNI_DELTAS.format(deltas=f"{new_rows} UNION ALL {old_rows}")
+    return f"""
+        CREATE OR REPLACE FUNCTION college_alumni_stats_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {on_insert}
+            ELSIF TG_OP = 'DELETE' THEN
+                {on_delete}
+            ELSE
+                {on_update}
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("alumnis", sa.Column("college_id", sa.UUID(), nullable=True))
+    op.execute(
+        """
+        UPDATE alumnis
+        SET college_id = users.college_id
+        FROM users
+        WHERE users.id = alumnis.user_id
+        """
+    )
+    op.alter_column("alumnis", "college_id", nullable=False)
+    op.create_foreign_key(
+        "alumnis_college_id_fkey",
+        "alumnis",
+        "colleges",
+        ["college_id"],
+        ["id"],
+    )
+
+    op.create_index(
+        "ix_alumnis_college_created_at_id",
+        "alumnis",
+        ["college_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_alumnis_college_company_created_at_id",
+        "alumnis",
+        ["college_id", "company", "created_at", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_alumnis_review_queue", table_name="alumnis")
+    op.create_index(
+        "ix_alumnis_review_queue",
+        "alumnis",
+        ["college_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_verified AND reviewed_at IS NULL"),
+    )
+
+    # alumni stats now follow the alumni's own college
+    op.execute(_alumni_stats_apply("t.college_id"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        _alumni_stats_apply("u.college_id", join="JOIN users u ON u.id = t.user_id")
+    )
+    op.drop_index("ix_alumnis_review_queue", table_name="alumnis")
+    op.create_index(
+        "ix_alumnis_review_queue",
+        "alumnis",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_verified AND reviewed_at IS NULL"),
+    )
+    op.drop_index("ix_alumnis_college_company_created_at_id", table_name="alumnis")
+    op.drop_index("ix_alumnis_college_created_at_id", table_name="alumnis")
+    op.drop_constraint("alumnis_college_id_fkey", "alumnis", type_="foreignkey")
+    op.drop_column("alumnis", "college_id")
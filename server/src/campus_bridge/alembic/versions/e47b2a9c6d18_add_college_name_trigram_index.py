@@ -0,0 +1,36 @@
+"""Add college name trigram index
+
+Revision ID: e47b2a9c6d18
+Revises: c61f3a9d8e24
+Create Date: 2026-10-19 22:31:07.482615
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e47b2a9c6d18"
+down_revision: Union[str, Sequence[str], None] = "c61f3a9d8e24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_colleges_name_trgm",
+        "colleges",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_colleges_name_trgm", table_name="colleges")
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from campus_bridge.api.v1.middleware import RequestContextMiddleware
 from campus_bridge.api.v1.routes import add_application_routes
 from campus_bridge.config.lifespan import lifespan
 from campus_bridge.config.settings import settings
@@ -13,6 +14,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID", "Server-Timing"],
 )
+# outermost, so the request id and SQL stats cover everything below
+app.add_middleware(RequestContextMiddleware)
 
 add_application_routes(app)
@@ -1,5 +1,8 @@
+from typing import Optional
+from uuid import UUID
+
 import structlog
-from fastapi import Depends
+from fastapi import Depends, Query
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,6 +11,7 @@ from campus_bridge.data.database.session import get_async_session
 from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.models.user import User
 from campus_bridge.errors.exc import UnAuthenticatedError, UnauthorizedError
+from campus_bridge.modules.users.service.presence_tracker import presence_tracker
 from campus_bridge.modules.users.service.user_service import (
     UserService,
     get_user_service,
@@ -38,6 +42,7 @@ async def get_current_user(
 
     # fetch user via service
     user = await user_service.get_user_by_id(user_id=user_id)
+    presence_tracker.touch(user.id, user.college_id)
     return user
 
 
@@ -66,3 +71,42 @@ async def require_admin_or_officials_or_alumni(
         )
 
     return current_user
+
+
+async def get_export_college_id(
+    college_id: Optional[UUID] = Query(
+        None, description="College to export, every college when omitted (admin)"
+    ),
+    current_user: User = Depends(get_current_user),
+) -> UUID | None:
+    """Dependency to resolve which college a directory export may cover"""
+    if current_user.role == RoleEnum.ADMIN:
+        return college_id
+
+    if current_user.role != RoleEnum.OFFICIALS:
+        logger.warning("Directory export denied", user_id=str(current_user.id))
+        raise UnauthorizedError(obj="directory export", act="access")
+
+    # officials only ever export their own college
+    if college_id and college_id != current_user.college_id:
+        raise UnauthorizedError(obj="directory export", act="export_other_college")
+    return current_user.college_id
+
+
+async def get_roster_college_id(
+    college_id: Optional[UUID] = Query(
+        None, description="College to look in, defaults to your own (admin only)"
+    ),
+    current_user: User = Depends(get_current_user),
+) -> UUID:
+    """Dependency to resolve whose college roster the current user may read"""
+    if current_user.role == RoleEnum.ADMIN:
+        return college_id or current_user.college_id
+
+    if current_user.role != RoleEnum.OFFICIALS:
+        logger.warning("Roster access denied", user_id=str(current_user.id))
+        raise UnauthorizedError(obj="college roster", act="access")
+
+    if college_id and college_id != current_user.college_id:
+        raise UnauthorizedError(obj="college roster", act="read_other_college")
+    return current_user.college_id
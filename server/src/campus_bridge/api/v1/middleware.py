@@ -0,0 +1,74 @@
+import re
+import time
+from uuid import uuid4
+
+import structlog
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.instrumentation import track_queries
+
+logger = structlog.stdlib.get_logger(__name__)
+
+_REQUEST_ID = re.compile(r"[\w.:-]{1,64}")
+
+
+class RequestContextMiddleware:
+    """
+    Give every request an id, bound to its log lines through structlog's
+    contextvars and echoed as X-Request-ID (a well formed incoming one is
+    kept), and record the SQL it runs.
+
+    The statement count, database time and slowest statements are logged
+    when the response is complete, so streamed responses are covered too;
+    with SQL_STATS_RESPONSE_HEADERS they are also sent as a Server-Timing
+    header, as of when the response started.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id", "")
+        if not _REQUEST_ID.fullmatch(request_id):
+            request_id = uuid4().hex
+
+        started = time.perf_counter()
+        status_code = 500
+
+        with (
+            structlog.contextvars.bound_contextvars(request_id=request_id),
+            track_queries() as stats,
+        ):
+
+            async def send_with_headers(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Request-ID"] = request_id
+                    if settings.SQL_STATS_RESPONSE_HEADERS:
+                        headers.append(
+                            "Server-Timing",
+                            f"db;dur={stats.seconds * 1000:.2f}"
+                            f';desc="{stats.count} statements"',
+                        )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                if stats.count:
+                    logger.info(
+                        "request_sql",
+                        method=scope["method"],
+                        path=scope["path"],
+                        status_code=status_code,
+                        duration_ms=round((time.perf_counter() - started) * 1000, 2),
+                        **stats.log_fields(),
+                    )
@@ -1,23 +1,37 @@
 from fastapi import APIRouter, Depends, FastAPI
 
 from campus_bridge.api.v1.dependencies import get_current_user
+from campus_bridge.config.settings import settings
 
 # Import all module routers
+from campus_bridge.modules.alumni.router.alumni_router import router as alumni_router
 from campus_bridge.modules.auth.router.auth import router as auth_router
+from campus_bridge.modules.college.router.college_router import (
+    public_router as college_public_router,
+)
 from campus_bridge.modules.college.router.college_router import router as college_router
 from campus_bridge.modules.feed.router.feed_router import router as feed_router
+from campus_bridge.modules.search.router.search_router import router as search_router
 from campus_bridge.modules.student.router.student_router import router as student_router
+from campus_bridge.modules.uploads.router.upload_router import (
+    media_router as upload_media_router,
+)
+from campus_bridge.modules.uploads.router.upload_router import router as upload_router
 from campus_bridge.modules.users.router.user_router import router as user_router
+from campus_bridge.modules.verification.router.verification_router import (
+    router as verification_router,
+)
 
 from .health_check import router as health_check_router
 
-# Health check router (no auth required)
+# Health check router (no auth required, except the admin-only pool metrics)
 _health_router = APIRouter()
 _health_router.include_router(health_check_router)
 
 # Public router - endpoints that don't require authentication (e.g., auth)
 _public_router = APIRouter()
 _public_router.include_router(auth_router)
+_public_router.include_router(college_public_router)
 
 # Private router - endpoints that require authentication
 # All routes under this router automatically require get_current_user
@@ -26,6 +40,17 @@ _private_router.include_router(college_router)
 _private_router.include_router(feed_router)
 _private_router.include_router(user_router)
 _private_router.include_router(student_router)
+_private_router.include_router(alumni_router)
+_private_router.include_router(search_router)
+_private_router.include_router(upload_router)
+_private_router.include_router(verification_router)
+
+# Uploaded files, served at the local path their stored URLs point to
+_media_router = APIRouter(
+    prefix=settings.UPLOAD_BASE_URL.rstrip("/"),
+    dependencies=[Depends(get_current_user)],
+)
+_media_router.include_router(upload_media_router)
 
 # Main API router with /api/v1 prefix
 _api_router = APIRouter(prefix="/api/v1")
@@ -37,6 +62,9 @@ def add_application_routes(app: FastAPI):
     """Register all application routes"""
     app.include_router(_health_router)
     app.include_router(_api_router)
+    # an absolute UPLOAD_BASE_URL points at a server of its own
+    if settings.UPLOAD_BASE_URL.startswith("/"):
+        app.include_router(_media_router)
 
 
 __all__ = ["add_application_routes"]
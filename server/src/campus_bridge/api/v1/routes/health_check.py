@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from campus_bridge.api.v1.dependencies import require_admin
+from campus_bridge.data.database.pool import pool_metrics
 
 router = APIRouter(tags=["Internal"])
 
@@ -6,3 +9,10 @@ router = APIRouter(tags=["Internal"])
 @router.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+# pool sizes and waits describe the deployment, admins only
+@router.get("/health/db-pool", dependencies=[Depends(require_admin)])
+async def db_pool():
+    """Connection pool occupancy and checkout waits of the answering worker"""
+    return pool_metrics.snapshot()
@@ -3,11 +3,38 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi_injectable import setup_graceful_shutdown
 
+from campus_bridge.core.security import shutdown_password_hashing
+from campus_bridge.data.database.slow_queries import slow_query_explainer
+from campus_bridge.modules.college.service.college_catalog import college_catalog
+from campus_bridge.modules.college.service.stats_reconciler import (
+    college_stats_reconciler,
+)
+from campus_bridge.modules.feed.service.impression_tracker import impression_tracker
+from campus_bridge.modules.feed.service.trending_tracker import trending_tracker
+from campus_bridge.modules.uploads.service.thumbnail_service import thumbnail_service
+from campus_bridge.modules.users.service.presence_tracker import presence_tracker
+
 from .logging import initialize_logging
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     initialize_logging()
+    slow_query_explainer.start()
+    impression_tracker.start()
+    trending_tracker.start()
+    thumbnail_service.start()
+    presence_tracker.start()
+    college_stats_reconciler.start()
+    college_catalog.start()
     yield
+    await college_catalog.stop()
+    await college_stats_reconciler.stop()
+    await presence_tracker.stop()
+    await thumbnail_service.stop()
+    await trending_tracker.stop()
+    # flush buffered impressions before the worker goes away
+    await impression_tracker.stop()
+    await slow_query_explainer.stop()
+    shutdown_password_hashing()
     setup_graceful_shutdown()
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 from pathlib import Path
 
@@ -17,6 +18,41 @@ class AppSettings(BaseSettings):
     DATABASE_URL: str = Field(...)
     ALLOW_ORIGINS: str = Field(...)
 
+    # connection pool, per worker
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 30.0
+    DATABASE_POOL_RECYCLE_SECONDS: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_POOL_USE_LIFO: bool = False
+    # asyncpg
+    DATABASE_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    DATABASE_COMMAND_TIMEOUT_SECONDS: float | None = None
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # behind PgBouncer in transaction mode: no server side statement caching
+    # and unique prepared statement names, overriding the two cache sizes
+    DATABASE_PGBOUNCER_TRANSACTION_MODE: bool = False
+    # per request statement counts and timings, logged at the end of every
+    # request and optionally sent back in a Server-Timing header
+    SQL_STATS_RESPONSE_HEADERS: bool = False
+    SQL_STATS_SLOWEST: int = 3
+    # outside production, warn (or raise) when one statement runs more than
+    # this many times in a request; 0 turns the N+1 check off
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 10
+    SQL_REPEATED_STATEMENT_RAISE: bool = False
+    # statements slower than this are logged with their shape; 0 turns it off
+    SQL_SLOW_QUERY_THRESHOLD_MS: float = 500.0
+    # fraction of slow SELECTs replayed under EXPLAIN (ANALYZE, BUFFERS) on a
+    # side connection, at most once per statement every interval; 0 turns
+    # it off. Plans go to a rotating JSON lines file.
+    SQL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.05
+    SQL_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS: float = 300.0
+    SQL_SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS: float = 30.0
+    SQL_SLOW_QUERY_PLAN_LOG_FILE: str = "logs/slow_query_plans.log"
+    SQL_SLOW_QUERY_PLAN_LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    SQL_SLOW_QUERY_PLAN_LOG_BACKUPS: int = 5
+
     ENVIRONMENT: Environments = Environments.development
     LOG_LEVEL: LogLevel = LogLevel.INFO
 
@@ -24,6 +60,61 @@ class AppSettings(BaseSettings):
     SECRET_KEY: str = Field(...)
     EXPIRES_MINUTES: int = Field(...)
 
+    FEED_NEW_POSTS_COUNT_CAP: int = 50
+    FEED_HEAD_COUNTER_TTL_SECONDS: int = 30
+
+    IMPRESSION_FLUSH_INTERVAL_SECONDS: float = 5.0
+    IMPRESSION_FLUSH_MAX_PENDING: int = 5000
+    # while the database is down: retry backoff and the most posts kept
+    IMPRESSION_FLUSH_MAX_BACKOFF_SECONDS: float = 60.0
+    IMPRESSION_MAX_BUFFERED_POSTS: int = 100_000
+
+    TRENDING_BUCKET_SECONDS: int = 3600
+    TRENDING_BUCKETS: int = 24
+    TRENDING_TOP_K: int = 20
+    TRENDING_SYNC_INTERVAL_SECONDS: float = 10.0
+
+    UPLOAD_STORAGE_DIR: str = "media"
+    UPLOAD_BASE_URL: str = "/media"
+    UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+
+    THUMBNAIL_SIZES: list[int] = [160, 640]
+    THUMBNAIL_PROCESSES: int = 2
+    THUMBNAIL_QUEUE_SIZE: int = 1000
+
+    DIRECTORY_COUNT_CAP: int = 10000
+
+    ALUMNI_FACET_TTL_SECONDS: int = 300
+    ALUMNI_FACET_TOP_COMPANIES: int = 10
+
+    PASSWORD_HASH_PROCESSES: int = Field(default_factory=lambda: os.cpu_count() or 1)
+    STUDENT_IMPORT_CHUNK_SIZE: int = 1000
+    STUDENT_IMPORT_MAX_ERRORS: int = 1000
+
+    EXPORT_BATCH_SIZE: int = 5000
+
+    PRESENCE_FLUSH_INTERVAL_SECONDS: float = 30.0
+    PRESENCE_ONLINE_WINDOW_SECONDS: int = 300
+
+    PEOPLE_INDEX_MAX_COLLEGES: int = 64
+    PEOPLE_INDEX_MAX_PROFILES: int = 100000
+    PEOPLE_INDEX_TTL_SECONDS: int = 300
+
+    INTEREST_MATCH_MAX_COLLEGES: int = 32
+    INTEREST_MATCH_TTL_SECONDS: int = 600
+    INTEREST_MATCH_TOP_K: int = 50
+
+    MENTOR_MATCH_MAX_COLLEGES: int = 32
+    MENTOR_MATCH_TTL_SECONDS: int = 600
+    MENTOR_MATCH_TOP_K: int = 50
+
+    VERIFICATION_LEASE_SECONDS: int = 600
+
+    COLLEGE_STATS_RECONCILE_INTERVAL_SECONDS: float = 3600.0
+    COLLEGE_CATALOG_REFRESH_INTERVAL_SECONDS: float = 5.0
+    COLLEGE_IMPORT_CHUNK_SIZE: int = 1000
+    COLLEGE_IMPORT_MAX_ERRORS: int = 1000
+
     @property
     def allowed_origins(self):
         return [x.strip() for x in self.ALLOW_ORIGINS.split(",") if x.strip()]
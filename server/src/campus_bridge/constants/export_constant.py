@@ -0,0 +1,6 @@
+# export format constant
+
+CSV = "csv"
+PARQUET = "parquet"
+
+ALL_EXPORT_FORMAT = (CSV, PARQUET)
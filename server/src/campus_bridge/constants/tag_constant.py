@@ -0,0 +1,6 @@
+# post tag constant
+
+HASHTAG = "HASHTAG"
+MENTION = "MENTION"
+
+ALL_TAG_TYPE = (HASHTAG, MENTION)
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
 from jose import ExpiredSignatureError, JWTError, jwt
@@ -13,12 +15,48 @@ SECRET_KEY = app_settings.SECRET_KEY
 EXPIRES_MINUTES = app_settings.EXPIRES_MINUTES
 APP_NAME = app_settings.APP_NAME
 
+# bcrypt is CPU bound by design, bulk hashing runs on its own processes
+_hash_pool: ProcessPoolExecutor | None = None
+
 
 def hash_password(password: str) -> str:
     """Hashing password"""
     return pwd_context.hash(password)
 
 
+def _hash_passwords(passwords: list[str]) -> list[str]:
+    return [hash_password(password) for password in passwords]
+
+
+async def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash many passwords in parallel on the password hashing process pool"""
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=app_settings.PASSWORD_HASH_PROCESSES
+        )
+
+    # one slice per process, a task per password would mostly measure pickling
+    workers = app_settings.PASSWORD_HASH_PROCESSES
+    size = -(-len(passwords) // workers) or 1
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(_hash_pool, _hash_passwords, passwords[i : i + size])
+            for i in range(0, len(passwords), size)
+        )
+    )
+    return [hashed for chunk in results for hashed in chunk]
+
+
+def shutdown_password_hashing() -> None:
+    """Stop the password hashing process pool (called from lifespan)"""
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
 def verify_password(password: str, hashed_password: str) -> bool:
     """Verify the actual password with the hashed password"""
     return pwd_context.verify(password, hashed_password)
@@ -0,0 +1,140 @@
+import asyncio
+import os
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+
+from campus_bridge.config.settings import settings
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class BlobWriter(ABC):
+    """A blob being written chunk by chunk, invisible until committed"""
+
+    @abstractmethod
+    async def write(self, data: bytes) -> None: ...
+
+    @abstractmethod
+    async def commit(self, key: str) -> None:
+        """Publish the written bytes under `key`"""
+
+    @abstractmethod
+    async def abort(self) -> None:
+        """Throw the written bytes away"""
+
+
+class BlobStore(ABC):
+    """Where uploaded files live, addressed by a relative key"""
+
+    @abstractmethod
+    async def open_writer(self) -> BlobWriter: ...
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool: ...
+
+    @abstractmethod
+    async def existing(self, keys: list[str]) -> set[str]:
+        """Those of `keys` that are stored, in one go"""
+
+    @abstractmethod
+    async def read(self, key: str) -> bytes: ...
+
+    @abstractmethod
+    def read_chunks(self, key: str) -> AsyncIterator[bytes]:
+        """Read a blob piece by piece, for streaming it back"""
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes) -> None:
+        """Store a small blob in one go"""
+
+    @abstractmethod
+    def url_for(self, key: str) -> str: ...
+
+
+class _LocalBlobWriter(BlobWriter):
+    def __init__(self, root: Path, tmp_path: Path, file: BinaryIO):
+        self.root = root
+        self.tmp_path = tmp_path
+        self.file = file
+
+    async def write(self, data: bytes) -> None:
+        await asyncio.to_thread(self.file.write, data)
+
+    async def commit(self, key: str) -> None:
+        def _commit():
+            self.file.close()
+            target = self.root / key
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self.tmp_path, target)
+
+        await asyncio.to_thread(_commit)
+
+    async def abort(self) -> None:
+        def _abort():
+            self.file.close()
+            self.tmp_path.unlink(missing_ok=True)
+
+        await asyncio.to_thread(_abort)
+
+
+class LocalBlobStore(BlobStore):
+    """Blob store on the local filesystem, served under `base_url`"""
+
+    def __init__(self, root: str | Path, base_url: str):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    async def open_writer(self) -> BlobWriter:
+        # temporary files live next to the blobs so commit is a same-disk rename
+        tmp_dir = self.root / ".tmp"
+        tmp_path = tmp_dir / f"{uuid.uuid4().hex}.part"
+
+        def _open():
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            return open(tmp_path, "wb")
+
+        return _LocalBlobWriter(self.root, tmp_path, await asyncio.to_thread(_open))
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread((self.root / key).is_file)
+
+    async def existing(self, keys: list[str]) -> set[str]:
+        if not keys:
+            return set()
+        return await asyncio.to_thread(
+            lambda: {key for key in keys if (self.root / key).is_file()}
+        )
+
+    async def read(self, key: str) -> bytes:
+        return await asyncio.to_thread((self.root / key).read_bytes)
+
+    async def read_chunks(self, key: str) -> AsyncIterator[bytes]:
+        file = await asyncio.to_thread(open, self.root / key, "rb")
+        try:
+            while chunk := await asyncio.to_thread(file.read, READ_CHUNK_BYTES):
+                yield chunk
+        finally:
+            file.close()
+
+    async def put(self, key: str, data: bytes) -> None:
+        writer = await self.open_writer()
+        try:
+            await writer.write(data)
+            await writer.commit(key)
+        except BaseException:
+            await writer.abort()
+            raise
+
+    def url_for(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+
+blob_store: BlobStore = LocalBlobStore(
+    root=settings.UPLOAD_STORAGE_DIR, base_url=settings.UPLOAD_BASE_URL
+)
+
+
+def get_blob_store() -> BlobStore:
+    return blob_store
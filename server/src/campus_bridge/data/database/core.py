@@ -1,8 +1,45 @@
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from campus_bridge.config.settings import settings
+from campus_bridge.data.database.instrumentation import instrument_engine
+from campus_bridge.data.database.pool import MeteredQueuePool
+
+
+def engine_options() -> dict:
+    """create_async_engine arguments for the pool and asyncpg settings"""
+    connect_args = {
+        "timeout": settings.DATABASE_CONNECT_TIMEOUT_SECONDS,
+        "command_timeout": settings.DATABASE_COMMAND_TIMEOUT_SECONDS,
+        "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DATABASE_PREPARED_STATEMENT_CACHE_SIZE,
+        "server_settings": {"application_name": settings.APP_NAME},
+    }
+    if settings.DATABASE_PGBOUNCER_TRANSACTION_MODE:
+        # consecutive transactions may land on different server connections,
+        # so a statement prepared in one must never be looked up in another
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+
+    return {
+        "echo": False,
+        "poolclass": MeteredQueuePool,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "pool_use_lifo": settings.DATABASE_POOL_USE_LIFO,
+        "connect_args": connect_args,
+    }
+
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+engine = create_async_engine(settings.DATABASE_URL, **engine_options())
+instrument_engine(engine.sync_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -0,0 +1,182 @@
+import heapq
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from campus_bridge.config.settings import settings
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# a run of two or more bind parameters, e.g. an expanded IN list
+_PARAM_LIST = re.compile(r"\$\d+(?:::[^,)]+)?(?:, \$\d+(?:::[^,)]+)?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class RepeatedStatementError(RuntimeError):
+    """One statement ran more often in a request than the N+1 threshold"""
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    The shape of a statement: whitespace collapsed and every list of bind
+    parameters folded into one, so IN lists of any length look alike.
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PARAM_LIST.sub("$…", statement)
+
+
+class QueryStats:
+    """SQL statements run on behalf of one request"""
+
+    def __init__(self, slowest: int, repeat_threshold: int):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter[str] = Counter()
+        # min-heap of (seconds, statement), the `slowest` longest ones
+        self.slowest: list[tuple[float, str]] = []
+        self._keep = slowest
+        self._repeat_threshold = repeat_threshold
+
+    def started(self, statement: str) -> str:
+        shape = normalize_statement(statement)
+        self.shapes[shape] += 1
+        if self._repeat_threshold and self.shapes[shape] == self._repeat_threshold + 1:
+            self._repeated(shape)
+        return shape
+
+    def finished(self, shape: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if len(self.slowest) < self._keep:
+            heapq.heappush(self.slowest, (seconds, shape))
+        elif self.slowest and seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (seconds, shape))
+
+    def _repeated(self, shape: str) -> None:
+        # reported once per statement, when it first goes over
+        if settings.SQL_REPEATED_STATEMENT_RAISE:
+            raise RepeatedStatementError(
+                f"statement ran more than {self._repeat_threshold} times "
+                f"in one request: {shape}"
+            )
+        logger.warning(
+            "sql_repeated_statement",
+            threshold=self._repeat_threshold,
+            statement=shape,
+        )
+
+    def log_fields(self) -> dict:
+        return {
+            "sql_statements": self.count,
+            "sql_ms": round(self.seconds * 1000, 2),
+            "sql_slowest": [
+                {"ms": round(seconds * 1000, 2), "statement": shape[:500]}
+                for seconds, shape in sorted(self.slowest, reverse=True)
+            ],
+        }
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("sql_query_stats", default=None)
+
+# (statement, shape, parameters, executemany, seconds), run inline: must not block
+SlowStatementHook = Callable[[str, str, Any, bool, float], None]
+_slow_statement_hooks: list[SlowStatementHook] = []
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record the statements run in this context, e.g. one request"""
+    stats = QueryStats(
+        slowest=settings.SQL_STATS_SLOWEST,
+        # N+1 detection is a development aid
+        repeat_threshold=(
+            0 if settings.is_production else settings.SQL_REPEATED_STATEMENT_THRESHOLD
+        ),
+    )
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def parameter_shape(parameters: Any, executemany: bool) -> list | dict | str:
+    """Types of a statement's parameters, never their values"""
+    if executemany:
+        return f"{len(parameters)} rows"
+    if isinstance(parameters, dict):
+        return {name: _value_type(value) for name, value in parameters.items()}
+    return [_value_type(value) for value in parameters or ()]
+
+
+def _value_type(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def on_slow_statement(hook: SlowStatementHook) -> None:
+    """Call `hook` with every statement over SQL_SLOW_QUERY_THRESHOLD_MS"""
+    _slow_statement_hooks.append(hook)
+
+
+def remove_slow_statement_hook(hook: SlowStatementHook) -> None:
+    _slow_statement_hooks.remove(hook)
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    stats = _current.get()
+    shape = stats.started(statement) if stats is not None else None
+    # statements on one connection run one at a time
+    conn.info["sql_started"] = (shape, time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    started = conn.info.pop("sql_started", None)
+    if started is None:
+        return
+    shape, at = started
+    seconds = time.perf_counter() - at
+
+    stats = _current.get()
+    if stats is not None and shape is not None:
+        stats.finished(shape, seconds)
+
+    threshold_ms = settings.SQL_SLOW_QUERY_THRESHOLD_MS
+    if threshold_ms and seconds * 1000 >= threshold_ms:
+        shape = shape or normalize_statement(statement)
+        logger.warning(
+            "sql_slow_query",
+            duration_ms=round(seconds * 1000, 2),
+            statement=shape[:2000],
+            parameters=parameter_shape(parameters, executemany),
+        )
+        for hook in _slow_statement_hooks:
+            hook(statement, shape, parameters, executemany, seconds)
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None:
+        conn.info.pop("sql_started", None)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time the engine's statements, into the current QueryStats inside a
+    request, and log the slow ones wherever they run
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
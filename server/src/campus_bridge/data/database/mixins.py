@@ -36,8 +36,27 @@ class SoftDeleteMixin:
 
 
 class UserIdCard:
-    id_card_url: Mapped[str] = mapped_column(String(500), nullable=False)
+    # indexed to find the owner of an uploaded file before serving it
+    id_card_url: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
 
 
 class VerifyAccount:
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+
+class VerificationReview:
+    # lease of the reviewer currently holding the profile in the review queue
+    review_claimed_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    review_claim_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # outcome, a rejected profile keeps is_verified false with a reason
+    reviewed_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    reviewed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    rejection_reason: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -0,0 +1,109 @@
+import os
+import time
+from bisect import bisect_left
+
+import structlog
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class WaitHistogram:
+    """Fixed-bucket histogram of checkout waits, Prometheus style"""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self) -> dict:
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {
+            "buckets": buckets,
+            "count": cumulative,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+        }
+
+
+class PoolMetrics:
+    """
+    Per-worker counters of the engine's connection pool.
+
+    Occupancy is read live from the pool; waits, timeouts, new connections
+    and invalidations are counted since the worker started.
+    """
+
+    def __init__(self):
+        self.pool: AsyncAdaptedQueuePool | None = None
+        self.wait = WaitHistogram(WAIT_BUCKETS)
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+
+    def snapshot(self) -> dict:
+        pool = self.pool
+        return {
+            "worker_pid": os.getpid(),
+            "size": pool.size() if pool else 0,
+            "checked_out": pool.checkedout() if pool else 0,
+            "checked_in": pool.checkedin() if pool else 0,
+            # negative while the pool holds fewer than `size` connections
+            "overflow": pool.overflow() if pool else 0,
+            "checkout_wait_seconds": self.wait.snapshot(),
+            "timeouts": self.timeouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """The asyncio queue pool, timing every checkout into `pool_metrics`"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # dispose() swaps in a fresh pool of the same class
+        pool_metrics.pool = self
+        event.listen(self, "connect", _on_connect)
+        event.listen(self, "invalidate", _on_invalidate)
+
+    def connect(self):
+        # the wait for a free slot, plus opening or pinging the connection
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            logger.warning(
+                "db_pool_checkout_timeout",
+                size=self.size(),
+                checked_out=self.checkedout(),
+                overflow=self.overflow(),
+            )
+            raise
+        finally:
+            pool_metrics.wait.observe(time.perf_counter() - started)
+
+
+def _on_connect(dbapi_connection, connection_record) -> None:
+    pool_metrics.connects += 1
+
+
+def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+    pool_metrics.invalidations += 1
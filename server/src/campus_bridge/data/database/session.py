@@ -1,19 +1,95 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable
 
 import structlog
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
 
-from campus_bridge.data.database.core import AsyncSessionLocal
+from campus_bridge.data.database.core import AsyncSessionLocal, engine
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# endpoint attribute set by `read_only`
+_READ_ONLY_ATTR = "__read_only_session__"
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency to get async database session"""
-    async with AsyncSessionLocal() as session:
+_read_only_engines = {
+    # every statement is its own implicit transaction, no BEGIN or COMMIT
+    "statement": engine.execution_options(isolation_level="AUTOCOMMIT"),
+    # one BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY for the request
+    "snapshot": engine.execution_options(
+        isolation_level="REPEATABLE READ", postgresql_readonly=True
+    ),
+}
+
+
+def read_only(snapshot: bool = False) -> Callable:
+    """
+    Mark an endpoint read-only, placed below its route decorator.
+
+    Its request session, including the one resolving the current user, runs
+    every statement in autocommit: at READ COMMITTED each statement takes its
+    own snapshot anyway, so only the BEGIN and COMMIT round trips are lost.
+    With `snapshot` the statements share one REPEATABLE READ READ ONLY
+    transaction instead, for endpoints whose queries must agree. Either way
+    the session refuses to write.
+    """
+
+    def mark(endpoint: Callable) -> Callable:
+        setattr(endpoint, _READ_ONLY_ATTR, "snapshot" if snapshot else "statement")
+        return endpoint
+
+    return mark
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_execute(state: ORMExecuteState) -> None:
+    if state.is_select:
+        return
+    if state.session.info.get("read_only"):
+        raise InvalidRequestError("Write statement in a read-only session")
+    state.session.info["wrote"] = True
+
+
+@event.listens_for(Session, "before_flush")
+def _on_flush(session: Session, flush_context, instances) -> None:
+    if session.info.get("read_only"):
+        raise InvalidRequestError("Flush in a read-only session")
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _on_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    # a repository that committed itself leaves nothing to commit
+    if transaction.parent is None:
+        session.info.pop("wrote", None)
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get async database session
+
+    A connection is checked out on the first statement, so a request served
+    from memory never touches the pool, and the session commits only if it
+    wrote; a transaction that only read is rolled back when it closes.
+    """
+    endpoint = getattr(request.scope.get("route"), "endpoint", None)
+    mode = getattr(endpoint, _READ_ONLY_ATTR, None)
+    bind = _read_only_engines[mode] if mode else engine
+
+    async with AsyncSessionLocal(bind=bind) as session:
+        if mode:
+            session.info["read_only"] = True
         try:
             yield session
-            await session.commit()
+            if (
+                session.info.get("wrote")
+                or session.new
+                or session.dirty
+                or session.deleted
+            ):
+                await session.commit()
         except Exception as exc:
             logger.exception("Database transaction failed", exc=exc)
             await session.rollback()
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.core import engine_options
+from campus_bridge.data.database.instrumentation import (
+    on_slow_statement,
+    parameter_shape,
+    remove_slow_statement_hook,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# only plain reads are ever re-run; the READ ONLY transaction backs this up
+_READ = re.compile(r"\s*(SELECT|WITH)\b", re.IGNORECASE)
+
+# slow statements waiting for EXPLAIN, beyond it samples are dropped
+QUEUE_SIZE = 100
+# statement shapes remembered for the per-shape interval
+MAX_SHAPES = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class _Sample:
+    statement: str
+    shape: str
+    parameters: Any
+    duration_ms: float
+    request_id: str | None
+
+
+class SlowQueryExplainer:
+    """
+    Plans of a sample of the slow statements logged by the engine.
+
+    A slow SELECT is sampled at `sample_rate`, at most once per statement
+    shape every `interval_seconds`, and only queued from the request: a
+    single background task replays it with its original parameters as
+    EXPLAIN (ANALYZE, BUFFERS) on a side connection of its own, inside a
+    READ ONLY transaction that is rolled back, and appends the plan as one
+    JSON line to a size-rotated log file. A full queue drops the sample.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float,
+        interval_seconds: float,
+        timeout_seconds: float,
+        log_file: str,
+        log_max_bytes: int,
+        log_backups: int,
+    ):
+        self.sample_rate = sample_rate
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.log_file = log_file
+        self.log_max_bytes = log_max_bytes
+        self.log_backups = log_backups
+        self._queue: asyncio.Queue[_Sample | None] = asyncio.Queue(QUEUE_SIZE)
+        self._explained: dict[str, float] = {}
+        self._engine: AsyncEngine | None = None
+        self._plan_log: logging.Logger | None = None
+        self._task: asyncio.Task | None = None
+
+    def _sample(
+        self,
+        statement: str,
+        shape: str,
+        parameters: Any,
+        executemany: bool,
+        seconds: float,
+    ) -> None:
+        if executemany or not _READ.match(statement):
+            return
+        if random.random() >= self.sample_rate:
+            return
+
+        now = time.monotonic()
+        last = self._explained.get(shape)
+        if last is not None and now - last < self.interval_seconds:
+            return
+        if len(self._explained) >= MAX_SHAPES:
+            self._explained.clear()
+
+        try:
+            self._queue.put_nowait(
+                _Sample(
+                    statement=statement,
+                    shape=shape,
+                    parameters=parameters,
+                    duration_ms=round(seconds * 1000, 2),
+                    request_id=structlog.contextvars.get_contextvars().get(
+                        "request_id"
+                    ),
+                )
+            )
+        except asyncio.QueueFull:
+            return
+        self._explained[shape] = now
+
+    async def _explain(self, sample: _Sample) -> Any:
+        async with self._engine.connect() as conn:
+            await conn.exec_driver_sql(
+                f"SET LOCAL statement_timeout = {int(self.timeout_seconds * 1000)}"
+            )
+            result = await conn.exec_driver_sql(
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sample.statement,
+                sample.parameters,
+            )
+            plan = result.scalar_one()
+            await conn.rollback()
+        # asyncpg returns the json column as text
+        return json.loads(plan) if isinstance(plan, str) else plan
+
+    async def _run(self) -> None:
+        while (sample := await self._queue.get()) is not None:
+            started = time.perf_counter()
+            try:
+                plan = await self._explain(sample)
+            except Exception as exc:
+                logger.warning(
+                    "sql_explain_failed", statement=sample.shape[:2000], exc=exc
+                )
+                continue
+
+            line = json.dumps(
+                {
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "event": "sql_slow_query_plan",
+                    "app": settings.APP_NAME,
+                    "environment": settings.ENVIRONMENT.value,
+                    "request_id": sample.request_id,
+                    "duration_ms": sample.duration_ms,
+                    "explain_ms": round((time.perf_counter() - started) * 1000, 2),
+                    "statement": sample.shape,
+                    "parameters": parameter_shape(sample.parameters, False),
+                    "plan": plan,
+                },
+                default=str,
+            )
+            # file writes stay off the event loop
+            await asyncio.to_thread(self._plan_log.info, line)
+
+    def _open_plan_log(self) -> logging.Logger:
+        plan_log = logging.getLogger("campus_bridge.slow_query_plans")
+        plan_log.setLevel(logging.INFO)
+        plan_log.propagate = False
+        if not plan_log.handlers:
+            path = Path(self.log_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(
+                path,
+                maxBytes=self.log_max_bytes,
+                backupCount=self.log_backups,
+                encoding="utf-8",
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            plan_log.addHandler(handler)
+        return plan_log
+
+    def start(self) -> None:
+        """Start sampling slow statements (called from lifespan)"""
+        if self._task is not None or not (
+            self.sample_rate > 0 and settings.SQL_SLOW_QUERY_THRESHOLD_MS > 0
+        ):
+            return
+
+        options = engine_options()
+        # one connection of its own, never taken from the request pool
+        options.update(poolclass=AsyncAdaptedQueuePool, pool_size=1, max_overflow=0)
+        options["connect_args"]["server_settings"] = {
+            "application_name": f"{settings.APP_NAME}-explain"
+        }
+        self._engine = create_async_engine(
+            settings.DATABASE_URL, **options
+        ).execution_options(postgresql_readonly=True)
+        self._plan_log = self._open_plan_log()
+        self._task = asyncio.create_task(self._run())
+        on_slow_statement(self._sample)
+
+    async def stop(self) -> None:
+        """Stop sampling, dropping the plans still queued (called from lifespan)"""
+        if self._task is not None:
+            remove_slow_statement_hook(self._sample)
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+            await self._task
+            self._task = None
+            await self._engine.dispose()
+            self._engine = None
+
+
+slow_query_explainer = SlowQueryExplainer(
+    sample_rate=settings.SQL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+    interval_seconds=settings.SQL_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS,
+    timeout_seconds=settings.SQL_SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS,
+    log_file=settings.SQL_SLOW_QUERY_PLAN_LOG_FILE,
+    log_max_bytes=settings.SQL_SLOW_QUERY_PLAN_LOG_MAX_BYTES,
+    log_backups=settings.SQL_SLOW_QUERY_PLAN_LOG_BACKUPS,
+)
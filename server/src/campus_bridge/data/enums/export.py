@@ -0,0 +1,9 @@
+from enum import Enum
+
+from campus_bridge.constants.export_constant import CSV, PARQUET
+
+
+class ExportFormatEnum(str, Enum):
+    # file format of a directory export
+    CSV = CSV
+    PARQUET = PARQUET
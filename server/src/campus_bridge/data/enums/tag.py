@@ -0,0 +1,15 @@
+from enum import Enum
+
+from sqlalchemy import Enum as SQLEnum
+
+from campus_bridge.constants.tag_constant import HASHTAG, MENTION
+from campus_bridge.utils.db_object import get_database_native_name
+
+
+class TagTypeEnum(str, Enum):
+    # kind of tag found in a post
+    HASHTAG = HASHTAG
+    MENTION = MENTION
+
+
+tag_type_enum = SQLEnum(TagTypeEnum, name=get_database_native_name("TagType", "enum"))
@@ -1,9 +1,13 @@
 from .alumni import Alumni
 from .college import College
 from .college_official import CollegeOfficial
+from .college_stats import CollegeAlumniStat, CollegeRoleStat, CollegeStudentStat
 from .comment import Comment
 from .email_verification import EmailVerification
 from .post import Post
+from .post_impression_counter import PostImpressionCounter
 from .post_reaction import PostReaction
+from .post_tag import PostTag
 from .student import Student
+from .trending_tag_event import TrendingTagEvent
 from .user import User
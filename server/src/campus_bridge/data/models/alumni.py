@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,15 +10,49 @@ from campus_bridge.data.database.mixins import (
     TableNameMixin,
     TimestampMixin,
     UserIdCard,
+    VerificationReview,
     VerifyAccount,
 )
 from campus_bridge.utils.db_object import get_foreign_key
 
 
-class Alumni(Base, IdMixin, TableNameMixin, TimestampMixin, UserIdCard, VerifyAccount):
+class Alumni(
+    Base,
+    IdMixin,
+    TableNameMixin,
+    TimestampMixin,
+    UserIdCard,
+    VerifyAccount,
+    VerificationReview,
+):
+    __table_args__ = (
+        # keyset pages of a college's alumni directory, unfiltered and by
+        # company; the company index also serves the company facet
+        Index("ix_alumnis_college_created_at_id", "college_id", "created_at", "id"),
+        Index(
+            "ix_alumnis_college_company_created_at_id",
+            "college_id",
+            "company",
+            "created_at",
+            "id",
+        ),
+        # the verification review queue, only holds profiles awaiting review
+        Index(
+            "ix_alumnis_review_queue",
+            "college_id",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT is_verified AND reviewed_at IS NULL"),
+        ),
+    )
+
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey(get_foreign_key("User")), nullable=False, unique=True, index=True
     )
+    # copy of users.college_id, so the directory needs no join to page
+    college_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey(get_foreign_key("College")), nullable=False
+    )
     graduation_year: Mapped[int] = mapped_column(Integer, nullable=False)
     company: Mapped[str] = mapped_column(String(100), nullable=False)
     designation: Mapped[str] = mapped_column(String(100), nullable=False)
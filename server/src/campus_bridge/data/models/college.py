@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, String, UniqueConstraint
+from sqlalchemy import Boolean, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from campus_bridge.data.database.base import Base
@@ -14,6 +14,13 @@ from campus_bridge.data.enums.state import StateEnum, state_enum
 class College(Base, IdMixin, TableNameMixin, TimestampMixin, SoftDeleteMixin):
     __table_args__ = (
         UniqueConstraint("name", "city", "state", name="uq_college_identity"),
+        # autocomplete fallback for names the in-memory index cannot match
+        Index(
+            "ix_colleges_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
 
     name: Mapped[str] = mapped_column(String(250), nullable=False, index=True)
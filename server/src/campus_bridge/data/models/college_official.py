@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from campus_bridge.data.database.base import Base
@@ -9,14 +9,30 @@ from campus_bridge.data.database.mixins import (
     TableNameMixin,
     TimestampMixin,
     UserIdCard,
+    VerificationReview,
     VerifyAccount,
 )
 from campus_bridge.utils.db_object import get_foreign_key
 
 
 class CollegeOfficial(
-    Base, IdMixin, TableNameMixin, TimestampMixin, UserIdCard, VerifyAccount
+    Base,
+    IdMixin,
+    TableNameMixin,
+    TimestampMixin,
+    UserIdCard,
+    VerifyAccount,
+    VerificationReview,
 ):
+    __table_args__ = (
+        # the verification review queue, only holds profiles awaiting review
+        Index(
+            "ix_college_officials_review_queue",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT is_verified AND reviewed_at IS NULL"),
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey(get_foreign_key("User")), nullable=False, unique=True, index=True
@@ -0,0 +1,37 @@
+import uuid
+
+from sqlalchemy import BigInteger, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from campus_bridge.data.database.base import Base
+from campus_bridge.data.database.mixins import TableNameMixin
+from campus_bridge.data.enums.branch import BranchEnum, branch_enum
+from campus_bridge.data.enums.role import RoleEnum, role_enum
+from campus_bridge.utils.db_object import get_foreign_key
+
+# Summary tables behind the college dashboards. Statement level triggers on
+# users, students and alumnis keep them in step with every write, in the
+# writer's transaction; CollegeStatsReconciler periodically repairs drift.
+
+
+class CollegeStatsMixin:
+    # first in the primary key, so a college's rows are one index range
+    college_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey(get_foreign_key("College")), primary_key=True, sort_order=-1
+    )
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    verified: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class CollegeRoleStat(Base, TableNameMixin, CollegeStatsMixin):
+    # users that are not soft deleted
+    role: Mapped[RoleEnum] = mapped_column(role_enum, primary_key=True)
+
+
+class CollegeStudentStat(Base, TableNameMixin, CollegeStatsMixin):
+    branch: Mapped[BranchEnum] = mapped_column(branch_enum, primary_key=True)
+    year_of_study: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
+class CollegeAlumniStat(Base, TableNameMixin, CollegeStatsMixin):
+    graduation_year: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,6 +22,18 @@ from campus_bridge.utils.db_object import get_foreign_key
 
 
 class Post(Base, IdMixin, TableNameMixin, TimestampMixin, SoftDeleteMixin):
+    __table_args__ = (
+        # covers the college feed keyset (page reads and new-post counts)
+        Index(
+            "ix_posts_college_feed",
+            "college_id",
+            "created_at",
+            "id",
+            postgresql_where=text(
+                "visibility = 'COLLEGE' AND is_hidden IS false AND is_deleted IS false"
+            ),
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey(get_foreign_key("User")), nullable=False, index=True
@@ -0,0 +1,15 @@
+import uuid
+
+from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from campus_bridge.data.database.base import Base
+from campus_bridge.data.database.mixins import TableNameMixin, TimestampMixin
+from campus_bridge.utils.db_object import get_foreign_key
+
+
+class PostImpressionCounter(Base, TableNameMixin, TimestampMixin):
+    post_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey(get_foreign_key("Post")), primary_key=True
+    )
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,28 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from campus_bridge.data.database.base import Base
+from campus_bridge.data.database.mixins import IdMixin, TableNameMixin, TimestampMixin
+from campus_bridge.data.enums.tag import TagTypeEnum, tag_type_enum
+from campus_bridge.utils.db_object import get_foreign_key
+
+
+class PostTag(Base, IdMixin, TableNameMixin, TimestampMixin):
+    post_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey(get_foreign_key("Post")), nullable=False, index=True
+    )
+    college_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey(get_foreign_key("College")), nullable=False
+    )
+    tag_type: Mapped[TagTypeEnum] = mapped_column(tag_type_enum, nullable=False)
+    tag: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("post_id", "tag_type", "tag", name="uq_post_tag"),
+        Index("ix_post_tags_tag_created_at", "tag", "created_at"),
+    )
+
+    # relationship
+    post: Mapped["Post"] = relationship("Post")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,23 +10,102 @@ from campus_bridge.data.database.mixins import (
     TableNameMixin,
     TimestampMixin,
     UserIdCard,
+    VerificationReview,
     VerifyAccount,
 )
 from campus_bridge.data.enums.branch import BranchEnum, branch_enum
 from campus_bridge.utils.db_object import get_foreign_key
 
 
-class Student(Base, IdMixin, TableNameMixin, TimestampMixin, UserIdCard, VerifyAccount):
+class Student(
+    Base,
+    IdMixin,
+    TableNameMixin,
+    TimestampMixin,
+    UserIdCard,
+    VerifyAccount,
+    VerificationReview,
+):
+    __table_args__ = (
+        # roll numbers are unique per college; the included ids let roll
+        # number lookups be answered from the index alone
+        Index(
+            "uq_students_college_id_roll_number",
+            "college_id",
+            "roll_number",
+            unique=True,
+            postgresql_include=["id", "user_id"],
+        ),
+        # keyset pages of the verified student listing, unfiltered and, within
+        # a college, filtered by branch (and year) or by year alone
+        Index(
+            "ix_students_verified_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_verified"),
+        ),
+        Index(
+            "ix_students_verified_college_created_at_id",
+            "college_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_verified"),
+        ),
+        Index(
+            "ix_students_verified_college_branch_year_created_at_id",
+            "college_id",
+            "branch",
+            "year_of_study",
+            "created_at",
+            "id",
+            postgresql_where=text("is_verified"),
+        ),
+        Index(
+            "ix_students_verified_college_year_created_at_id",
+            "college_id",
+            "year_of_study",
+            "created_at",
+            "id",
+            postgresql_where=text("is_verified"),
+        ),
+        # the verification review queue, only holds profiles awaiting review
+        Index(
+            "ix_students_review_queue",
+            "college_id",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT is_verified AND reviewed_at IS NULL"),
+        ),
+        # people search fallback for colleges not in the in-memory index,
+        # prefix ranges of the lowercase names of verified students
+        Index(
+            "ix_students_college_first_name_prefix",
+            "college_id",
+            text('lower(first_name) COLLATE "C"'),
+            postgresql_where=text("is_verified"),
+        ),
+        Index(
+            "ix_students_college_last_name_prefix",
+            "college_id",
+            text('lower(last_name) COLLATE "C"'),
+            postgresql_where=text("is_verified"),
+        ),
+    )
+
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey(get_foreign_key("User")), nullable=False, unique=True, index=True
     )
+    # copy of users.college_id, so college rules and lookups need no join
+    college_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey(get_foreign_key("College")), nullable=False
+    )
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
     middle_name: Mapped[str] = mapped_column(
         String(100),
         nullable=True,
     )
     last_name: Mapped[str] = mapped_column(String(100), nullable=True)
-    roll_number: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    roll_number: Mapped[str] = mapped_column(String(50), nullable=False)
     branch: Mapped[BranchEnum] = mapped_column(branch_enum, nullable=False)
     year_of_study: Mapped[int] = mapped_column(nullable=False)
     interests: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
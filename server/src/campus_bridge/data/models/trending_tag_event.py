@@ -0,0 +1,54 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    SmallInteger,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from campus_bridge.data.database.base import Base
+from campus_bridge.data.database.mixins import TableNameMixin
+from campus_bridge.utils.db_object import get_foreign_key
+
+
+class TrendingTagEvent(Base, TableNameMixin):
+    """
+    Outbox of hashtag count changes, +1 when a post's hashtag starts counting
+    and -1 when it stops, tailed by every worker's trending tracker.
+    """
+
+    seq: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # writing transaction: rows are only read once it can no longer commit,
+    # so one that commits late is never skipped
+    txid: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default=text("(pg_current_xact_id()::text)::bigint"),
+    )
+    college_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey(get_foreign_key("College")), nullable=False
+    )
+    tag: Mapped[str] = mapped_column(String(100), nullable=False)
+    is_public: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    delta: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    # when the tag was first counted, the window bucket the change belongs to
+    counted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_trending_tag_events_txid_seq", "txid", "seq"),
+        # pruned once out of the trending window
+        Index("ix_trending_tag_events_created_at", "created_at"),
+    )
@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import Boolean, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from campus_bridge.data.database.base import Base
@@ -21,6 +22,33 @@ from campus_bridge.utils.db_object import get_foreign_key
 class User(
     Base, IdMixin, TableNameMixin, TimestampMixin, SoftDeleteMixin, VerifyAccount
 ):
+    __table_args__ = (
+        # keyset pages of the admin user directory, with and without a role
+        Index(
+            "ix_users_college_role_created_at_id",
+            "college_id",
+            "role",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        Index(
+            "ix_users_college_created_at_id",
+            "college_id",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        # people search fallback for colleges not in the in-memory index,
+        # prefix ranges of lowercase emails
+        Index(
+            "ix_users_college_email_prefix",
+            "college_id",
+            text('lower(email) COLLATE "C"'),
+            postgresql_where=text("NOT is_deleted"),
+        ),
+    )
+
     college_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey(get_foreign_key("College")), nullable=False
     )
@@ -28,6 +56,10 @@ class User(
     password: Mapped[str] = mapped_column(String(255), nullable=False)
     phone: Mapped[str] = mapped_column(String(15), nullable=False, unique=True)
     role: Mapped[RoleEnum] = mapped_column(role_enum, nullable=False, index=True)
+    # written in batches by the presence tracker, lags by up to one flush
+    last_seen_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # relationships
     student_profile: Mapped["Student"] = relationship(
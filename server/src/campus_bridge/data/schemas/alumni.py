@@ -2,7 +2,10 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from campus_bridge.data.schemas.pagination import CursorPage
+from campus_bridge.data.schemas.upload import IdCardThumbnails
 
 
 class AlumniBase(BaseModel):
@@ -26,14 +29,67 @@ class CreateAlumni(AlumniBase):
 
 
 class AlumniResponse(AlumniBase):
-    """Response model for alumni"""
+    """Response model for alumni, as listed in the directory"""
 
     id: UUID = Field(description="ID of the alumni")
     created_at: datetime = Field(description="Created at")
     updated_at: datetime = Field(description="Updated at")
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AlumniProfileResponse(AlumniResponse, IdCardThumbnails):
+    """Response model for an alumni's own profile, with the id card"""
+
+    id_card_url: str = Field(description="Id card url of the alumni")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AlumniCompanyCount(BaseModel):
+    """Alumni of a college working at one company"""
+
+    company: str = Field(description="Company name")
+    count: int = Field(description="Alumni at the company")
+
+
+class AlumniYearCount(BaseModel):
+    """Alumni of a college graduating in one year"""
+
+    graduation_year: int = Field(description="Graduation year")
+    count: int = Field(description="Alumni of the year")
+
+
+class AlumniFacets(BaseModel):
+    """Facet counts over a college's whole alumni directory"""
+
+    companies: list[AlumniCompanyCount] = Field(description="Most common companies")
+    graduation_years: list[AlumniYearCount] = Field(
+        description="Alumni per graduation year"
+    )
+
+
+class AlumniDirectoryPage(CursorPage[AlumniResponse]):
+    """One keyset page of the alumni directory"""
+
+    facets: Optional[AlumniFacets] = Field(
+        default=None, description="Facets of the college, only on the first page"
+    )
+
+
+class AlumniRecommendation(BaseModel):
+    """Response model for an alumni recommended as a mentor"""
+
+    alumni_id: UUID = Field(description="ID of the alumni")
+    user_id: UUID = Field(description="User ID of the alumni")
+    graduation_year: int = Field(description="Graduation year of the alumni")
+    company: str = Field(description="Company name of the alumni")
+    designation: str = Field(description="Designation of the alumni")
+    experience_years: int = Field(description="Experience years of the alumni")
+    score: float = Field(description="Ranking score, higher is a better match")
+    shared_expertise: list[str] = Field(
+        description="Expertise areas matching the student's interests"
+    )
 
 
 class UpdateAlumni(BaseModel):
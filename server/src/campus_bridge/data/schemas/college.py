@@ -2,8 +2,10 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.enums.state import StateEnum
 
 
@@ -32,6 +34,15 @@ class CollegeResponse(CreateCollegeRequest):
         from_attributes = True
 
 
+class CollegeCreateResponse(BaseModel):
+    """Result of creating one or multiple colleges"""
+
+    inserted: int = Field(description="Colleges created")
+    updated: int = Field(description="Existing colleges changed")
+    skipped: int = Field(description="Colleges already there or repeated, left out")
+    colleges: list[CollegeResponse] = Field(description="The colleges created")
+
+
 class CollegeUpdateRequest(BaseModel):
     """Schema for partially updating a college"""
 
@@ -50,7 +61,107 @@ class CollegeUpdateRequest(BaseModel):
         from_attributes = True
 
 
+class CollegeSearchResult(BaseModel):
+    """Schema for one college in an autocomplete search"""
+
+    id: UUID = Field(description="Unique identifier for the college")
+    name: str = Field(description="Name of the College")
+    city: str = Field(description="City in which college is present")
+    state: StateEnum = Field(description="State in which college is present")
+    is_government: bool = Field(description="Type of college government or private")
+
+    class Config:
+        from_attributes = True
+
+
+class CollegeImportRow(CreateCollegeRequest):
+    """One row of a bulk college import file"""
+
+    name: str = Field(min_length=1, max_length=250, description="Name of the College")
+    is_government: bool = Field(
+        default=False, description="Type of college government or private"
+    )
+    city: str = Field(
+        min_length=1, max_length=100, description="City in which college is present"
+    )
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def strip_blank(cls, value):
+        # spreadsheets leave empty cells as "" and pad values with spaces
+        if isinstance(value, str):
+            value = value.strip()
+            return value or None
+        return value
+
+    @field_validator("is_government", mode="before")
+    @classmethod
+    def default_blank(cls, value):
+        if value is None or isinstance(value, str) and not value.strip():
+            return False
+        return value
+
+
+class CollegeImportError(BaseModel):
+    """A row that could not be imported"""
+
+    line: int = Field(description="Line number in the uploaded file")
+    message: str = Field(description="Why the row was rejected")
+
+
+class CollegeImportResponse(BaseModel):
+    """Result of a bulk college import"""
+
+    total_rows: int = Field(description="Data rows read from the file")
+    inserted: int = Field(description="Colleges created")
+    updated: int = Field(description="Existing colleges changed")
+    skipped: int = Field(description="Existing colleges left as they were")
+    failed: int = Field(description="Rows rejected")
+    errors: list[CollegeImportError] = Field(description="Rejected rows")
+    errors_truncated: bool = Field(
+        description="True when more rows failed than errors lists"
+    )
+
+
 class CollegeDeleteResponse(BaseModel):
     """Delete college response"""
 
     message: str = Field(description="Message confirming college deletion")
+
+
+class CollegeRoleCount(BaseModel):
+    """Users of one role in a college"""
+
+    role: RoleEnum = Field(description="Role")
+    total: int = Field(description="Users")
+    verified: int = Field(description="Verified users")
+
+
+class CollegeStudentCohortCount(BaseModel):
+    """Students of one branch and year in a college"""
+
+    branch: BranchEnum = Field(description="Branch")
+    year_of_study: int = Field(description="Year of study")
+    total: int = Field(description="Student profiles")
+    verified: int = Field(description="Verified student profiles")
+
+
+class CollegeAlumniCohortCount(BaseModel):
+    """Alumni of one graduation year of a college"""
+
+    graduation_year: int = Field(description="Graduation year")
+    total: int = Field(description="Alumni profiles")
+    verified: int = Field(description="Verified alumni profiles")
+
+
+class CollegeStatsResponse(BaseModel):
+    """Cohort counts of a college"""
+
+    college_id: UUID = Field(description="College id")
+    roles: list[CollegeRoleCount] = Field(description="Users by role")
+    students: list[CollegeStudentCohortCount] = Field(
+        description="Students by branch and year of study"
+    )
+    alumni: list[CollegeAlumniCohortCount] = Field(
+        description="Alumni by graduation year"
+    )
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 from campus_bridge.data.enums.post import PostTypeEnum, PostVisibilityEnum
 
@@ -31,6 +31,15 @@ class PostResponse(PostCreate):
     updated_at: datetime = Field(..., description="The update time of the post")
     user_id: UUID = Field(..., description="The id of the user who created the post")
 
+    model_config = ConfigDict(from_attributes=True)
+
+    # read from Post.meta_data, Post.metadata is the SQLAlchemy table metadata
+    metadata: dict | None = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("meta_data", "metadata"),
+        description="The metadata of the post",
+    )
+
 
 class PostUpdateRequest(BaseModel):
     """This is the update model for post"""
@@ -50,3 +59,25 @@ class PostUpdateRequest(BaseModel):
     metadata: Optional[dict] = Field(
         default=None, description="The metadata of the post"
     )
+
+
+class NewPostsCountResponse(BaseModel):
+    """This is the response model for the new posts counter"""
+
+    count: int = Field(..., description="Number of new posts, at most the cap")
+    is_capped: bool = Field(..., description="Whether more posts exist than counted")
+    display: str = Field(..., description="Count formatted for the UI, e.g. '50+'")
+
+
+class PostImpressionResponse(BaseModel):
+    """This is the response model for post impressions"""
+
+    post_id: UUID = Field(..., description="The id of the post")
+    impressions: int = Field(..., description="Number of times the post was served")
+
+
+class TrendingTagResponse(BaseModel):
+    """This is the response model for a trending hashtag"""
+
+    tag: str = Field(..., description="The hashtag, lowercased and without '#'")
+    count: int = Field(..., description="Estimated posts using it in the window")
@@ -0,0 +1,20 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """Schema for one keyset page of a listing"""
+
+    items: list[T] = Field(description="Rows of this page")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor of the next page, null on the last page"
+    )
+    total: Optional[int] = Field(
+        default=None, description="Matching rows, only counted for the first page"
+    )
+    is_total_capped: bool = Field(
+        default=False, description="Whether more rows exist than `total`"
+    )
@@ -0,0 +1,18 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from campus_bridge.data.enums.role import RoleEnum
+
+
+class PersonSearchResult(BaseModel):
+    """Schema for one person in a typeahead search"""
+
+    user_id: UUID = Field(description="User id")
+    role: RoleEnum = Field(description="Role of the user (STUDENT or ALUMNI)")
+    email: str = Field(description="Email")
+    first_name: Optional[str] = Field(default=None, description="First name")
+    last_name: Optional[str] = Field(default=None, description="Last name")
+
+    model_config = ConfigDict(from_attributes=True)
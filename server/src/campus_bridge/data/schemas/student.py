@@ -1,11 +1,13 @@
+import json
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from campus_bridge.data.enums.branch import BranchEnum
 from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.data.schemas.upload import IdCardThumbnails, IdCardUrl
 
 
 class StudentBase(BaseModel):
@@ -17,7 +19,6 @@ class StudentBase(BaseModel):
     roll_number: str = Field(description="Roll number")
     branch: BranchEnum = Field(description="Branch")
     year_of_study: int = Field(description="Year of study")
-    id_card_url: str = Field(description="Id card url")
     interests: dict = Field(description="Interests")
 
     model_config = ConfigDict(from_attributes=True)
@@ -55,11 +56,11 @@ class StudentUserResponse(BaseModel):
 class StudentCreate(StudentBase):
     """Create schema for student"""
 
-    pass
+    id_card_url: IdCardUrl = Field(description="Id card url from the upload endpoint")
 
 
 class StudentResponse(StudentBase):
-    """Response schema for student"""
+    """Response schema for student, as listed to the rest of the college"""
 
     id: UUID = Field(description="Student id")
     created_at: datetime = Field(description="Created at")
@@ -68,6 +69,23 @@ class StudentResponse(StudentBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class StudentProfileResponse(StudentResponse, IdCardThumbnails):
+    """Response schema for a student's own profile, with the id card"""
+
+    id_card_url: str = Field(description="Id card url")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StudentUserProfileResponse(BaseModel):
+    """Response schema for a student's own profile and user"""
+
+    student: StudentProfileResponse
+    user: UserResponse
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class StudentUpdateRequest(BaseModel):
     """Update schema for student"""
 
@@ -86,3 +104,96 @@ class StudentUpdateResponse(StudentUpdateRequest):
     """Response schema for student update"""
 
     pass
+
+
+class StudentImportRow(BaseModel):
+    """One row of a bulk student import file"""
+
+    email: EmailStr = Field(description="Email")
+    phone: str = Field(min_length=10, max_length=15, description="Phone")
+    password: str = Field(min_length=8, description="Initial password")
+    first_name: str = Field(min_length=1, max_length=100, description="First name")
+    middle_name: Optional[str] = Field(
+        default=None, max_length=100, description="Middle name"
+    )
+    last_name: Optional[str] = Field(
+        default=None, max_length=100, description="Last name"
+    )
+    roll_number: str = Field(min_length=1, max_length=50, description="Roll number")
+    branch: BranchEnum = Field(description="Branch")
+    year_of_study: int = Field(ge=1, description="Year of study")
+    id_card_url: IdCardUrl = Field(
+        max_length=500, description="Id card url from the upload endpoint"
+    )
+    interests: dict = Field(default_factory=dict, description="Interests as JSON")
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def strip_blank(cls, value):
+        # spreadsheets leave empty cells as "" and pad values with spaces
+        if isinstance(value, str):
+            value = value.strip()
+            return value or None
+        return value
+
+    @field_validator("interests", mode="before")
+    @classmethod
+    def parse_interests(cls, value):
+        if isinstance(value, str):
+            return json.loads(value) if value.strip() else {}
+        return {} if value is None else value
+
+
+class StudentImportError(BaseModel):
+    """A row that could not be imported"""
+
+    line: int = Field(description="Line number in the uploaded file")
+    message: str = Field(description="Why the row was rejected")
+
+
+class StudentImportResponse(BaseModel):
+    """Result of a bulk student import"""
+
+    total_rows: int = Field(description="Data rows read from the file")
+    imported: int = Field(description="Students created")
+    failed: int = Field(description="Rows rejected")
+    errors: list[StudentImportError] = Field(description="Rejected rows")
+    errors_truncated: bool = Field(
+        description="True when more rows failed than errors lists"
+    )
+
+
+class StudentMatchResponse(BaseModel):
+    """Response schema for a student with similar interests"""
+
+    student_id: UUID = Field(description="Student id")
+    user_id: UUID = Field(description="User id")
+    first_name: str = Field(description="First name")
+    last_name: Optional[str] = Field(default=None, description="Last name")
+    branch: BranchEnum = Field(description="Branch")
+    year_of_study: int = Field(description="Year of study")
+    score: float = Field(description="Cosine similarity of the interests, 0 to 1")
+    shared_interests: list[str] = Field(description="Interests in common")
+
+
+class StudentRollLookup(BaseModel):
+    """A roll number resolved to its student"""
+
+    roll_number: str = Field(description="Roll number")
+    student_id: UUID = Field(description="Student id")
+    user_id: UUID = Field(description="User id")
+
+
+class StudentRollLookupRequest(BaseModel):
+    """Request schema for a batch roll number lookup"""
+
+    roll_numbers: list[str] = Field(
+        min_length=1, max_length=1000, description="Roll numbers to look up"
+    )
+
+
+class StudentRollLookupResponse(BaseModel):
+    """Response schema for a batch roll number lookup"""
+
+    found: list[StudentRollLookup] = Field(description="Roll numbers with a student")
+    missing: list[str] = Field(description="Roll numbers without a student")
@@ -0,0 +1,36 @@
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, Field
+
+from campus_bridge.utils.thumbnails import id_card_key
+
+
+def _served_id_card_url(value: str) -> str:
+    # stored URLs are later resolved to blob keys, only ours are accepted
+    if id_card_key(value) is None:
+        raise ValueError("Id card url must be a URL returned by the upload endpoint")
+    return value
+
+
+IdCardUrl = Annotated[str, AfterValidator(_served_id_card_url)]
+
+
+class UploadResponse(BaseModel):
+    """Response schema for an uploaded file"""
+
+    url: str = Field(description="URL to store on the profile, e.g. id_card_url")
+    sha256: str = Field(description="Hex SHA-256 of the file content")
+    size: int = Field(description="Size of the file in bytes")
+    content_type: str = Field(description="Detected content type of the file")
+    is_duplicate: bool = Field(
+        description="Whether identical content was already stored"
+    )
+
+
+class IdCardThumbnails(BaseModel):
+    """Thumbnails of a profile's id card, filled in by the thumbnail service"""
+
+    id_card_thumbnail_urls: dict[int, str] = Field(
+        default_factory=dict,
+        description="Id card thumbnail url per size in pixels, once generated",
+    )
@@ -56,3 +56,13 @@ class UserUpdateResponse(UserResponse):
 
     class Config:
         from_attributes = True
+
+
+class PresenceResponse(BaseModel):
+    """Schema for a user's online status"""
+
+    user_id: UUID = Field(description="User unique identifier")
+    is_online: bool = Field(description="Whether the user was active recently")
+    last_seen_at: Optional[datetime] = Field(
+        default=None, description="Last activity, null if never seen"
+    )
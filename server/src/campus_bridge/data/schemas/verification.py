@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.data.schemas.upload import IdCardThumbnails
+
+ReviewProfileType = Literal[RoleEnum.STUDENT, RoleEnum.ALUMNI, RoleEnum.OFFICIALS]
+
+
+class VerificationClaimRequest(BaseModel):
+    """Request schema for claiming a batch of profiles to review"""
+
+    profile_type: ReviewProfileType = Field(description="Which profiles to review")
+    limit: int = Field(default=20, ge=1, le=50, description="Batch size")
+
+
+class VerificationClaimItem(IdCardThumbnails):
+    """Schema for one profile leased to a reviewer"""
+
+    id: UUID = Field(description="Profile id")
+    user_id: UUID = Field(description="User id")
+    id_card_url: str = Field(description="Id card url")
+    created_at: datetime = Field(description="Signed up at")
+    review_claim_expires_at: datetime = Field(description="Lease expires at")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class VerificationDecisionRequest(BaseModel):
+    """Request schema for approving or releasing claimed profiles"""
+
+    profile_type: ReviewProfileType = Field(description="Which profiles are decided")
+    profile_ids: list[UUID] = Field(
+        min_length=1, max_length=50, description="Claimed profile ids"
+    )
+
+
+class VerificationRejectRequest(VerificationDecisionRequest):
+    """Request schema for rejecting claimed profiles"""
+
+    reason: str = Field(min_length=1, max_length=500, description="Rejection reason")
+
+
+class VerificationDecisionResponse(BaseModel):
+    """Response schema for a bulk review decision"""
+
+    updated: list[UUID] = Field(description="Profiles that were decided")
+    skipped: list[UUID] = Field(
+        description="Profiles not claimed by you, already decided or lease expired"
+    )
@@ -5,8 +5,10 @@ from campus_bridge.errors.exc.base_errors import (
     ConflictError,
     InternalError,
     NotFoundError,
+    PayloadTooLargeError,
     UnAuthenticatedError,
     UnauthorizedError,
+    UnsupportedMediaTypeError,
 )
 
 __all__ = [
@@ -18,4 +20,6 @@ __all__ = [
     "AlreadyExistsError",
     "ConflictError",
     "BadRequestError",
+    "PayloadTooLargeError",
+    "UnsupportedMediaTypeError",
 ]
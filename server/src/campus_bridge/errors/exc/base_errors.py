@@ -110,6 +110,33 @@ class ConflictError(BaseError):
         )
 
 
+class PayloadTooLargeError(BaseError):
+    def __init__(self, resource: str, max_bytes: int):
+        super().__init__(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            message=f"{resource} exceeds the maximum size of {max_bytes} bytes",
+            log_config=(
+                "warning",
+                "payload too large: %s over %s bytes",
+                resource,
+                str(max_bytes),
+            ),
+        )
+
+
+class UnsupportedMediaTypeError(BaseError):
+    def __init__(self, resource: str, allowed: list[str]):
+        super().__init__(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            message=f"{resource} must be one of: {', '.join(allowed)}",
+            log_config=(
+                "warning",
+                "unsupported media type for %s",
+                resource,
+            ),
+        )
+
+
 class UnAuthenticatedError(BaseError):
     def __init__(
         self, details: str, exc: Exception | None = None, message: str | None = None
@@ -1,13 +1,48 @@
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 
 from campus_bridge.data.database.session import get_async_session
-from campus_bridge.data.models import User
+from campus_bridge.data.models import CollegeAlumniStat, Student, User
 from campus_bridge.data.models.alumni import Alumni
 from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
+from campus_bridge.utils.cursor_pagination import cursor_pagination
+
+
+def _like_prefix(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _directory(
+    college_id: UUID | None,
+    company: str | None,
+    designation: str | None,
+    graduation_year_from: int | None,
+    graduation_year_to: int | None,
+    min_experience_years: int | None,
+    is_available: bool | None,
+):
+    stmt = select(Alumni)
+    if college_id is not None:
+        stmt = stmt.where(Alumni.college_id == college_id)
+    if company is not None:
+        stmt = stmt.where(Alumni.company == company)
+    if designation is not None:
+        stmt = stmt.where(
+            Alumni.designation.ilike(_like_prefix(designation), escape="\\")
+        )
+    if graduation_year_from is not None:
+        stmt = stmt.where(Alumni.graduation_year >= graduation_year_from)
+    if graduation_year_to is not None:
+        stmt = stmt.where(Alumni.graduation_year <= graduation_year_to)
+    if min_experience_years is not None:
+        stmt = stmt.where(Alumni.experience_years >= min_experience_years)
+    if is_available is not None:
+        stmt = stmt.where(Alumni.is_available == is_available)
+    return stmt
 
 
 class AlumniRepository:
@@ -22,26 +57,86 @@ class AlumniRepository:
         return alumni.scalar_one_or_none()
 
     @sqlalchemy_exceptions
-    async def get_all_alumni(self) -> list[Alumni]:
-        """Get all alumni profiles"""
-        alumni = await self.db.execute(select(Alumni))
-        return alumni.scalars().all()
+    async def get_alumni(
+        self, alumni_id: UUID | None = None, user_id: UUID | None = None
+    ) -> Alumni | None:
+        """Get an alumni profile by its id or its user's id"""
+        stmt = select(Alumni)
+        if alumni_id:
+            stmt = stmt.where(Alumni.id == alumni_id)
+        else:
+            stmt = stmt.where(Alumni.user_id == user_id)
+        alumni = await self.db.execute(stmt)
+        return alumni.scalar_one_or_none()
 
     @sqlalchemy_exceptions
-    async def get_all_alumni_by_college(
-        self, college_id: UUID | None = None, skip: int = 0, limit: int = 100
+    async def get_alumni_page(
+        self, limit: int, cursor: str | None, **filters
     ) -> list[Alumni]:
-        """Get all alumni, optionally filtered by college_id"""
-        stmt = select(Alumni)
+        """Fetch one keyset page of alumni, of one college or all, filtered"""
+        stmt = cursor_pagination(
+            stmt=_directory(**filters),
+            cursor=cursor,
+            limit=limit,
+            created_at_column=Alumni.created_at,
+            id_column=Alumni.id,
+        )
+        alumni = await self.db.execute(stmt)
+        return alumni.scalars().all()
 
-        if college_id:
-            stmt = stmt.join(User).where(
-                User.college_id == college_id,
+    @sqlalchemy_exceptions
+    async def count_alumni(self, cap: int, **filters) -> int:
+        """Count alumni matching the filters, stopping at cap + 1"""
+        stmt = _directory(**filters).with_only_columns(Alumni.id)
+        result = await self.db.execute(
+            select(func.count()).select_from(stmt.limit(cap + 1).subquery())
+        )
+        return result.scalar_one()
+
+    @sqlalchemy_exceptions
+    async def get_company_counts(self, college_id: UUID, limit: int) -> list:
+        """
+        Get (company, count) of a college's most common companies, read off
+        the college company index
+        """
+        count = func.count().label("count")
+        result = await self.db.execute(
+            select(Alumni.company, count)
+            .where(Alumni.college_id == college_id)
+            .group_by(Alumni.company)
+            .order_by(count.desc(), Alumni.company)
+            .limit(limit)
+        )
+        return result.all()
+
+    @sqlalchemy_exceptions
+    async def get_graduation_year_counts(self, college_id: UUID) -> list:
+        """Get (graduation_year, count) of a college from its alumni stats"""
+        result = await self.db.execute(
+            select(CollegeAlumniStat.graduation_year, CollegeAlumniStat.total)
+            .where(
+                CollegeAlumniStat.college_id == college_id,
+                CollegeAlumniStat.total > 0,
             )
+            .order_by(CollegeAlumniStat.graduation_year)
+        )
+        return result.all()
 
-        stmt = stmt.offset(skip).limit(limit)
-        alumni = await self.db.execute(stmt)
-        return alumni.scalars().all()
+    @sqlalchemy_exceptions
+    async def get_user_college_id(self, user_id: UUID) -> UUID | None:
+        """Get the college of a user that is not deleted"""
+        result = await self.db.execute(
+            select(User.college_id).where(User.id == user_id, ~User.is_deleted)
+        )
+        return result.scalar_one_or_none()
+
+    @sqlalchemy_exceptions
+    async def get_user_email(self, user_id: UUID) -> str | None:
+        """Get the email of a user that is not deleted"""
+        result = await self.db.execute(
+            select(User.email).where(User.id == user_id, ~User.is_deleted)
+        )
+        return result.scalar_one_or_none()
 
     @sqlalchemy_exceptions
     async def create_alumni(self, alumni: Alumni) -> Alumni:
@@ -64,6 +159,80 @@ class AlumniRepository:
         await self.db.execute(delete(Alumni).where(Alumni.id == alumni_id))
         await self.db.commit()
 
+    @sqlalchemy_exceptions
+    async def get_mentor_profiles(self, college_id: UUID) -> list:
+        """
+        Get (id, user_id, graduation_year, company, designation,
+        experience_years, expertise_areas) of the verified alumni of a
+        college available for mentorship
+        """
+        result = await self.db.execute(
+            select(
+                Alumni.id,
+                Alumni.user_id,
+                Alumni.graduation_year,
+                Alumni.company,
+                Alumni.designation,
+                Alumni.experience_years,
+                Alumni.expertise_areas,
+            )
+            .join(User)
+            .where(
+                User.college_id == college_id,
+                ~User.is_deleted,
+                Alumni.is_available,
+                Alumni.is_verified,
+            )
+        )
+        return result.all()
+
+    @sqlalchemy_exceptions
+    async def get_student_profile(self, user_id: UUID):
+        """Get (id, branch, interests) of a user's verified student profile"""
+        result = await self.db.execute(
+            select(Student.id, Student.branch, Student.interests).where(
+                Student.user_id == user_id, Student.is_verified
+            )
+        )
+        return result.one_or_none()
+
+    @sqlalchemy_exceptions
+    async def stream_alumni_for_export(
+        self, college_id: UUID | None, batch_size: int
+    ) -> AsyncResult:
+        """
+        Open a server side cursor over alumni, of one college or all, as
+        (id, user_id, email, phone, graduation_year, company, designation,
+        experience_years, expertise_areas, is_available, is_verified,
+        created_at) rows
+        """
+        stmt = (
+            select(
+                Alumni.id,
+                Alumni.user_id,
+                User.email,
+                User.phone,
+                Alumni.graduation_year,
+                Alumni.company,
+                Alumni.designation,
+                Alumni.experience_years,
+                Alumni.expertise_areas,
+                Alumni.is_available,
+                Alumni.is_verified,
+                Alumni.created_at,
+            )
+            .join(User)
+            .where(~User.is_deleted)
+        )
+        if college_id:
+            stmt = stmt.where(User.college_id == college_id)
+
+        return await self.db.stream(
+            stmt.order_by(Alumni.created_at, Alumni.id).execution_options(
+                yield_per=batch_size
+            )
+        )
+
 
 def get_alumni_repository(
     db: AsyncSession = Depends(get_async_session),
@@ -3,11 +3,15 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
 
-from campus_bridge.api.v1.dependencies import get_current_user
+from campus_bridge.api.v1.dependencies import get_current_user, get_export_college_id
+from campus_bridge.data.database.session import read_only
+from campus_bridge.data.enums.export import ExportFormatEnum
 from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.models import User
 from campus_bridge.data.schemas.alumni import (
-    AlumniResponse,
+    AlumniDirectoryPage,
+    AlumniProfileResponse,
+    AlumniRecommendation,
     CreateAlumni,
     UpdateAlumni,
     UpdateAlumniResponse,
@@ -21,7 +25,37 @@ from campus_bridge.modules.alumni.service.alumni_service import (
 router = APIRouter(prefix="/alumni", tags=["Alumni"])
 
 
-@router.get("/me", status_code=status.HTTP_200_OK, response_model=AlumniResponse)
+def get_directory_filters(
+    company: str | None = Query(None, description="Filter by company"),
+    designation: str | None = Query(
+        None, min_length=1, description="Filter by designation prefix"
+    ),
+    graduation_year_from: int | None = Query(
+        None, description="Graduated in or after this year"
+    ),
+    graduation_year_to: int | None = Query(
+        None, description="Graduated in or before this year"
+    ),
+    min_experience_years: int | None = Query(
+        None, ge=0, description="At least this many years of experience"
+    ),
+    is_available: bool | None = Query(
+        None, description="Filter by availability for mentorship"
+    ),
+) -> dict:
+    """Dependency to collect the alumni directory filters"""
+    return dict(
+        company=company,
+        designation=designation,
+        graduation_year_from=graduation_year_from,
+        graduation_year_to=graduation_year_to,
+        min_experience_years=min_experience_years,
+        is_available=is_available,
+    )
+
+
+@router.get("/me", status_code=status.HTTP_200_OK, response_model=AlumniProfileResponse)
+@read_only()
 async def get_current_alumni(
     current_user: User = Depends(get_current_user),
     alumni_service: AlumniService = Depends(get_alumni_service),
@@ -30,24 +64,32 @@ async def get_current_alumni(
     return await alumni_service.get_current_alumni(current_user)
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[AlumniResponse])
+@router.get("/", status_code=status.HTTP_200_OK, response_model=AlumniDirectoryPage)
+@read_only(snapshot=True)
 async def get_all_alumni(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(None, description="Cursor for pagination"),
+    filters: dict = Depends(get_directory_filters),
     current_user: User = Depends(get_current_user),
     alumni_service: AlumniService = Depends(get_alumni_service),
 ):
-    """Get all alumni"""
+    """Get a page of alumni of every college. Admin only."""
     if current_user.role != RoleEnum.ADMIN:
         raise UnauthorizedError(obj="alumni", act="get_all_alumni_by_admin_only")
-    return await alumni_service.get_all_alumni()
+    return await alumni_service.get_alumni_directory(
+        limit=limit, cursor=cursor, **filters
+    )
 
 
 @router.get(
-    "/college", status_code=status.HTTP_200_OK, response_model=list[AlumniResponse]
+    "/college", status_code=status.HTTP_200_OK, response_model=AlumniDirectoryPage
 )
+@read_only(snapshot=True)
 async def get_all_alumni_by_college(
     college_id: Optional[UUID] = Query(None),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(20, ge=1, le=100),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor for pagination"),
+    filters: dict = Depends(get_directory_filters),
     current_user: User = Depends(get_current_user),
     alumni_service: AlumniService = Depends(get_alumni_service),
 ):
@@ -65,12 +107,43 @@ async def get_all_alumni_by_college(
     else:
         target_college_id = current_user.college_id
 
-    return await alumni_service.get_all_alumni_by_college(
-        college_id=target_college_id, skip=skip, limit=limit
+    return await alumni_service.get_alumni_directory(
+        limit=limit, cursor=cursor, college_id=target_college_id, **filters
     )
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED, response_model=AlumniResponse)
+@router.get(
+    "/recommended",
+    status_code=status.HTTP_200_OK,
+    response_model=list[AlumniRecommendation],
+)
+@read_only()
+async def get_recommended_alumni(
+    limit: int = Query(default=10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    alumni_service: AlumniService = Depends(get_alumni_service),
+):
+    """Get available alumni of the current student's college to mentor them"""
+    if current_user.role != RoleEnum.STUDENT:
+        raise UnauthorizedError(obj="alumni", act="get_recommended_alumni")
+    return await alumni_service.get_recommended_mentors(current_user, limit=limit)
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_alumni(
+    format: ExportFormatEnum = Query(ExportFormatEnum.CSV, description="File format"),
+    college_id: UUID | None = Depends(get_export_college_id),
+    alumni_service: AlumniService = Depends(get_alumni_service),
+):
+    """Download alumni as CSV or Parquet. Admins and officials of the college."""
+    return await alumni_service.export_alumni(
+        college_id=college_id, export_format=format
+    )
+
+
+@router.post(
+    "/", status_code=status.HTTP_201_CREATED, response_model=AlumniProfileResponse
+)
 async def create_alumni(
     alumni: CreateAlumni,
     current_user: User = Depends(get_current_user),
@@ -124,9 +197,9 @@ async def update_alumni(
     if alumni_id and (
         current_user.role == RoleEnum.ADMIN or current_user.role == RoleEnum.OFFICIALS
     ):
-        return await alumni_service.update_alumni(alumni, alumni_id)
+        return await alumni_service.update_alumni(alumni, alumni_id=alumni_id)
     # update current user's alumni profile only for alumni
-    return await alumni_service.update_alumni(alumni, current_user.id)
+    return await alumni_service.update_alumni(alumni, user_id=current_user.id)
 
 
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
@@ -144,5 +217,5 @@ async def delete_alumni(
     if alumni_id and (
         current_user.role == RoleEnum.ADMIN or current_user.role == RoleEnum.OFFICIALS
     ):
-        return await alumni_service.delete_alumni(alumni_id)
-    return await alumni_service.delete_alumni(current_user.id)
+        return await alumni_service.delete_alumni(alumni_id=alumni_id)
+    return await alumni_service.delete_alumni(user_id=current_user.id)
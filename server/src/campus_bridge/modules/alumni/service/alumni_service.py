@@ -1,13 +1,65 @@
 from uuid import UUID
 
+import structlog
 from fastapi import Depends
+from fastapi.responses import StreamingResponse
 
+from campus_bridge.config.settings import settings
+from campus_bridge.data.enums.export import ExportFormatEnum
+from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.models import Alumni, User
-from campus_bridge.data.schemas.alumni import AlumniResponse, CreateAlumni, UpdateAlumni
+from campus_bridge.data.schemas.alumni import (
+    AlumniCompanyCount,
+    AlumniDirectoryPage,
+    AlumniFacets,
+    AlumniProfileResponse,
+    AlumniRecommendation,
+    AlumniResponse,
+    AlumniYearCount,
+    CreateAlumni,
+    UpdateAlumni,
+)
+from campus_bridge.errors.exc import NotFoundError
 from campus_bridge.modules.alumni.repository.alumni_repository import (
     AlumniRepository,
     get_alumni_repository,
 )
+from campus_bridge.modules.alumni.service.facet_cache import (
+    CompanyFacetCache,
+    company_facet_cache,
+)
+from campus_bridge.modules.alumni.service.mentor_matcher import (
+    MentorMatcher,
+    mentor_matcher,
+)
+from campus_bridge.modules.search.service.people_index import (
+    PeopleIndex,
+    Person,
+    people_index,
+)
+from campus_bridge.modules.uploads.service.thumbnail_service import (
+    ThumbnailService,
+    thumbnail_service,
+)
+from campus_bridge.utils.cursor_pagination import encode_cursor
+from campus_bridge.utils.export_stream import ExportColumn, export_response
+
+logger = structlog.stdlib.get_logger(__name__)
+
+ALUMNI_EXPORT_COLUMNS = [
+    ExportColumn("id"),
+    ExportColumn("user_id"),
+    ExportColumn("email"),
+    ExportColumn("phone"),
+    ExportColumn("graduation_year", "int"),
+    ExportColumn("company"),
+    ExportColumn("designation"),
+    ExportColumn("experience_years", "int"),
+    ExportColumn("expertise_areas", "json"),
+    ExportColumn("is_available", "bool"),
+    ExportColumn("is_verified", "bool"),
+    ExportColumn("created_at", "datetime"),
+]
 
 
 class AlumniService:
@@ -15,34 +67,134 @@ class AlumniService:
     def __init__(
         self,
         alumni_repository: AlumniRepository,
+        mentor_matcher: MentorMatcher,
+        company_facet_cache: CompanyFacetCache,
+        thumbnail_service: ThumbnailService,
+        people_index: PeopleIndex,
     ):
         self.alumni_repository = alumni_repository
+        self.mentor_matcher = mentor_matcher
+        self.company_facet_cache = company_facet_cache
+        self.thumbnail_service = thumbnail_service
+        self.people_index = people_index
+
+    async def _sync_people_index(self, alumni: Alumni) -> None:
+        # only verified alumni are searchable, by email as they have no name
+        email = None
+        if alumni.is_verified:
+            email = await self.alumni_repository.get_user_email(alumni.user_id)
+        if email is None:
+            self.people_index.remove(alumni.college_id, alumni.user_id)
+            return
+        self.people_index.upsert(
+            alumni.college_id,
+            Person(alumni.user_id, RoleEnum.ALUMNI, email, None, None),
+        )
 
-    async def get_current_alumni(self, current_alumni: User) -> AlumniResponse:
+    async def _response(self, alumni: Alumni) -> AlumniProfileResponse:
+        response = AlumniProfileResponse.model_validate(alumni)
+        await self.thumbnail_service.fill_urls([(response, response.id_card_url)])
+        return response
+
+    async def get_current_alumni(self, current_alumni: User) -> AlumniProfileResponse:
         """Get the current alumni profile"""
 
-        return await self.alumni_repository.get_current_alumni(current_alumni.id)
+        alumni = await self.alumni_repository.get_current_alumni(current_alumni.id)
+        if not alumni:
+            raise NotFoundError(resource="Alumni", identifier=current_alumni.id)
+        return await self._response(alumni)
 
-    async def get_all_alumni(self) -> list[AlumniResponse]:
-        """Get all alumni profiles"""
+    async def get_alumni_directory(
+        self,
+        limit: int,
+        cursor: str | None,
+        college_id: UUID | None = None,
+        company: str | None = None,
+        designation: str | None = None,
+        graduation_year_from: int | None = None,
+        graduation_year_to: int | None = None,
+        min_experience_years: int | None = None,
+        is_available: bool | None = None,
+    ) -> AlumniDirectoryPage:
+        """Get a page of alumni, of one college or all, filtered"""
+        filters = dict(
+            college_id=college_id,
+            company=company,
+            designation=designation,
+            graduation_year_from=graduation_year_from,
+            graduation_year_to=graduation_year_to,
+            min_experience_years=min_experience_years,
+            is_available=is_available,
+        )
+
+        # one extra row tells whether there is a next page
+        alumni = await self.alumni_repository.get_alumni_page(
+            limit=limit + 1, cursor=cursor, **filters
+        )
+
+        next_cursor = None
+        if len(alumni) > limit:
+            alumni = alumni[:limit]
+            next_cursor = encode_cursor(alumni[-1].created_at, alumni[-1].id)
+
+        page = AlumniDirectoryPage(
+            items=[AlumniResponse.model_validate(row) for row in alumni],
+            next_cursor=next_cursor,
+        )
 
-        return await self.alumni_repository.get_all_alumni()
+        # the total and facets only change the header of the listing
+        if cursor is None:
+            cap = settings.DIRECTORY_COUNT_CAP
+            if next_cursor is None:
+                total = len(alumni)
+            else:
+                total = await self.alumni_repository.count_alumni(cap=cap, **filters)
+            page.total = min(total, cap)
+            page.is_total_capped = total > cap
 
-    async def get_all_alumni_by_college(
-        self, college_id: UUID | None = None, skip: int = 0, limit: int = 100
-    ) -> list[AlumniResponse]:
-        """Get all alumni of a college"""
+            if college_id is not None:
+                page.facets = await self._facets(college_id)
 
-        return await self.alumni_repository.get_all_alumni_by_college(
-            college_id=college_id, skip=skip, limit=limit
+        logger.info(
+            "Alumni found",
+            college_id=str(college_id) if college_id else None,
+            alumni_count=len(alumni),
+        )
+        return page
+
+    async def _facets(self, college_id: UUID) -> AlumniFacets:
+        companies = self.company_facet_cache.get(college_id)
+        if companies is None:
+            companies = await self.alumni_repository.get_company_counts(
+                college_id, limit=settings.ALUMNI_FACET_TOP_COMPANIES
+            )
+            self.company_facet_cache.store(college_id, companies)
+
+        # kept exact by the college stats triggers, no scan needed
+        years = await self.alumni_repository.get_graduation_year_counts(college_id)
+        return AlumniFacets(
+            companies=[
+                AlumniCompanyCount(company=company, count=count)
+                for company, count in companies
+            ],
+            graduation_years=[
+                AlumniYearCount(graduation_year=year, count=count)
+                for year, count in years
+            ],
         )
 
     async def create_alumni(
         self, alumni: CreateAlumni, user_id: UUID
-    ) -> AlumniResponse:
+    ) -> AlumniProfileResponse:
         """Create a new alumni profile"""
+        college_id = await self.alumni_repository.get_user_college_id(user_id)
+        if not college_id:
+            logger.error("User not found", user_id=str(user_id))
+            raise NotFoundError(resource="User", identifier=user_id)
+
         alumni_db = Alumni(
             user_id=user_id,
+            college_id=college_id,
             graduation_year=alumni.graduation_year,
             company=alumni.company,
             designation=alumni.designation,
@@ -52,34 +204,104 @@ class AlumniService:
         )
 
         alumni = await self.alumni_repository.create_alumni(alumni_db)
-        return AlumniResponse.model_validate(alumni)
+        self.company_facet_cache.invalidate(college_id)
+        await self._sync_people_index(alumni)
+        return await self._response(alumni)
 
     async def update_alumni(
-        self, alumni: UpdateAlumni, user_id: UUID
-    ) -> AlumniResponse:
-        """Update an alumni profile"""
-        alumni_db = Alumni(
-            user_id=user_id,
-            graduation_year=alumni.graduation_year,
-            company=alumni.company,
-            designation=alumni.designation,
-            experience_years=alumni.experience_years,
-            expertise_areas=alumni.expertise_areas,
-            is_available=alumni.is_available,
-        )
+        self,
+        alumni: UpdateAlumni,
+        alumni_id: UUID | None = None,
+        user_id: UUID | None = None,
+    ) -> AlumniProfileResponse:
+        """Update an alumni profile, by its id or its user's id"""
+        alumni_db = await self._get_alumni(alumni_id=alumni_id, user_id=user_id)
 
         for key, value in alumni.model_dump(exclude_unset=True).items():
             setattr(alumni_db, key, value)
 
+        college_id = alumni_db.college_id
         alumni = await self.alumni_repository.update_alumni(alumni_db)
-        return AlumniResponse.model_validate(alumni)
+        self.mentor_matcher.invalidate(college_id)
+        self.company_facet_cache.invalidate(college_id)
+        await self._sync_people_index(alumni)
+        return await self._response(alumni)
 
-    async def delete_alumni(self, alumni_id: UUID) -> None:
-        """Delete an alumni profile"""
-        await self.alumni_repository.delete_alumni(alumni_id)
+    async def delete_alumni(
+        self, alumni_id: UUID | None = None, user_id: UUID | None = None
+    ) -> None:
+        """Delete an alumni profile, by its id or its user's id"""
+        alumni_db = await self._get_alumni(alumni_id=alumni_id, user_id=user_id)
+        await self.alumni_repository.delete_alumni(alumni_db.id)
+        self.mentor_matcher.invalidate(alumni_db.college_id)
+        self.company_facet_cache.invalidate(alumni_db.college_id)
+        self.people_index.remove(alumni_db.college_id, alumni_db.user_id)
+
+    async def _get_alumni(self, alumni_id: UUID | None, user_id: UUID | None) -> Alumni:
+        alumni_db = await self.alumni_repository.get_alumni(
+            alumni_id=alumni_id, user_id=user_id
+        )
+        if not alumni_db:
+            logger.error(
+                "Alumni not found",
+                alumni_id=str(alumni_id) if alumni_id else None,
+                user_id=str(user_id) if user_id else None,
+            )
+            raise NotFoundError(resource="Alumni", identifier=alumni_id or user_id)
+        return alumni_db
+
+    async def get_recommended_mentors(
+        self, user: User, limit: int
+    ) -> list[AlumniRecommendation]:
+        """Available alumni of the student's college ranked as their mentors"""
+        student = await self.alumni_repository.get_student_profile(user.id)
+        if not student:
+            logger.error("Student not found", user_id=str(user.id))
+            raise NotFoundError(resource="Student", identifier=user.id)
+
+        matches = await self.mentor_matcher.recommend(
+            self.alumni_repository,
+            college_id=user.college_id,
+            student_id=student.id,
+            interests=student.interests,
+            branch=student.branch,
+            limit=limit,
+        )
+        logger.info(
+            "Mentor recommendations found",
+            student_id=str(student.id),
+            count=len(matches),
+        )
+        return [AlumniRecommendation(**match._asdict()) for match in matches]
+
+    async def export_alumni(
+        self, college_id: UUID | None, export_format: ExportFormatEnum
+    ) -> StreamingResponse:
+        """Stream alumni, of one college or all, as a CSV or Parquet file"""
+        rows = await self.alumni_repository.stream_alumni_for_export(
+            college_id=college_id, batch_size=settings.EXPORT_BATCH_SIZE
+        )
+        logger.info(
+            "Exporting alumni",
+            college_id=str(college_id) if college_id else None,
+            format=export_format.value,
+        )
+        return export_response(
+            rows,
+            ALUMNI_EXPORT_COLUMNS,
+            export_format,
+            filename=f"alumni-{college_id or 'all'}",
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
 
 
 def get_alumni_service(
     alumni_repository: AlumniRepository = Depends(get_alumni_repository),
 ) -> AlumniService:
-    return AlumniService(alumni_repository)
+    return AlumniService(
+        alumni_repository,
+        mentor_matcher=mentor_matcher,
+        company_facet_cache=company_facet_cache,
+        thumbnail_service=thumbnail_service,
+        people_index=people_index,
+    )
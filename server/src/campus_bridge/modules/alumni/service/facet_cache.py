@@ -0,0 +1,39 @@
+import time
+from uuid import UUID
+
+from campus_bridge.config.settings import settings
+
+
+class CompanyFacetCache:
+    """
+    Per-worker cache of every college's most common alumni companies.
+
+    The counts are a GROUP BY over the college company index, cheap but
+    still proportional to the college, so they are kept for `ttl_seconds`
+    and dropped early when an alumni profile of the college changes on
+    this worker.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._companies: dict[UUID, tuple[float, list]] = {}
+
+    def get(self, college_id: UUID) -> list | None:
+        """Cached (company, count) rows of a college, None when stale"""
+        cached = self._companies.get(college_id)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] > self.ttl_seconds:
+            del self._companies[college_id]
+            return None
+        return cached[1]
+
+    def store(self, college_id: UUID, companies: list) -> None:
+        self._companies[college_id] = (time.monotonic(), companies)
+
+    def invalidate(self, college_id: UUID) -> None:
+        """Drop a college's counts after one of its alumni changed"""
+        self._companies.pop(college_id, None)
+
+
+company_facet_cache = CompanyFacetCache(ttl_seconds=settings.ALUMNI_FACET_TTL_SECONDS)
@@ -0,0 +1,168 @@
+import asyncio
+from datetime import date
+from typing import NamedTuple
+from uuid import UUID
+
+import numpy as np
+import structlog
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.modules.alumni.repository.alumni_repository import AlumniRepository
+from campus_bridge.utils.college_cache import CollegeCache
+from campus_bridge.utils.interests import interest_tags
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# score = EXPERTISE_WEIGHT * cosine(interests, expertise)
+#       + BRANCH_WEIGHT * (student's branch among the expertise tags)
+#       + RECENCY_WEIGHT * 0.5 ** (years since graduation / half life)
+EXPERTISE_WEIGHT = 1.0
+BRANCH_WEIGHT = 0.25
+RECENCY_WEIGHT = 0.25
+RECENCY_HALF_LIFE_YEARS = 5.0
+
+
+class MentorMatch(NamedTuple):
+    alumni_id: UUID
+    user_id: UUID
+    graduation_year: int
+    company: str
+    designation: str
+    experience_years: int
+    score: float
+    shared_expertise: list[str]
+
+
+class _CollegeMentors:
+    """Inverted index from expertise tag to a college's available alumni"""
+
+    def __init__(self, rows: list, current_year: int):
+        self.profiles = [row[:6] for row in rows]
+        self.tags = [interest_tags(row[6]) for row in rows]
+        self.cache: dict[UUID, tuple[tuple, list[MentorMatch]]] = {}
+
+        postings: dict[str, list[int]] = {}
+        for i, tags in enumerate(self.tags):
+            for tag in tags:
+                postings.setdefault(tag, []).append(i)
+        self.postings = {
+            tag: np.array(alumni, dtype=np.int32) for tag, alumni in postings.items()
+        }
+
+        self.norms = np.sqrt(
+            np.maximum(np.array([len(tags) for tags in self.tags], dtype=np.float32), 1)
+        )
+        years_out = np.maximum(
+            current_year - np.array([row[2] for row in rows], dtype=np.float32), 0
+        )
+        self.recency = (0.5 ** (years_out / RECENCY_HALF_LIFE_YEARS)).astype(np.float32)
+
+    def top_k(
+        self, interests: frozenset[str], branch: BranchEnum, k: int
+    ) -> list[MentorMatch]:
+        hits = [self.postings[tag] for tag in interests if tag in self.postings]
+        branch_rows = self.postings.get(branch.value.lower())
+        if not hits and branch_rows is None:
+            return []
+
+        # posting lists are counted, not sorted, and only alumni on one of
+        # them are scored
+        n = len(self.profiles)
+        overlap = (
+            np.bincount(np.concatenate(hits), minlength=n)
+            if hits
+            else np.zeros(n, dtype=np.int64)
+        )
+        in_branch = np.zeros(n, dtype=bool)
+        if branch_rows is not None:
+            in_branch[branch_rows] = True
+        candidates = np.flatnonzero(overlap | in_branch)
+
+        scores = (
+            EXPERTISE_WEIGHT
+            * overlap[candidates]
+            / (self.norms[candidates] * np.sqrt(max(len(interests), 1)))
+            + RECENCY_WEIGHT * self.recency[candidates]
+            + BRANCH_WEIGHT * in_branch[candidates]
+        )
+
+        top = np.arange(len(candidates))
+        if len(top) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [
+            MentorMatch(
+                *self.profiles[candidates[i]],
+                score=round(float(scores[i]), 4),
+                shared_expertise=sorted(self.tags[candidates[i]] & interests),
+            )
+            for i in top
+        ]
+
+
+class MentorMatcher:
+    """
+    Per-worker mentor recommendations for students.
+
+    Each college's verified, available alumni are indexed once by expertise
+    tag; a student is scored only against the alumni sharing a tag with
+    their interests or branch. A student's top matches are cached until
+    their interests or branch change, or the college is invalidated by an
+    alumni profile change on this worker or outlives the TTL, which also
+    picks up changes made on other workers. At most `max_colleges` indexes
+    are kept, least recently used out first.
+    """
+
+    def __init__(self, max_colleges: int, ttl_seconds: int, top_k: int):
+        self.top_k = top_k
+        self._colleges: CollegeCache[_CollegeMentors] = CollegeCache(
+            max_colleges=max_colleges, ttl_seconds=ttl_seconds
+        )
+
+    async def _build(
+        self, repository: AlumniRepository, college_id: UUID
+    ) -> _CollegeMentors:
+        rows = await repository.get_mentor_profiles(college_id)
+        college = await asyncio.to_thread(_CollegeMentors, rows, date.today().year)
+        logger.debug(
+            "mentor_index_built",
+            college_id=str(college_id),
+            alumni=len(rows),
+            tags=len(college.postings),
+        )
+        return college
+
+    async def recommend(
+        self,
+        repository: AlumniRepository,
+        college_id: UUID,
+        student_id: UUID,
+        interests: dict,
+        branch: BranchEnum,
+        limit: int,
+    ) -> list[MentorMatch]:
+        """Available alumni of the college ranked as mentors for a student"""
+        college = await self._colleges.get(
+            college_id, lambda: self._build(repository, college_id)
+        )
+        tags = interest_tags(interests)
+        cached = college.cache.get(student_id)
+        if cached is None or cached[0] != (tags, branch):
+            cached = college.cache[student_id] = (
+                (tags, branch),
+                college.top_k(tags, branch, self.top_k),
+            )
+        return cached[1][:limit]
+
+    def invalidate(self, college_id: UUID) -> None:
+        """Drop a college's index and cached matches after an alumni change"""
+        self._colleges.invalidate(college_id)
+
+
+mentor_matcher = MentorMatcher(
+    max_colleges=settings.MENTOR_MATCH_MAX_COLLEGES,
+    ttl_seconds=settings.MENTOR_MATCH_TTL_SECONDS,
+    top_k=settings.MENTOR_MATCH_TOP_K,
+)
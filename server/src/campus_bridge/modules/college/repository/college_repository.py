@@ -2,10 +2,12 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from campus_bridge.data.database.session import get_async_session
+from campus_bridge.data.enums.state import StateEnum
 from campus_bridge.data.models.college import College
 from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
 
@@ -15,15 +17,41 @@ class CollegeRepository:
         self.db = db
 
     @sqlalchemy_exceptions
-    async def create_colleges(self, colleges: list[College]) -> list[College]:
-        """Create a single or multiple college at a time"""
-        self.db.add_all(colleges)
-        await self.db.flush()
-
-        for college in colleges:
-            await self.db.refresh(college)
+    async def upsert_colleges(self, colleges: list[dict], update: bool) -> list:
+        """
+        Insert colleges, or on a (name, city, state) clash update the existing
+        college when `update` is set and skip it otherwise.
 
-        return colleges
+        An update sets is_government and brings back a deleted college; one
+        that would change nothing is skipped. Returns the inserted and updated
+        colleges with an `inserted` flag, skipped ones are left out. Rows must
+        not repeat a (name, city, state) among themselves.
+        """
+        stmt = insert(College)
+        if update:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["name", "city", "state"],
+                set_={
+                    "is_government": stmt.excluded.is_government,
+                    "is_deleted": False,
+                    "updated_at": func.now(),
+                },
+                where=College.is_deleted
+                | (College.is_government != stmt.excluded.is_government),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["name", "city", "state"])
+        # xmax is only set on a row version that replaced another one
+        result = await self.db.execute(
+            stmt.returning(
+                *College.__table__.columns,
+                (literal_column("xmax") == 0).label("inserted"),
+            ),
+            colleges,
+        )
+        rows = result.all()
+        await self.db.commit()
+        return rows
 
     @sqlalchemy_exceptions
     async def get_college_by_id(
@@ -42,6 +70,39 @@ class CollegeRepository:
         result = await self.db.execute(select(College).where(~College.is_deleted))
         return result.scalars().all()
 
+    @sqlalchemy_exceptions
+    async def search_colleges(
+        self, query: str, state: StateEnum | None, limit: int
+    ) -> list[UUID]:
+        """
+        Get ids of the colleges whose name has a word similar to the query,
+        most similar first (served by the pg_trgm index)
+        """
+        stmt = select(College.id).where(
+            ~College.is_deleted, College.name.op("%>")(query)
+        )
+        if state is not None:
+            stmt = stmt.where(College.state == state)
+        result = await self.db.execute(
+            stmt.order_by(
+                func.word_similarity(query, College.name).desc(), College.name
+            ).limit(limit)
+        )
+        return result.scalars().all()
+
+    @sqlalchemy_exceptions
+    async def get_catalog_version(self) -> tuple:
+        """
+        Get a fingerprint of the colleges table, deleted ones included, that
+        changes on every create, update and soft delete.
+        """
+        # a sum rather than max(updated_at): now() is the transaction start,
+        # so an update can commit after a newer one with an older timestamp
+        result = await self.db.execute(
+            select(func.count(), func.sum(func.extract("epoch", College.updated_at)))
+        )
+        return tuple(result.one())
+
     @sqlalchemy_exceptions
     async def update_college(self, college: College) -> College:
         """Partially update college"""
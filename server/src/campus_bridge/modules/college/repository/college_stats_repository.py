@@ -0,0 +1,140 @@
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import delete, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from campus_bridge.data.database.session import get_async_session
+from campus_bridge.data.models import (
+    Alumni,
+    College,
+    CollegeAlumniStat,
+    CollegeRoleStat,
+    CollegeStudentStat,
+    Student,
+    User,
+)
+from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
+
+CollegeStat = type[CollegeRoleStat] | type[CollegeStudentStat] | type[CollegeAlumniStat]
+
+STATS_KEYS = {
+    CollegeRoleStat: ("role",),
+    CollegeStudentStat: ("branch", "year_of_study"),
+    CollegeAlumniStat: ("graduation_year",),
+}
+
+
+def _source_counts(model: CollegeStat, college_id: UUID):
+    # must count exactly what the triggers of the stats tables count
+    if model is CollegeRoleStat:
+        return (
+            select(User.role, func.count(), func.count().filter(User.is_verified))
+            .where(User.college_id == college_id, ~User.is_deleted)
+            .group_by(User.role)
+        )
+    if model is CollegeStudentStat:
+        return (
+            select(
+                Student.branch,
+                Student.year_of_study,
+                func.count(),
+                func.count().filter(Student.is_verified),
+            )
+            .where(Student.college_id == college_id)
+            .group_by(Student.branch, Student.year_of_study)
+        )
+    return (
+        select(
+            Alumni.graduation_year,
+            func.count(),
+            func.count().filter(Alumni.is_verified),
+        )
+        .where(Alumni.college_id == college_id)
+        .group_by(Alumni.graduation_year)
+    )
+
+
+class CollegeStatsRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @sqlalchemy_exceptions
+    async def get_stats(self, model: CollegeStat, college_id: UUID) -> list:
+        """Get (*keys, total, verified) rows of one stats table for a college"""
+        keys = [getattr(model, key) for key in STATS_KEYS[model]]
+        result = await self.db.execute(
+            select(*keys, model.total, model.verified)
+            .where(model.college_id == college_id)
+            .order_by(*keys)
+        )
+        return result.all()
+
+    @sqlalchemy_exceptions
+    async def get_college_ids(self) -> list[UUID]:
+        """Get ids of every college that is not deleted"""
+        result = await self.db.execute(select(College.id).where(~College.is_deleted))
+        return result.scalars().all()
+
+    @sqlalchemy_exceptions
+    async def reconcile(self, model: CollegeStat, college_id: UUID) -> int:
+        """
+        Recount one stats table of a college from its source table and fix
+        the rows that drifted. Returns how many rows were fixed.
+
+        The stats table is locked against writers first, so a profile write
+        is either part of the recount or applies its delta after it, never
+        both or neither.
+        """
+        await self.db.execute(
+            text(f"LOCK TABLE {model.__tablename__} IN SHARE ROW EXCLUSIVE MODE")
+        )
+        key_names = STATS_KEYS[model]
+
+        stored = {
+            tuple(row[:-2]): tuple(row[-2:])
+            for row in await self.get_stats(model, college_id)
+        }
+        counted = {
+            tuple(row[:-2]): tuple(row[-2:])
+            for row in (await self.db.execute(_source_counts(model, college_id)))
+        }
+
+        changed = [
+            {
+                "college_id": college_id,
+                **dict(zip(key_names, key)),
+                "total": total,
+                "verified": verified,
+            }
+            for key, (total, verified) in counted.items()
+            if stored.get(key) != (total, verified)
+        ]
+        stale = [key for key in stored if key not in counted]
+
+        if changed:
+            stmt = insert(model)
+            await self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["college_id", *key_names],
+                    set_={
+                        "total": stmt.excluded.total,
+                        "verified": stmt.excluded.verified,
+                    },
+                ),
+                changed,
+            )
+        if stale:
+            keys = tuple_(*(getattr(model, key) for key in key_names))
+            await self.db.execute(
+                delete(model).where(model.college_id == college_id, keys.in_(stale))
+            )
+        await self.db.commit()
+        return len(changed) + len(stale)
+
+
+def get_college_stats_repository(
+    db: AsyncSession = Depends(get_async_session),
+) -> CollegeStatsRepository:
+    return CollegeStatsRepository(db)
@@ -1,13 +1,19 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Query, Request, status
 
-from campus_bridge.api.v1.dependencies import get_current_user
+from campus_bridge.api.v1.dependencies import get_current_user, require_admin
+from campus_bridge.data.database.session import read_only
 from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.data.enums.state import StateEnum
 from campus_bridge.data.models.user import User
 from campus_bridge.data.schemas.college import (
+    CollegeCreateResponse,
     CollegeDeleteResponse,
+    CollegeImportResponse,
     CollegeResponse,
+    CollegeSearchResult,
+    CollegeStatsResponse,
     CollegeUpdateRequest,
     CreateCollegeRequest,
 )
@@ -16,12 +22,28 @@ from campus_bridge.modules.college.service.college_service import (
     CollegeService,
     get_college_service,
 )
+from campus_bridge.utils.multipart_stream import file_field_openapi
 
 router = APIRouter(prefix="/college", tags=["college"])
+# no login needed, clients look up a college_id before registering
+public_router = APIRouter(prefix="/college", tags=["college"])
+
+
+@public_router.get(
+    "/search", status_code=status.HTTP_200_OK, response_model=list[CollegeSearchResult]
+)
+async def search_colleges(
+    q: str = Query(min_length=2, max_length=100, description="Name or city prefix"),
+    state: StateEnum | None = Query(default=None, description="Only this state"),
+    limit: int = Query(default=10, ge=1, le=50),
+    college_service: CollegeService = Depends(get_college_service),
+):
+    """Autocomplete colleges by name and city"""
+    return await college_service.search_colleges(q, state=state, limit=limit)
 
 
 @router.post(
-    "", response_model=list[CollegeResponse], status_code=status.HTTP_201_CREATED
+    "", response_model=CollegeCreateResponse, status_code=status.HTTP_201_CREATED
 )
 async def create_colleges(
     payload: list[CreateCollegeRequest],
@@ -34,6 +56,33 @@ async def create_colleges(
     return await college_service.create_colleges(payload=payload)
 
 
+@router.post(
+    "/import",
+    status_code=status.HTTP_200_OK,
+    response_model=CollegeImportResponse,
+    openapi_extra=file_field_openapi("file"),
+)
+async def import_colleges(
+    request: Request,
+    update_existing: bool = Query(
+        default=True,
+        description="Update colleges already there instead of skipping them",
+    ),
+    admin_user: User = Depends(require_admin),
+    college_service: CollegeService = Depends(get_college_service),
+):
+    """
+    Bulk upsert colleges from a CSV file. Admin only.
+
+    Columns: name, city, state, is_government. A college is matched on
+    name, city and state.
+    """
+    if admin_user:
+        return await college_service.import_colleges(
+            request, update_existing=update_existing
+        )
+
+
 @router.patch(
     "/{college_id}", response_model=CollegeResponse, status_code=status.HTTP_200_OK
 )
@@ -65,26 +114,52 @@ async def delete_college(
     return await college_service.delete_college(college_id=college_id)
 
 
+@router.get(
+    "/{college_id}/stats",
+    response_model=CollegeStatsResponse,
+    status_code=status.HTTP_200_OK,
+)
+@read_only()
+async def get_college_stats(
+    college_id: UUID,
+    current_user: User = Depends(get_current_user),
+    college_service: CollegeService = Depends(get_college_service),
+):
+    """Cohort counts of a college. Admin, or officials of the college."""
+    if current_user.role != RoleEnum.ADMIN and (
+        current_user.role != RoleEnum.OFFICIALS or current_user.college_id != college_id
+    ):
+        raise UnauthorizedError(obj="college", act="get_college_stats")
+
+    return await college_service.get_college_stats(college_id=college_id)
+
+
 @router.get(
     "/{college_id}", response_model=CollegeResponse, status_code=status.HTTP_200_OK
 )
+@read_only()
 async def get_college_by_id(
     college_id: UUID,
+    if_none_match: str | None = Header(default=None),
     current_user: User = Depends(get_current_user),
     college_service: CollegeService = Depends(get_college_service),
 ):
     if current_user.role != RoleEnum.ADMIN:
         raise UnauthorizedError(obj="college", act="get_single_college")
 
-    return await college_service.get_college_by_id(college_id=college_id)
+    return await college_service.get_college_by_id(
+        college_id=college_id, if_none_match=if_none_match
+    )
 
 
 @router.get("", response_model=list[CollegeResponse], status_code=status.HTTP_200_OK)
+@read_only()
 async def get_all_college(
+    if_none_match: str | None = Header(default=None),
     current_user: User = Depends(get_current_user),
     college_service: CollegeService = Depends(get_college_service),
 ):
     if current_user.role != RoleEnum.ADMIN:
         raise UnauthorizedError(obj="college", act="get_all_college")
 
-    return await college_service.get_all_college()
+    return await college_service.get_all_college(if_none_match=if_none_match)
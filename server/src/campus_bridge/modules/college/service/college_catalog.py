@@ -0,0 +1,145 @@
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping
+from uuid import UUID
+
+import structlog
+from pydantic import TypeAdapter
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.core import AsyncSessionLocal
+from campus_bridge.data.models.college import College
+from campus_bridge.data.schemas.college import CollegeResponse
+from campus_bridge.modules.college.repository.college_repository import (
+    CollegeRepository,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+_college_list = TypeAdapter(list[CollegeResponse])
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogSnapshot:
+    """Every college that is not deleted, serialized once"""
+
+    # fingerprint of the table it was loaded from, None after a local write
+    version: tuple | None
+    colleges: Mapping[UUID, CollegeResponse]
+    # college id -> (json, etag)
+    items: Mapping[UUID, tuple[bytes, str]]
+    list_json: bytes
+    list_etag: str
+
+    @classmethod
+    def build(
+        cls, colleges: Iterable[CollegeResponse], version: tuple | None
+    ) -> "CatalogSnapshot":
+        ordered = sorted(colleges, key=lambda college: (college.name, college.id))
+        items = {}
+        for college in ordered:
+            body = college.model_dump_json().encode()
+            items[college.id] = (body, _etag(body))
+        list_json = _college_list.dump_json(ordered)
+        return cls(
+            version=version,
+            colleges=MappingProxyType({college.id: college for college in ordered}),
+            items=MappingProxyType(items),
+            list_json=list_json,
+            list_etag=_etag(list_json),
+        )
+
+
+class CollegeCatalog:
+    """
+    Per-worker copy of the college catalog.
+
+    Reads are served from an immutable snapshot that is replaced whole, never
+    changed in place, so a request sees one consistent catalog. Admin writes
+    on this worker swap in a new snapshot straight away; every
+    `refresh_interval_seconds` the table's fingerprint is compared with the
+    snapshot's and the catalog reloaded when they differ, which picks up
+    writes made on other workers and undoes local writes that rolled back.
+    """
+
+    def __init__(self, refresh_interval_seconds: float):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._snapshot: CatalogSnapshot | None = None
+        self._lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def snapshot(self) -> CatalogSnapshot:
+        """The current catalog, loaded on first use"""
+        if self._snapshot is None:
+            await self.refresh()
+        return self._snapshot
+
+    async def refresh(self) -> bool:
+        """Reload the catalog if the table changed, returns whether it did"""
+        async with self._lock:
+            async with AsyncSessionLocal() as session:
+                repository = CollegeRepository(session)
+                version = await repository.get_catalog_version()
+                if self._snapshot is not None and self._snapshot.version == version:
+                    return False
+                colleges = await repository.get_all_college()
+
+            self._snapshot = CatalogSnapshot.build(
+                (CollegeResponse.model_validate(college) for college in colleges),
+                version,
+            )
+        logger.debug("college_catalog_loaded", colleges=len(colleges))
+        return True
+
+    def apply(
+        self, saved: Iterable[College] = (), deleted: Iterable[UUID] = ()
+    ) -> None:
+        """Swap in a snapshot with this worker's writes applied"""
+        if self._snapshot is None:
+            return
+        colleges = dict(self._snapshot.colleges)
+        for college in saved:
+            colleges[college.id] = CollegeResponse.model_validate(college)
+        for college_id in deleted:
+            colleges.pop(college_id, None)
+        # no version, so the next refresh reloads what was actually committed
+        self._snapshot = CatalogSnapshot.build(colleges.values(), version=None)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.refresh()
+            except Exception as exc:
+                logger.exception("college_catalog_refresh_failed", exc=exc)
+
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self.refresh_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start the periodic refresh loop (called from lifespan)"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the refresh loop (called from lifespan)"""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+college_catalog = CollegeCatalog(
+    refresh_interval_seconds=settings.COLLEGE_CATALOG_REFRESH_INTERVAL_SECONDS
+)
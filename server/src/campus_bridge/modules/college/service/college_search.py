@@ -0,0 +1,186 @@
+import asyncio
+import heapq
+import re
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+import structlog
+
+from campus_bridge.data.enums.state import StateEnum
+from campus_bridge.data.schemas.college import CollegeResponse
+from campus_bridge.modules.college.service.college_catalog import (
+    CatalogSnapshot,
+    CollegeCatalog,
+    college_catalog,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+_WORD = re.compile(r"\w+")
+
+
+def search_terms(text: str) -> list[str]:
+    """Lowercased words of a name, city or query"""
+    return _WORD.findall(text.lower())
+
+
+class _Words:
+    """Word -> positions of the colleges using it, in name order"""
+
+    def __init__(self):
+        self.postings: dict[str, list[int]] = {}
+        self.words: list[str] = []
+
+    def add(self, i: int, words: Iterable[str]) -> None:
+        # positions come in ascending, so every posting list stays sorted
+        for word in words:
+            self.postings.setdefault(word, []).append(i)
+
+    def freeze(self) -> None:
+        self.words = sorted(self.postings)
+
+    def _starting_with(self, prefix: str) -> list[str]:
+        lo = bisect_left(self.words, prefix)
+        hi = bisect_left(self.words, prefix + chr(0x10FFFF), lo)
+        return self.words[lo:hi]
+
+    def count(self, prefix: str) -> int:
+        return sum(len(self.postings[word]) for word in self._starting_with(prefix))
+
+    def search(self, prefix: str) -> Iterator[int]:
+        """Positions with a word starting with `prefix`, in name order"""
+        last = -1
+        postings = [self.postings[word] for word in self._starting_with(prefix)]
+        for i in heapq.merge(*postings):
+            if i != last:
+                yield i
+                last = i
+
+
+class _Partition:
+    def __init__(self):
+        self.names: list[tuple[str, int]] = []
+        self.name_words = _Words()
+        self.words = _Words()
+
+
+class _CatalogIndex:
+    """
+    Name and city words of one catalog snapshot, partitioned by state with
+    one more partition (None) for every state.
+
+    Colleges are numbered in name order, so walking posting lists in order
+    finds the best ranked matches first and a search stops after `limit`.
+    """
+
+    def __init__(self, snapshot: CatalogSnapshot):
+        self.snapshot = snapshot
+        self.colleges = list(snapshot.colleges.values())
+        self.name_words = []
+        self.words = []
+        self.partitions: dict[StateEnum | None, _Partition] = {None: _Partition()}
+
+        for i, college in enumerate(self.colleges):
+            name_terms = search_terms(college.name)
+            name_words = frozenset(name_terms)
+            words = name_words | frozenset(search_terms(college.city))
+            self.name_words.append(name_words)
+            self.words.append(words)
+            for state in (None, college.state):
+                partition = self.partitions.get(state)
+                if partition is None:
+                    partition = self.partitions[state] = _Partition()
+                partition.names.append((" ".join(name_terms), i))
+                partition.name_words.add(i, name_words)
+                partition.words.add(i, words)
+
+        for partition in self.partitions.values():
+            partition.names.sort()
+            partition.name_words.freeze()
+            partition.words.freeze()
+
+    def search(
+        self, terms: list[str], state: StateEnum | None, limit: int
+    ) -> list[CollegeResponse]:
+        partition = self.partitions.get(state)
+        if partition is None:
+            return []
+
+        # names starting with the query come first
+        phrase = " ".join(terms)
+        found = []
+        n = bisect_left(partition.names, (phrase,))
+        while (
+            n < len(partition.names)
+            and len(found) < limit
+            and partition.names[n][0].startswith(phrase)
+        ):
+            found.append(partition.names[n][1])
+            n += 1
+
+        # then every query word prefixing a word of the name, then of the
+        # name or city; each walks the rarest word's colleges
+        for index, words in (
+            (partition.name_words, self.name_words),
+            (partition.words, self.words),
+        ):
+            if len(found) >= limit:
+                break
+            seen = set(found)
+            rarest = min(terms, key=index.count)
+            for i in index.search(rarest):
+                if i not in seen and all(
+                    any(word.startswith(term) for word in words[i]) for term in terms
+                ):
+                    found.append(i)
+                    seen.add(i)
+                    if len(found) >= limit:
+                        break
+
+        return [self.colleges[i] for i in found]
+
+
+class CollegeSearch:
+    """
+    Per-worker autocomplete over the college catalog.
+
+    The index is built from the catalog snapshot off the event loop and
+    rebuilt on the first search after the snapshot is replaced, so it always
+    answers from the same catalog the college reads see.
+    """
+
+    def __init__(self, catalog: CollegeCatalog):
+        self.catalog = catalog
+        self._index: _CatalogIndex | None = None
+        self._lock = asyncio.Lock()
+
+    async def _current(self) -> _CatalogIndex:
+        snapshot = await self.catalog.snapshot()
+        if self._index is not None and self._index.snapshot is snapshot:
+            return self._index
+
+        async with self._lock:
+            snapshot = await self.catalog.snapshot()
+            if self._index is None or self._index.snapshot is not snapshot:
+                self._index = await asyncio.to_thread(_CatalogIndex, snapshot)
+                logger.debug(
+                    "college_search_index_built", colleges=len(snapshot.colleges)
+                )
+        return self._index
+
+    async def search(
+        self, query: str, state: StateEnum | None, limit: int
+    ) -> list[CollegeResponse]:
+        """Colleges with a name or city word starting with every query word"""
+        terms = search_terms(query)
+        if not terms:
+            return []
+        return (await self._current()).search(terms, state, limit)
+
+    async def resolve(self, college_ids: list) -> list[CollegeResponse]:
+        """Catalog entries of the given colleges in order, unknown ones left out"""
+        colleges = (await self.catalog.snapshot()).colleges
+        return [colleges[id] for id in college_ids if id in colleges]
+
+
+college_search = CollegeSearch(catalog=college_catalog)
@@ -1,12 +1,28 @@
 from uuid import UUID
 
 import structlog
-from fastapi import Depends
+from fastapi import Depends, Request, Response, status
+from pydantic import ValidationError
 
-from campus_bridge.data.models.college import College
+from campus_bridge.config.settings import settings
+from campus_bridge.data.enums.state import StateEnum
+from campus_bridge.data.models import (
+    CollegeAlumniStat,
+    CollegeRoleStat,
+    CollegeStudentStat,
+)
 from campus_bridge.data.schemas.college import (
+    CollegeAlumniCohortCount,
+    CollegeCreateResponse,
     CollegeDeleteResponse,
+    CollegeImportError,
+    CollegeImportResponse,
+    CollegeImportRow,
     CollegeResponse,
+    CollegeRoleCount,
+    CollegeSearchResult,
+    CollegeStatsResponse,
+    CollegeStudentCohortCount,
     CollegeUpdateRequest,
     CreateCollegeRequest,
 )
@@ -15,18 +31,55 @@ from campus_bridge.modules.college.repository.college_repository import (
     CollegeRepository,
     get_college_repository,
 )
+from campus_bridge.modules.college.repository.college_stats_repository import (
+    CollegeStatsRepository,
+    get_college_stats_repository,
+)
+from campus_bridge.modules.college.service.college_catalog import (
+    CollegeCatalog,
+    college_catalog,
+)
+from campus_bridge.modules.college.service.college_search import (
+    CollegeSearch,
+    college_search,
+)
+from campus_bridge.utils.csv_stream import iter_csv_records
+from campus_bridge.utils.multipart_stream import stream_file_field
 
 logger = structlog.stdlib.get_logger(__name__)
 
 
+def _json_response(body: bytes, etag: str, if_none_match: str | None) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and any(
+        tag.strip().removeprefix("W/") in (etag, "*")
+        for tag in if_none_match.split(",")
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 class CollegeService:
-    def __init__(self, repository: CollegeRepository):
+    def __init__(
+        self,
+        repository: CollegeRepository,
+        stats_repository: CollegeStatsRepository,
+        catalog: CollegeCatalog,
+        search: CollegeSearch,
+    ):
         self.repository = repository
+        self.stats_repository = stats_repository
+        self.catalog = catalog
+        self.search = search
 
     async def create_colleges(
         self, payload: list[CreateCollegeRequest]
-    ) -> list[CollegeResponse]:
-        """Create one or multiple colleges"""
+    ) -> CollegeCreateResponse:
+        """
+        Create one or multiple colleges in one INSERT ... ON CONFLICT DO
+        NOTHING; a college already there, or repeated in the payload, is
+        skipped instead of failing the whole batch
+        """
 
         if not payload:
             logger.warning(
@@ -37,15 +90,106 @@ class CollegeService:
                 details="College list must not be empty",
             )
 
-        # Deserialization : Pydantic -> SQLAlchemy
-        colleges = [College(**college.model_dump()) for college in payload]
+        # one statement cannot insert the same college twice, the first wins
+        colleges: dict[tuple, dict] = {}
+        for college in payload:
+            colleges.setdefault(
+                (college.name, college.city, college.state), college.model_dump()
+            )
+
+        rows = await self.repository.upsert_colleges(
+            list(colleges.values()), update=False
+        )
+        self.catalog.apply(saved=rows)
+        inserted = sum(row.inserted for row in rows)
+        logger.info(
+            "college_bulk_create_success",
+            inserted=inserted,
+            skipped=len(payload) - len(rows),
+        )
+
+        return CollegeCreateResponse(
+            inserted=inserted,
+            updated=len(rows) - inserted,
+            skipped=len(payload) - len(rows),
+            colleges=[CollegeResponse.model_validate(row) for row in rows],
+        )
+
+    async def import_colleges(
+        self, request: Request, update_existing: bool
+    ) -> CollegeImportResponse:
+        """
+        Bulk upsert colleges from an uploaded CSV file.
+
+        The file is parsed while it streams in and written in chunks of one
+        multi-row INSERT ... ON CONFLICT each, so the catalog never sits in
+        memory and each chunk is one round trip. A college already there is
+        updated or skipped, bad rows are reported, not fatal.
+        """
+        report = CollegeImportResponse(
+            total_rows=0,
+            inserted=0,
+            updated=0,
+            skipped=0,
+            failed=0,
+            errors=[],
+            errors_truncated=False,
+        )
+        seen: set[tuple] = set()
+        chunk: list[dict] = []
+
+        records = iter_csv_records(stream_file_field(request, "file"))
+        async for line, record in records:
+            report.total_rows += 1
+            try:
+                row = CollegeImportRow.model_validate(record)
+            except ValidationError as exc:
+                self._reject(report, line, _validation_message(exc))
+                continue
+
+            # one statement cannot upsert the same college twice
+            identity = (row.name, row.city, row.state)
+            if identity in seen:
+                self._reject(report, line, "Duplicate college in file")
+                continue
+            seen.add(identity)
+
+            chunk.append(row.model_dump())
+            if len(chunk) >= settings.COLLEGE_IMPORT_CHUNK_SIZE:
+                await self._import_chunk(chunk, update_existing, report)
+                chunk = []
+
+        if chunk:
+            await self._import_chunk(chunk, update_existing, report)
+        report.errors.sort(key=lambda error: error.line)
+
+        logger.info(
+            "colleges_imported",
+            total_rows=report.total_rows,
+            inserted=report.inserted,
+            updated=report.updated,
+            skipped=report.skipped,
+            failed=report.failed,
+        )
+        return report
 
-        # DB Operation
-        colleges = await self.repository.create_colleges(colleges=colleges)
-        logger.info("college_bulk_create_success", total_colleges=len(colleges))
+    async def _import_chunk(
+        self, chunk: list[dict], update_existing: bool, report: CollegeImportResponse
+    ) -> None:
+        rows = await self.repository.upsert_colleges(chunk, update=update_existing)
+        inserted = sum(row.inserted for row in rows)
+        report.inserted += inserted
+        report.updated += len(rows) - inserted
+        report.skipped += len(chunk) - len(rows)
+        self.catalog.apply(saved=rows)
 
-        # Serialization : SQLAlchemy -> Pydantic
-        return [CollegeResponse.model_validate(college) for college in colleges]
+    @staticmethod
+    def _reject(report: CollegeImportResponse, line: int, message: str) -> None:
+        report.failed += 1
+        if len(report.errors) < settings.COLLEGE_IMPORT_MAX_ERRORS:
+            report.errors.append(CollegeImportError(line=line, message=message))
+        else:
+            report.errors_truncated = True
 
     async def update_college(
         self, college_id: UUID, payload: CollegeUpdateRequest
@@ -74,6 +218,7 @@ class CollegeService:
             setattr(college, field, value)
 
         college = await self.repository.update_college(college=college)
+        self.catalog.apply(saved=[college])
         logger.info(
             "college_updated",
             college_id=str(college_id),
@@ -92,15 +237,19 @@ class CollegeService:
             )
 
         await self.repository.delete_college(college=college)
+        self.catalog.apply(deleted=[college_id])
         logger.info("college_deleted", college_id=str(college_id))
         return CollegeDeleteResponse(
             message=f"College {college_id} successfully deleted"
         )
 
-    async def get_college_by_id(self, college_id: UUID):
-        """Get a single college"""
-        college = await self.repository.get_college_by_id(college_id=college_id)
-        if not college:
+    async def get_college_by_id(
+        self, college_id: UUID, if_none_match: str | None = None
+    ) -> Response:
+        """Get a single college from the catalog"""
+        snapshot = await self.catalog.snapshot()
+        item = snapshot.items.get(college_id)
+        if item is None:
             logger.warning("college_not_found", college_id=str(college_id))
             raise BadRequestError(
                 message="College not found",
@@ -108,16 +257,68 @@ class CollegeService:
             )
 
         logger.info("college_fetched_successfully", college_id=str(college_id))
-        return CollegeResponse.model_validate(college)
+        return _json_response(*item, if_none_match=if_none_match)
+
+    async def search_colleges(
+        self, query: str, state: StateEnum | None, limit: int
+    ) -> list[CollegeSearchResult]:
+        """Autocomplete colleges by name and city words"""
+        colleges = await self.search.search(query, state=state, limit=limit)
+        if not colleges:
+            # nothing starts with the query, it may be misspelled
+            logger.debug("college_search_fallback")
+            college_ids = await self.repository.search_colleges(
+                query, state=state, limit=limit
+            )
+            colleges = await self.search.resolve(college_ids)
+
+        return [CollegeSearchResult.model_validate(college) for college in colleges]
+
+    async def get_college_stats(self, college_id: UUID) -> CollegeStatsResponse:
+        """Get cohort counts of a college from its summary rows"""
+        snapshot = await self.catalog.snapshot()
+        if college_id not in snapshot.colleges:
+            logger.warning("college_not_found", college_id=str(college_id))
+            raise BadRequestError(
+                message="College not found",
+                details=f"College {college_id} does not exist",
+            )
+
+        roles = await self.stats_repository.get_stats(CollegeRoleStat, college_id)
+        students = await self.stats_repository.get_stats(CollegeStudentStat, college_id)
+        alumni = await self.stats_repository.get_stats(CollegeAlumniStat, college_id)
+        return CollegeStatsResponse(
+            college_id=college_id,
+            roles=[CollegeRoleCount(**row._asdict()) for row in roles],
+            students=[CollegeStudentCohortCount(**row._asdict()) for row in students],
+            alumni=[CollegeAlumniCohortCount(**row._asdict()) for row in alumni],
+        )
+
+    async def get_all_college(self, if_none_match: str | None = None) -> Response:
+        """Get all college from the catalog"""
+        snapshot = await self.catalog.snapshot()
+        logger.info(
+            "Colleges_fetched_successfully", total_colleges=len(snapshot.colleges)
+        )
+        return _json_response(
+            snapshot.list_json, snapshot.list_etag, if_none_match=if_none_match
+        )
+
 
-    async def get_all_college(self):
-        """Get all college"""
-        colleges = await self.repository.get_all_college()
-        logger.info("Colleges_fetched_successfully", total_colleges=len(colleges))
-        return [CollegeResponse.model_validate(college) for college in colleges]
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
 
 
 def get_college_service(
     repository: CollegeRepository = Depends(get_college_repository),
+    stats_repository: CollegeStatsRepository = Depends(get_college_stats_repository),
 ) -> CollegeService:
-    return CollegeService(repository=repository)
+    return CollegeService(
+        repository=repository,
+        stats_repository=stats_repository,
+        catalog=college_catalog,
+        search=college_search,
+    )
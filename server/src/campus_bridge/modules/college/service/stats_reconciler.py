@@ -0,0 +1,90 @@
+import asyncio
+
+import structlog
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.core import AsyncSessionLocal
+from campus_bridge.modules.college.repository.college_stats_repository import (
+    STATS_KEYS,
+    CollegeStatsRepository,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class CollegeStatsReconciler:
+    """
+    Periodic recount of the college stats tables.
+
+    Triggers keep the tables exact as long as every change goes through the
+    profile tables; this catches what they cannot see, like rows loaded
+    with triggers disabled or changed by hand with session_replication_role
+    set to replica. It counts what the triggers count, so the profiles of a
+    soft-deleted user still count until the profile itself is removed.
+
+    Colleges are recounted one table at a time, each in its own short
+    transaction, so writers are only ever held up for one college's recount.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def reconcile(self) -> int:
+        """Recount every college, returns how many stats rows were fixed"""
+        fixed = 0
+        async with AsyncSessionLocal() as session:
+            repository = CollegeStatsRepository(session)
+            college_ids = await repository.get_college_ids()
+            await session.commit()
+
+            for college_id in college_ids:
+                for model in STATS_KEYS:
+                    if self._stopping.is_set():
+                        return fixed
+                    drift = await repository.reconcile(model, college_id)
+                    if drift:
+                        logger.warning(
+                            "college_stats_drift_fixed",
+                            college_id=str(college_id),
+                            table=model.__tablename__,
+                            rows=drift,
+                        )
+                    fixed += drift
+        return fixed
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self.interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping.is_set():
+                break
+
+            try:
+                fixed = await self.reconcile()
+                logger.info("college_stats_reconciled", fixed=fixed)
+            except Exception as exc:
+                logger.exception("college_stats_reconcile_failed", exc=exc)
+
+    def start(self) -> None:
+        """Start the periodic reconcile loop (called from lifespan)"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the reconcile loop (called from lifespan)"""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+college_stats_reconciler = CollegeStatsReconciler(
+    interval_seconds=settings.COLLEGE_STATS_RECONCILE_INTERVAL_SECONDS
+)
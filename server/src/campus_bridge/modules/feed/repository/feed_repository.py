@@ -1,15 +1,31 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import desc, select
+from sqlalchemy import (
+    BigInteger,
+    Text,
+    asc,
+    cast,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from campus_bridge.data.database.session import get_async_session
 from campus_bridge.data.enums.post import PostVisibilityEnum
+from campus_bridge.data.enums.tag import TagTypeEnum
 from campus_bridge.data.models.post import Post
+from campus_bridge.data.models.post_tag import PostTag
+from campus_bridge.data.models.trending_tag_event import TrendingTagEvent
 from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
-from campus_bridge.utils.cursor_pagination import cursor_pagination
+from campus_bridge.utils.cursor_pagination import cursor_pagination, keyset_after
 
 
 class FeedRepository:
@@ -40,6 +56,102 @@ class FeedRepository:
         await self.db.refresh(post)
         return post
 
+    @sqlalchemy_exceptions
+    async def commit(self) -> None:
+        """Commit what was written so far, e.g. a new post and its tags"""
+        await self.db.commit()
+
+    @sqlalchemy_exceptions
+    async def create_post_tags(self, tags: list[PostTag]) -> None:
+        """Store the tags extracted from a post"""
+        self.db.add_all(tags)
+        await self.db.flush()
+
+    @sqlalchemy_exceptions
+    async def get_post_tags(self, post_id: UUID) -> set[tuple[TagTypeEnum, str]]:
+        """Get the (tag type, tag) pairs stored for a post"""
+        stmt = select(PostTag.tag_type, PostTag.tag).where(PostTag.post_id == post_id)
+        result = await self.db.execute(stmt)
+        return {tuple(row) for row in result.all()}
+
+    @sqlalchemy_exceptions
+    async def delete_post_tags(
+        self, post_id: UUID, tags: set[tuple[TagTypeEnum, str]]
+    ) -> None:
+        """Remove some tags of a post"""
+        await self.db.execute(
+            delete(PostTag).where(
+                PostTag.post_id == post_id,
+                tuple_(PostTag.tag_type, PostTag.tag).in_(tags),
+            )
+        )
+        await self.db.flush()
+
+    @sqlalchemy_exceptions
+    async def add_trending_tag_events(
+        self, post_id: UUID, hashtags: list[str], is_public: bool, delta: int
+    ) -> None:
+        """Queue count changes of stored hashtags of a post for trending"""
+        rows = select(
+            PostTag.college_id,
+            PostTag.tag,
+            literal(is_public),
+            literal(delta),
+            PostTag.created_at,
+        ).where(
+            PostTag.post_id == post_id,
+            PostTag.tag_type == TagTypeEnum.HASHTAG,
+            PostTag.tag.in_(hashtags),
+        )
+        await self.db.execute(
+            insert(TrendingTagEvent).from_select(
+                ["college_id", "tag", "is_public", "delta", "counted_at"], rows
+            )
+        )
+
+    @sqlalchemy_exceptions
+    async def get_trending_tag_events_since(
+        self, txid: int, seq: int, limit: int
+    ) -> list[tuple]:
+        """
+        Get trending tag events after a (txid, seq) position, in that order.
+
+        Only events of transactions older than every one still running are
+        returned: any event past the last one read can only come from a
+        transaction that had not finished yet, so none is ever skipped.
+        """
+        horizon = cast(
+            cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger
+        )
+        stmt = (
+            select(
+                TrendingTagEvent.txid,
+                TrendingTagEvent.seq,
+                TrendingTagEvent.college_id,
+                TrendingTagEvent.tag,
+                TrendingTagEvent.is_public,
+                TrendingTagEvent.delta,
+                TrendingTagEvent.counted_at,
+            )
+            .where(
+                tuple_(TrendingTagEvent.txid, TrendingTagEvent.seq) > (txid, seq),
+                TrendingTagEvent.txid < horizon,
+            )
+            .order_by(asc(TrendingTagEvent.txid), asc(TrendingTagEvent.seq))
+            .limit(limit)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    @sqlalchemy_exceptions
+    async def delete_trending_tag_events_before(self, created_at: datetime) -> int:
+        """Remove trending tag events that fell out of every window"""
+        result = await self.db.execute(
+            delete(TrendingTagEvent).where(TrendingTagEvent.created_at < created_at)
+        )
+        return result.rowcount
+
     @sqlalchemy_exceptions
     async def get_college_posts(
         self, college_id: UUID, limit: int, cursor: str | None
@@ -67,6 +179,27 @@ class FeedRepository:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    @sqlalchemy_exceptions
+    async def get_college_post_keys_since(
+        self, college_id: UUID, since_created_at: datetime, since_id: UUID, limit: int
+    ) -> list[tuple[datetime, UUID]]:
+        """Get (created_at, id) of at most `limit` college posts newer than a cursor"""
+        stmt = (
+            select(Post.created_at, Post.id)
+            .where(
+                Post.visibility == PostVisibilityEnum.COLLEGE,
+                Post.college_id == college_id,
+                Post.is_hidden.is_(False),
+                Post.is_deleted.is_(False),
+                keyset_after(Post.created_at, Post.id, since_created_at, since_id),
+            )
+            .order_by(desc(Post.created_at), desc(Post.id))
+            .limit(limit)
+        )
+
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
     @sqlalchemy_exceptions
     async def get_public_posts(self, limit: int, cursor: str | None) -> list[Post]:
         """Get all public posts"""
@@ -0,0 +1,56 @@
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from campus_bridge.data.database.session import get_async_session
+from campus_bridge.data.models.post_impression_counter import PostImpressionCounter
+from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
+
+# rows per INSERT, keeps every statement well below asyncpg's bind parameter limit
+UPSERT_CHUNK_SIZE = 1000
+
+
+class ImpressionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @sqlalchemy_exceptions
+    async def add_counts(self, deltas: dict[UUID, int]) -> None:
+        """Add impression deltas to the post counters with multi-row upserts"""
+        # a stable row order keeps concurrent flushes from deadlocking each other
+        rows = [
+            {"post_id": post_id, "count": count, "updated_at": func.now()}
+            for post_id, count in sorted(deltas.items())
+        ]
+
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = insert(PostImpressionCounter).values(
+                rows[start : start + UPSERT_CHUNK_SIZE]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[PostImpressionCounter.post_id],
+                set_={
+                    "count": PostImpressionCounter.count + stmt.excluded.count,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.db.execute(stmt)
+
+    @sqlalchemy_exceptions
+    async def get_count(self, post_id: UUID) -> int:
+        """Get the flushed impression count of a post"""
+        result = await self.db.execute(
+            select(PostImpressionCounter.count).where(
+                PostImpressionCounter.post_id == post_id
+            )
+        )
+        return result.scalar_one_or_none() or 0
+
+
+def get_impression_repository(
+    db: AsyncSession = Depends(get_async_session),
+) -> ImpressionRepository:
+    return ImpressionRepository(db)
@@ -6,8 +6,17 @@ from campus_bridge.api.v1.dependencies import (
     get_current_user,
     require_admin_or_officials_or_alumni,
 )
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.session import read_only
 from campus_bridge.data.models.user import User
-from campus_bridge.data.schemas.feed import PostCreate, PostResponse, PostUpdateRequest
+from campus_bridge.data.schemas.feed import (
+    NewPostsCountResponse,
+    PostCreate,
+    PostImpressionResponse,
+    PostResponse,
+    PostUpdateRequest,
+    TrendingTagResponse,
+)
 from campus_bridge.modules.feed.service.feed_service import (
     FeedService,
     get_feed_service,
@@ -17,6 +26,7 @@ router = APIRouter(prefix="/feed", tags=["feed"])
 
 
 @router.get("/me", status_code=status.HTTP_200_OK, response_model=list[PostResponse])
+@read_only()
 async def get_my_posts(
     current_user: User = Depends(get_current_user),
     feed_service: FeedService = Depends(get_feed_service),
@@ -38,6 +48,7 @@ async def create_post(
 @router.get(
     "/college", status_code=status.HTTP_200_OK, response_model=list[PostResponse]
 )
+@read_only()
 async def get_all_posts_by_college(
     current_user: User = Depends(get_current_user),
     feed_service: FeedService = Depends(get_feed_service),
@@ -50,9 +61,27 @@ async def get_all_posts_by_college(
     )
 
 
+@router.get(
+    "/college/new-count",
+    status_code=status.HTTP_200_OK,
+    response_model=NewPostsCountResponse,
+)
+@read_only()
+async def get_college_new_posts_count(
+    current_user: User = Depends(get_current_user),
+    feed_service: FeedService = Depends(get_feed_service),
+    since: str = Query(..., description="Cursor of the newest post already seen"),
+):
+    """Number of current user college posts newer than `since` (capped)"""
+    return await feed_service.get_college_new_posts_count(
+        current_user=current_user, since=since
+    )
+
+
 @router.get(
     "/public", status_code=status.HTTP_200_OK, response_model=list[PostResponse]
 )
+@read_only()
 async def get_public_posts(
     current_user: User = Depends(get_current_user),
     feed_service: FeedService = Depends(get_feed_service),
@@ -65,6 +94,41 @@ async def get_public_posts(
     )
 
 
+@router.get(
+    "/trending",
+    status_code=status.HTTP_200_OK,
+    response_model=list[TrendingTagResponse],
+)
+@read_only()
+async def get_trending_tags(
+    current_user: User = Depends(get_current_user),
+    feed_service: FeedService = Depends(get_feed_service),
+    college_only: bool = Query(
+        default=True, description="Current user college instead of public posts"
+    ),
+    limit: int = Query(default=10, ge=1, le=settings.TRENDING_TOP_K),
+):
+    """Trending hashtags, served from memory"""
+    return feed_service.get_trending_tags(
+        current_user=current_user, college_only=college_only, limit=limit
+    )
+
+
+@router.get(
+    "/{post_id}/impressions",
+    status_code=status.HTTP_200_OK,
+    response_model=PostImpressionResponse,
+)
+@read_only()
+async def get_post_impressions(
+    post_id: UUID,
+    current_user: User = Depends(require_admin_or_officials_or_alumni),
+    feed_service: FeedService = Depends(get_feed_service),
+):
+    """View count of a post, only for its author"""
+    return await feed_service.get_post_impressions(post_id, current_user)
+
+
 @router.patch("/{post_id}", status_code=status.HTTP_200_OK, response_model=PostResponse)
 async def update_post(
     post_id: UUID,
@@ -1,16 +1,45 @@
+from datetime import timezone
 from uuid import UUID
 
 import structlog
 from fastapi import Depends
 
+from campus_bridge.data.enums.post import PostVisibilityEnum
+from campus_bridge.data.enums.tag import TagTypeEnum
 from campus_bridge.data.models.post import Post
+from campus_bridge.data.models.post_tag import PostTag
 from campus_bridge.data.models.user import User
-from campus_bridge.data.schemas.feed import PostCreate, PostResponse, PostUpdateRequest
+from campus_bridge.data.schemas.feed import (
+    NewPostsCountResponse,
+    PostCreate,
+    PostImpressionResponse,
+    PostResponse,
+    PostUpdateRequest,
+    TrendingTagResponse,
+)
 from campus_bridge.errors.exc import BadRequestError
 from campus_bridge.modules.feed.repository.feed_repository import (
     FeedRepository,
     get_feed_repository,
 )
+from campus_bridge.modules.feed.repository.impression_repository import (
+    ImpressionRepository,
+    get_impression_repository,
+)
+from campus_bridge.modules.feed.service.head_counter import (
+    CollegeHeadCounter,
+    college_head_counter,
+)
+from campus_bridge.modules.feed.service.impression_tracker import (
+    ImpressionTracker,
+    impression_tracker,
+)
+from campus_bridge.modules.feed.service.trending_tracker import (
+    TrendingTracker,
+    trending_tracker,
+)
+from campus_bridge.utils.cursor_pagination import decode_cursor
+from campus_bridge.utils.hashtags import extract_tags
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -19,8 +48,63 @@ class FeedService:
     def __init__(
         self,
         repository: FeedRepository,
+        impression_repository: ImpressionRepository,
+        head_counter: CollegeHeadCounter,
+        impression_tracker: ImpressionTracker,
+        trending_tracker: TrendingTracker,
     ):
         self.repository = repository
+        self.impression_repository = impression_repository
+        self.head_counter = head_counter
+        self.impression_tracker = impression_tracker
+        self.trending_tracker = trending_tracker
+
+    async def _save_post_tags(
+        self,
+        post: Post,
+        old_tags: set[tuple[TagTypeEnum, str]],
+        new_tags: set[tuple[TagTypeEnum, str]],
+        was_counted: bool,
+        was_public: bool,
+    ) -> None:
+        """
+        Bring the post_tags of a post in line with its content and queue the
+        trending count changes: a hashtag that stops counting, because it was
+        removed or its post was hidden, deleted or moved between feeds, is
+        taken back with -1, one that starts counting is added with +1.
+        """
+        is_counted = not post.is_hidden and not post.is_deleted
+        is_public = post.visibility == PostVisibilityEnum.PUBLIC
+        removed, added = old_tags - new_tags, new_tags - old_tags
+        # tags kept by an edit count again only if where they count changed
+        moved = was_counted != is_counted or was_public != is_public
+
+        if was_counted:
+            hashtags = _hashtags(old_tags if moved else removed)
+            if hashtags:
+                await self.repository.add_trending_tag_events(
+                    post.id, hashtags, is_public=was_public, delta=-1
+                )
+        if removed:
+            await self.repository.delete_post_tags(post.id, removed)
+        if added:
+            await self.repository.create_post_tags(
+                [
+                    PostTag(
+                        post_id=post.id,
+                        college_id=post.college_id,
+                        tag_type=tag_type,
+                        tag=tag,
+                    )
+                    for tag_type, tag in added
+                ]
+            )
+        if is_counted:
+            hashtags = _hashtags(new_tags if moved else added)
+            if hashtags:
+                await self.repository.add_trending_tag_events(
+                    post.id, hashtags, is_public=is_public, delta=1
+                )
 
     async def get_my_posts(self, current_user: User) -> list[PostResponse]:
         """Get all posts of current user"""
@@ -41,6 +125,19 @@ class FeedService:
             meta_data=post_data.metadata,
         )
         created_post = await self.repository.create_post(post)
+        await self._save_post_tags(
+            created_post,
+            old_tags=set(),
+            new_tags=set(extract_tags(created_post.content)),
+            was_counted=False,
+            was_public=False,
+        )
+        # counted in memory only once it is committed, never as a phantom
+        await self.repository.commit()
+        if created_post.visibility == PostVisibilityEnum.COLLEGE:
+            self.head_counter.record_post(
+                created_post.college_id, (created_post.created_at, created_post.id)
+            )
         logger.info(
             "post_created",
             user_id=str(current_user.id),
@@ -55,21 +152,89 @@ class FeedService:
         posts = await self.repository.get_college_posts(
             college_id=current_user.college_id, limit=limit, cursor=cursor
         )
+        self.impression_tracker.record(post.id for post in posts)
         logger.info(
             "college_posts_fetched", user_id=str(current_user.id), posts=len(posts)
         )
         return [PostResponse.model_validate(post) for post in posts]
 
+    async def get_college_new_posts_count(
+        self, current_user: User, since: str
+    ) -> NewPostsCountResponse:
+        """Count college posts newer than a cursor, up to the configured cap"""
+        since_created_at, since_id = decode_cursor(since)
+        if since_created_at.tzinfo is None:
+            # created_at is timestamptz, compare like Postgres would for UTC
+            since_created_at = since_created_at.replace(tzinfo=timezone.utc)
+        since_key = (since_created_at, since_id)
+        cap = self.head_counter.cap
+
+        count = self.head_counter.count_since(current_user.college_id, since_key)
+        source = "memory"
+        if count is None:
+            keys = await self.repository.get_college_post_keys_since(
+                college_id=current_user.college_id,
+                since_created_at=since_created_at,
+                since_id=since_id,
+                limit=cap + 1,
+            )
+            self.head_counter.store(current_user.college_id, keys, since_key)
+            count = len(keys)
+            source = "database"
+
+        logger.info(
+            "college_new_posts_counted",
+            user_id=str(current_user.id),
+            count=count,
+            source=source,
+        )
+        is_capped = count > cap
+        count = min(count, cap)
+        return NewPostsCountResponse(
+            count=count,
+            is_capped=is_capped,
+            display=f"{count}+" if is_capped else str(count),
+        )
+
     async def get_public_posts(
         self, current_user: User, limit: int, cursor: str | None
     ) -> list[PostResponse]:
         """Get all public posts"""
         posts = await self.repository.get_public_posts(limit=limit, cursor=cursor)
+        self.impression_tracker.record(post.id for post in posts)
         logger.info(
             "public_posts_fetched", user_id=str(current_user.id), count=len(posts)
         )
         return [PostResponse.model_validate(post) for post in posts]
 
+    def get_trending_tags(
+        self, current_user: User, college_only: bool, limit: int
+    ) -> list[TrendingTagResponse]:
+        """Trending hashtags of the current user college or of public posts"""
+        college_id = current_user.college_id if college_only else None
+        return [
+            TrendingTagResponse(tag=tag, count=count)
+            for tag, count in self.trending_tracker.top(college_id, limit)
+        ]
+
+    async def get_post_impressions(
+        self, post_id: UUID, current_user: User
+    ) -> PostImpressionResponse:
+        """Impression count of one of the current user posts"""
+        post = await self.repository.get_post_by_id(
+            post_id=post_id, user_id=current_user.id
+        )
+        if not post:
+            logger.warning("post_not_found", post_id=str(post_id))
+            raise BadRequestError(
+                message="Post not found", details=f"Post {post_id} does not exist"
+            )
+
+        # flushed total plus what this worker still buffers
+        impressions = await self.impression_repository.get_count(post_id)
+        impressions += self.impression_tracker.pending_count(post_id)
+        return PostImpressionResponse(post_id=post_id, impressions=impressions)
+
     async def update_post(
         self, post_id: UUID, post_data: PostUpdateRequest, current_user: User
     ) -> PostResponse:
@@ -91,10 +256,26 @@ class FeedService:
                 message="Post not found", details=f"Post {post_id} does not exist"
             )
 
+        was_counted = not post.is_hidden and not post.is_deleted
+        was_public = post.visibility == PostVisibilityEnum.PUBLIC
         for field, value in updated_post.items():
             setattr(post, field, value)
 
         post = await self.repository.update_post(post=post)
+        if "content" in updated_post or "visibility" in updated_post:
+            old_tags = await self.repository.get_post_tags(post.id)
+            await self._save_post_tags(
+                post,
+                old_tags=old_tags,
+                new_tags=(
+                    set(extract_tags(post.content))
+                    if "content" in updated_post
+                    else old_tags
+                ),
+                was_counted=was_counted,
+                was_public=was_public,
+            )
+        self.head_counter.invalidate(post.college_id)
         logger.info(
             "post_updated",
             post_id=str(post_id),
@@ -112,11 +293,33 @@ class FeedService:
             raise BadRequestError(
                 message="Post not found", details=f"Post {post_id} does not exist"
             )
+        was_counted = not post.is_hidden and not post.is_deleted
         await self.repository.delete_post(post=post)
+        if was_counted:
+            tags = await self.repository.get_post_tags(post.id)
+            await self._save_post_tags(
+                post,
+                old_tags=tags,
+                new_tags=tags,
+                was_counted=True,
+                was_public=post.visibility == PostVisibilityEnum.PUBLIC,
+            )
+        self.head_counter.invalidate(post.college_id)
         logger.info("post_deleted", post_id=str(post_id))
 
 
+def _hashtags(tags: set[tuple[TagTypeEnum, str]]) -> list[str]:
+    return [tag for tag_type, tag in tags if tag_type == TagTypeEnum.HASHTAG]
+
+
 def get_feed_service(
     repository: FeedRepository = Depends(get_feed_repository),
+    impression_repository: ImpressionRepository = Depends(get_impression_repository),
 ) -> FeedService:
-    return FeedService(repository)
+    return FeedService(
+        repository,
+        impression_repository=impression_repository,
+        head_counter=college_head_counter,
+        impression_tracker=impression_tracker,
+        trending_tracker=trending_tracker,
+    )
@@ -0,0 +1,95 @@
+import time
+from bisect import insort
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from campus_bridge.config.settings import settings
+
+# (created_at, id) of a post, ordered the same way as the feed keyset
+PostKey = tuple[datetime, UUID]
+
+
+@dataclass
+class _CollegeHead:
+    """Newest post keys of one college, complete for everything above `floor`"""
+
+    keys: list[PostKey] = field(default_factory=list)  # ascending
+    floor: PostKey | None = None
+    saturated: bool = False
+    refreshed_at: float = field(default_factory=time.monotonic)
+
+
+class CollegeHeadCounter:
+    """
+    Per-worker cache of the head of every college feed.
+
+    It only ever answers "how many posts are newer than this cursor" and
+    returns None whenever it can't answer exactly, so callers fall back to
+    the database. Posts created on this worker are added immediately, heads
+    loaded from the database are trusted for `ttl_seconds` to bound how long
+    posts created on other workers can go unnoticed.
+    """
+
+    def __init__(self, cap: int, ttl_seconds: int):
+        self.cap = cap
+        self.ttl_seconds = ttl_seconds
+        self._heads: dict[UUID, _CollegeHead] = {}
+
+    def _fresh_head(self, college_id: UUID) -> _CollegeHead | None:
+        head = self._heads.get(college_id)
+        if head is None:
+            return None
+        if time.monotonic() - head.refreshed_at > self.ttl_seconds:
+            del self._heads[college_id]
+            return None
+        return head
+
+    def count_since(self, college_id: UUID, since: PostKey) -> int | None:
+        """Posts newer than `since`, up to `cap` + 1; None when unknown"""
+        head = self._fresh_head(college_id)
+        if head is None:
+            return None
+
+        if head.floor is not None and since < head.floor:
+            # everything we hold is newer than the cursor, which is only an
+            # answer if we already hold more than the cap of it
+            return self.cap + 1 if head.saturated else None
+
+        newer = sum(1 for key in head.keys if key > since)
+        return min(newer, self.cap + 1)
+
+    def store(self, college_id: UUID, keys: list[PostKey], since: PostKey) -> None:
+        """Remember the result of a database count for `since`"""
+        keys = sorted(keys)
+        # one key past the cap tells "exactly cap" from "more than cap"
+        saturated = len(keys) > self.cap
+        self._heads[college_id] = _CollegeHead(
+            keys=keys,
+            # a short answer is complete down to the cursor itself, a full one
+            # only down to the oldest key we got back
+            floor=keys[0] if saturated else since,
+            saturated=saturated,
+        )
+
+    def record_post(self, college_id: UUID, key: PostKey) -> None:
+        """Account for a post created on this worker"""
+        head = self._fresh_head(college_id)
+        if head is None:
+            return
+
+        insort(head.keys, key)
+        if len(head.keys) > self.cap + 1:
+            del head.keys[0]
+            head.floor = head.keys[0]
+            head.saturated = True
+
+    def invalidate(self, college_id: UUID) -> None:
+        """Drop a college head after a post left or changed its feed"""
+        self._heads.pop(college_id, None)
+
+
+college_head_counter = CollegeHeadCounter(
+    cap=settings.FEED_NEW_POSTS_COUNT_CAP,
+    ttl_seconds=settings.FEED_HEAD_COUNTER_TTL_SECONDS,
+)
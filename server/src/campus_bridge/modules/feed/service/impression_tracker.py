@@ -0,0 +1,146 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Iterable
+from uuid import UUID
+
+import structlog
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.core import AsyncSessionLocal
+from campus_bridge.modules.feed.repository.impression_repository import (
+    ImpressionRepository,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class ImpressionTracker:
+    """
+    Per-worker aggregator for post impressions.
+
+    `record` never awaits, so on the event loop it can't interleave with a
+    flush and needs no lock. A flush swaps the pending counter for a fresh
+    one before touching the database, impressions recorded meanwhile land in
+    the new counter, and a failed flush merges its deltas back.
+
+    While the database is failing, flushes back off exponentially up to
+    `max_backoff_seconds` and the pending counter is capped at `max_buffered`
+    posts: impressions of posts already pending are still counted, those of
+    any other post are dropped until a flush succeeds.
+    """
+
+    def __init__(
+        self,
+        flush_interval_seconds: float,
+        max_pending: int,
+        max_buffered: int,
+        max_backoff_seconds: float,
+    ):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self.max_buffered = max_buffered
+        self.max_backoff_seconds = max_backoff_seconds
+        self._pending: Counter[UUID] = Counter()
+        self._dropped = 0
+        self._failures = 0
+        self._retry_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+
+    def _add(self, post_id: UUID, count: int) -> None:
+        if post_id in self._pending or len(self._pending) < self.max_buffered:
+            self._pending[post_id] += count
+        else:
+            self._dropped += count
+
+    def record(self, post_ids: Iterable[UUID]) -> None:
+        """Count one impression for each served post"""
+        for post_id in post_ids:
+            self._add(post_id, 1)
+        if len(self._pending) >= self.max_pending and not self.backing_off:
+            self._wakeup.set()
+
+    @property
+    def backing_off(self) -> bool:
+        """Whether the last flush failed and its retry is not due yet"""
+        return time.monotonic() < self._retry_at
+
+    def pending_count(self, post_id: UUID) -> int:
+        """Impressions of a post recorded on this worker but not flushed yet"""
+        return self._pending.get(post_id, 0)
+
+    async def flush(self) -> int:
+        """Write all pending deltas, returns the number of posts flushed"""
+        if not self._pending:
+            return 0
+
+        deltas, self._pending = self._pending, Counter()
+        try:
+            async with AsyncSessionLocal() as session:
+                await ImpressionRepository(session).add_counts(deltas)
+                await session.commit()
+        except Exception as exc:
+            for post_id, count in deltas.items():
+                self._add(post_id, count)
+            self._failures += 1
+            backoff = min(
+                self.flush_interval_seconds * 2 ** min(self._failures - 1, 16),
+                self.max_backoff_seconds,
+            )
+            self._retry_at = time.monotonic() + backoff
+            logger.exception(
+                "impression_flush_failed",
+                posts=len(deltas),
+                retry_in_seconds=backoff,
+                dropped=self._dropped,
+                exc=exc,
+            )
+            return 0
+
+        self._failures = 0
+        self._retry_at = 0.0
+        if self._dropped:
+            logger.warning("impressions_dropped", impressions=self._dropped)
+            self._dropped = 0
+        logger.debug("impressions_flushed", posts=len(deltas))
+        return len(deltas)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            timeout = max(
+                self.flush_interval_seconds, self._retry_at - time.monotonic()
+            )
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the periodic flush loop (called from lifespan)"""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write what is left (called from lifespan)"""
+        if self._task is not None:
+            # let an in-flight flush finish instead of cancelling it halfway
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        if self._pending:
+            logger.warning("impressions_dropped_on_shutdown", posts=len(self._pending))
+
+
+impression_tracker = ImpressionTracker(
+    flush_interval_seconds=settings.IMPRESSION_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.IMPRESSION_FLUSH_MAX_PENDING,
+    max_buffered=settings.IMPRESSION_MAX_BUFFERED_POSTS,
+    max_backoff_seconds=settings.IMPRESSION_FLUSH_MAX_BACKOFF_SECONDS,
+)
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import structlog
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.core import AsyncSessionLocal
+from campus_bridge.modules.feed.repository.feed_repository import FeedRepository
+from campus_bridge.utils.sketches import SlidingWindowTopK
+
+logger = structlog.stdlib.get_logger(__name__)
+
+GLOBAL_SKETCH_WIDTH = 2048
+COLLEGE_SKETCH_WIDTH = 256
+SKETCH_DEPTH = 4
+SYNC_BATCH_SIZE = 5000
+
+
+class TrendingTracker:
+    """
+    Per-worker trending hashtags, globally and per college.
+
+    Instead of being fed by the worker that created a post, every worker
+    tails the `trending_tag_events` outbox from its last (txid, seq)
+    position, so all workers converge on the same counts. Each event is a +1
+    or -1 for the bucket its hashtag was first counted in, so edited, hidden
+    and deleted posts give back what they added. The table is the
+    checkpoint: a fresh worker replays it on its first sync, events older
+    than the window are pruned.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int,
+        buckets: int,
+        k: int,
+        sync_interval_seconds: float,
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.buckets = buckets
+        self.k = k
+        self.sync_interval_seconds = sync_interval_seconds
+
+        self._global = self._new_window(GLOBAL_SKETCH_WIDTH)
+        self._colleges: dict[UUID, SlidingWindowTopK] = {}
+        self._position: tuple[int, int] = (0, 0)
+        self._pruned_at = 0.0
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def _new_window(self, width: int) -> SlidingWindowTopK:
+        return SlidingWindowTopK(
+            width=width,
+            depth=SKETCH_DEPTH,
+            bucket_seconds=self.bucket_seconds,
+            buckets=self.buckets,
+            k=self.k,
+        )
+
+    def top(self, college_id: UUID | None, limit: int) -> list[tuple[str, int]]:
+        """Trending hashtags of a college, or of public posts when None"""
+        if college_id is None:
+            return self._global.top(limit)
+
+        window = self._colleges.get(college_id)
+        return window.top(limit) if window else []
+
+    def _ingest(
+        self, college_id: UUID, tag: str, is_public: bool, delta: int, at: float
+    ) -> None:
+        window = self._colleges.get(college_id)
+        if window is None:
+            if delta < 0:
+                return
+            window = self._colleges[college_id] = self._new_window(COLLEGE_SKETCH_WIDTH)
+        window.add(tag, at, delta)
+
+        # college-only posts must not leak into what other colleges see
+        if is_public:
+            self._global.add(tag, at, delta)
+
+    def _expire(self) -> None:
+        now = time.time()
+        self._global.expire(now)
+        for college_id, window in list(self._colleges.items()):
+            window.expire(now)
+            if window.is_empty:
+                del self._colleges[college_id]
+
+    async def _prune(self, repository: FeedRepository) -> None:
+        # any worker may prune, once a bucket is enough
+        if time.monotonic() - self._pruned_at < self.bucket_seconds:
+            return
+        window_start = datetime.now(timezone.utc) - timedelta(
+            seconds=self.bucket_seconds * self.buckets
+        )
+        pruned = await repository.delete_trending_tag_events_before(window_start)
+        await repository.db.commit()
+        self._pruned_at = time.monotonic()
+        if pruned:
+            logger.debug("trending_tag_events_pruned", events=pruned)
+
+    async def sync(self) -> int:
+        """Read tag events since the last sync, returns how many were read"""
+        read = 0
+        async with AsyncSessionLocal() as session:
+            repository = FeedRepository(session)
+            await self._prune(repository)
+            while True:
+                rows = await repository.get_trending_tag_events_since(
+                    txid=self._position[0],
+                    seq=self._position[1],
+                    limit=SYNC_BATCH_SIZE,
+                )
+                for txid, seq, college_id, tag, is_public, delta, counted_at in rows:
+                    self._ingest(
+                        college_id,
+                        tag,
+                        is_public=is_public,
+                        delta=delta,
+                        at=counted_at.timestamp(),
+                    )
+                    self._position = (txid, seq)
+
+                read += len(rows)
+                if len(rows) < SYNC_BATCH_SIZE:
+                    break
+
+        self._expire()
+        return read
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                read = await self.sync()
+                if read:
+                    logger.debug("trending_tags_synced", tags=read)
+            except Exception as exc:
+                logger.exception("trending_tags_sync_failed", exc=exc)
+
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self.sync_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start the periodic sync loop (called from lifespan)"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the sync loop (called from lifespan)"""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+trending_tracker = TrendingTracker(
+    bucket_seconds=settings.TRENDING_BUCKET_SECONDS,
+    buckets=settings.TRENDING_BUCKETS,
+    k=settings.TRENDING_TOP_K,
+    sync_interval_seconds=settings.TRENDING_SYNC_INTERVAL_SECONDS,
+)
@@ -0,0 +1,124 @@
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import and_, func, or_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from campus_bridge.data.database.session import get_async_session
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.data.models import Alumni, Student, User
+from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
+
+# above any character, so [term, term + _MAX_CHAR) holds every string it prefixes
+_MAX_CHAR = "\U0010ffff"
+
+
+def _like_prefix(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _prefixed_by(column, term: str):
+    """
+    lower(column) starts with `term`, as a range on lower(column) COLLATE "C"
+    that the *_prefix indexes serve for any term length and, unlike LIKE,
+    with the term as a bound parameter too
+    """
+    key = func.lower(column).collate("C")
+    return and_(key >= term, key < term + _MAX_CHAR)
+
+
+class SearchRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _people_query(self, college_id: UUID):
+        # verified students and alumni of a college, as
+        # (user_id, role, email, first_name, last_name) rows
+        return (
+            select(
+                User.id, User.role, User.email, Student.first_name, Student.last_name
+            )
+            .outerjoin(
+                Student, and_(Student.user_id == User.id, Student.is_verified == True)
+            )
+            .outerjoin(
+                Alumni, and_(Alumni.user_id == User.id, Alumni.is_verified == True)
+            )
+            .where(
+                User.college_id == college_id,
+                ~User.is_deleted,
+                or_(
+                    and_(User.role == RoleEnum.STUDENT, Student.id.is_not(None)),
+                    and_(User.role == RoleEnum.ALUMNI, Alumni.id.is_not(None)),
+                ),
+            )
+        )
+
+    @sqlalchemy_exceptions
+    async def get_people_by_college(self, college_id: UUID, limit: int) -> list:
+        """Get up to `limit` searchable people of a college"""
+        result = await self.db.execute(self._people_query(college_id).limit(limit))
+        return result.all()
+
+    def _prefix_matches(self, college_id: UUID, term: str):
+        # users of a college with a first name, last name or email starting
+        # with `term`, one index range scan per column
+        verified_students = and_(
+            Student.college_id == college_id, Student.is_verified == True
+        )
+        return union(
+            select(Student.user_id).where(
+                verified_students, _prefixed_by(Student.first_name, term)
+            ),
+            select(Student.user_id).where(
+                verified_students, _prefixed_by(Student.last_name, term)
+            ),
+            select(User.id).where(
+                User.college_id == college_id,
+                ~User.is_deleted,
+                _prefixed_by(User.email, term),
+            ),
+        )
+
+    @sqlalchemy_exceptions
+    async def search_people(
+        self, college_id: UUID, terms: list[str], limit: int
+    ) -> list:
+        """
+        People of a college where every (lowercase) term prefixes their first
+        name, last name or email: the candidates of the longest term come from
+        the prefix indexes, the other terms are checked on those rows only
+        """
+        if not terms:
+            return []
+
+        longest = max(terms, key=len)
+        candidates = self._prefix_matches(college_id, longest).subquery()
+        stmt = self._people_query(college_id).where(
+            User.id.in_(select(candidates.c[0]))
+        )
+        for term in terms:
+            if term == longest:
+                continue
+            pattern = _like_prefix(term)
+            stmt = stmt.where(
+                or_(
+                    func.lower(Student.first_name).like(pattern, escape="\\"),
+                    func.lower(Student.last_name).like(pattern, escape="\\"),
+                    func.lower(User.email).like(pattern, escape="\\"),
+                )
+            )
+
+        result = await self.db.execute(
+            stmt.order_by(Student.first_name, Student.last_name, User.email).limit(
+                limit
+            )
+        )
+        return result.all()
+
+
+def get_search_repository(
+    db: AsyncSession = Depends(get_async_session),
+) -> SearchRepository:
+    return SearchRepository(db)
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Query, status
+
+from campus_bridge.api.v1.dependencies import get_current_user
+from campus_bridge.data.database.session import read_only
+from campus_bridge.data.models import User
+from campus_bridge.data.schemas.search import PersonSearchResult
+from campus_bridge.modules.search.service.search_service import (
+    SearchService,
+    get_search_service,
+)
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get(
+    "/people", status_code=status.HTTP_200_OK, response_model=list[PersonSearchResult]
+)
+@read_only()
+async def search_people(
+    q: str = Query(min_length=2, max_length=100, description="Name or email prefix"),
+    limit: int = Query(default=10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    search_service: SearchService = Depends(get_search_service),
+):
+    """Typeahead search of students and alumni in the current user's college"""
+    return await search_service.search_people(
+        current_user.college_id, query=q, limit=limit
+    )
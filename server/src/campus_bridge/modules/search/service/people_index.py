@@ -0,0 +1,157 @@
+import asyncio
+import heapq
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+from uuid import UUID
+
+import structlog
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.core import AsyncSessionLocal
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.modules.search.repository.search_repository import SearchRepository
+from campus_bridge.utils.prefix_index import PrefixIndex
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class Person(NamedTuple):
+    user_id: UUID
+    role: RoleEnum
+    email: str
+    first_name: str | None
+    last_name: str | None
+
+    @property
+    def tokens(self) -> tuple[str, ...]:
+        return tuple(
+            value.lower()
+            for value in (self.first_name, self.last_name, self.email)
+            if value
+        )
+
+    @property
+    def sort_key(self) -> tuple:
+        # same order as the database fallback, people without a name last
+        return (
+            self.first_name is None,
+            self.first_name or "",
+            self.last_name is None,
+            self.last_name or "",
+            self.email,
+        )
+
+
+class _CollegeIndex:
+    def __init__(self, people: list[Person]):
+        self.built_at = time.monotonic()
+        self.people = {person.user_id: person for person in people}
+        self.index: PrefixIndex[UUID] = PrefixIndex()
+        self.index.bulk_load((person.user_id, person.tokens) for person in people)
+
+
+class PeopleIndex:
+    """
+    Per-worker typeahead index of the people of recently searched colleges.
+
+    A college is indexed on its first search (answered by the database
+    meanwhile), kept in step with profile writes made on this worker, and
+    rebuilt in the background once older than the TTL so writes made on
+    other workers show up too. At most `max_colleges` colleges are held,
+    least recently searched out first; colleges above `max_profiles` people
+    are never indexed and always searched in the database.
+    """
+
+    def __init__(self, max_colleges: int, max_profiles: int, ttl_seconds: int):
+        self.max_colleges = max_colleges
+        self.max_profiles = max_profiles
+        self.ttl_seconds = ttl_seconds
+        self._colleges: OrderedDict[UUID, _CollegeIndex] = OrderedDict()
+        self._too_large: dict[UUID, float] = {}
+        self._builds: dict[UUID, asyncio.Task] = {}
+
+    def search(self, college_id: UUID, query: str, limit: int) -> list[Person] | None:
+        """Matching people of a college, None when it is not indexed yet"""
+        college = self._colleges.get(college_id)
+        if college is None:
+            self._schedule_build(college_id)
+            return None
+
+        self._colleges.move_to_end(college_id)
+        if time.monotonic() - college.built_at > self.ttl_seconds:
+            self._schedule_build(college_id)
+
+        terms = query.lower().split()
+        if not terms:
+            return []
+
+        # scan the most selective term, then check the others on each match
+        terms.sort(key=len, reverse=True)
+        longest, others = terms[0], terms[1:]
+        matches = []
+        for user_id in dict.fromkeys(college.index.search(longest)):
+            tokens = college.index.tokens(user_id)
+            if all(any(t.startswith(term) for t in tokens) for term in others):
+                matches.append(college.people[user_id])
+
+        return heapq.nsmallest(limit, matches, key=lambda person: person.sort_key)
+
+    def upsert(self, college_id: UUID, person: Person) -> None:
+        """Add or refresh a person of a college that is indexed"""
+        college = self._colleges.get(college_id)
+        if college is not None:
+            college.people[person.user_id] = person
+            college.index.add(person.user_id, person.tokens)
+
+    def remove(self, college_id: UUID, user_id: UUID) -> None:
+        """Drop a person from a college that is indexed"""
+        college = self._colleges.get(college_id)
+        if college is not None:
+            college.people.pop(user_id, None)
+            college.index.remove(user_id)
+
+    def _schedule_build(self, college_id: UUID) -> None:
+        if college_id in self._builds:
+            return
+        skipped_at = self._too_large.get(college_id)
+        if skipped_at and time.monotonic() - skipped_at < self.ttl_seconds:
+            return
+
+        task = asyncio.create_task(self._build(college_id))
+        self._builds[college_id] = task
+        task.add_done_callback(lambda _: self._builds.pop(college_id, None))
+
+    async def _build(self, college_id: UUID) -> None:
+        try:
+            async with AsyncSessionLocal() as session:
+                rows = await SearchRepository(session).get_people_by_college(
+                    college_id, limit=self.max_profiles + 1
+                )
+        except Exception as exc:
+            logger.exception(
+                "people_index_build_failed", college_id=str(college_id), exc=exc
+            )
+            return
+
+        if len(rows) > self.max_profiles:
+            self._too_large[college_id] = time.monotonic()
+            self._colleges.pop(college_id, None)
+            logger.info("people_index_college_too_large", college_id=str(college_id))
+            return
+
+        self._too_large.pop(college_id, None)
+        # sorting a large college takes a while, keep it off the event loop
+        college = await asyncio.to_thread(_CollegeIndex, [Person(*row) for row in rows])
+        self._colleges[college_id] = college
+        self._colleges.move_to_end(college_id)
+        while len(self._colleges) > self.max_colleges:
+            self._colleges.popitem(last=False)
+        logger.debug("people_index_built", college_id=str(college_id), people=len(rows))
+
+
+people_index = PeopleIndex(
+    max_colleges=settings.PEOPLE_INDEX_MAX_COLLEGES,
+    max_profiles=settings.PEOPLE_INDEX_MAX_PROFILES,
+    ttl_seconds=settings.PEOPLE_INDEX_TTL_SECONDS,
+)
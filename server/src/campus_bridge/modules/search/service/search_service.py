@@ -0,0 +1,44 @@
+from uuid import UUID
+
+import structlog
+from fastapi import Depends
+
+from campus_bridge.data.schemas.search import PersonSearchResult
+from campus_bridge.modules.search.repository.search_repository import (
+    SearchRepository,
+    get_search_repository,
+)
+from campus_bridge.modules.search.service.people_index import (
+    PeopleIndex,
+    Person,
+    people_index,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class SearchService:
+    def __init__(self, repository: SearchRepository, people_index: PeopleIndex):
+        self.repository = repository
+        self.people_index = people_index
+
+    async def search_people(
+        self, college_id: UUID, query: str, limit: int
+    ) -> list[PersonSearchResult]:
+        """Typeahead over the students and alumni of a college"""
+        people = self.people_index.search(college_id, query, limit)
+        if people is None:
+            # college not indexed on this worker (yet), ask the database
+            logger.debug("people_search_fallback", college_id=str(college_id))
+            rows = await self.repository.search_people(
+                college_id, terms=query.lower().split(), limit=limit
+            )
+            people = [Person(*row) for row in rows]
+
+        return [PersonSearchResult(**person._asdict()) for person in people]
+
+
+def get_search_service(
+    repository: SearchRepository = Depends(get_search_repository),
+) -> SearchService:
+    return SearchService(repository, people_index=people_index)
@@ -1,14 +1,35 @@
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import delete, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy import delete, exists, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm import contains_eager, joinedload
 
 from campus_bridge.data.database.session import get_async_session
-from campus_bridge.data.models import User
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.data.models import College, User
 from campus_bridge.data.models.student import Student
 from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
+from campus_bridge.utils.cursor_pagination import cursor_pagination
+
+
+def _verified_students(
+    college_id: UUID | None,
+    branch: BranchEnum | None,
+    year_of_study: int | None,
+    roll_number: str | None,
+):
+    stmt = select(Student).join(Student.user).where(Student.is_verified == True)
+    if college_id is not None:
+        stmt = stmt.where(Student.college_id == college_id)
+    if branch is not None:
+        stmt = stmt.where(Student.branch == branch)
+    if year_of_study is not None:
+        stmt = stmt.where(Student.year_of_study == year_of_study)
+    if roll_number is not None:
+        stmt = stmt.where(Student.roll_number == roll_number)
+    return stmt
 
 
 class StudentRepository:
@@ -27,26 +48,57 @@ class StudentRepository:
         return student.scalar_one_or_none()
 
     @sqlalchemy_exceptions
-    async def get_all_students(self) -> list[Student]:
-        """Get all students"""
+    async def get_students(
+        self,
+        limit: int,
+        cursor: str | None,
+        college_id: UUID | None = None,
+        branch: BranchEnum | None = None,
+        year_of_study: int | None = None,
+        roll_number: str | None = None,
+    ) -> list[Student]:
+        """Fetch one keyset page of verified students, optionally filtered"""
+        stmt = _verified_students(college_id, branch, year_of_study, roll_number)
+        stmt = cursor_pagination(
+            stmt=stmt,
+            cursor=cursor,
+            limit=limit,
+            created_at_column=Student.created_at,
+            id_column=Student.id,
+        )
+
+        # the listing only shows these user columns, leave the rest unread
         students = await self.session.execute(
-            select(Student)
-            .join(User)
-            .where(Student.is_verified == True)
-            .options(joinedload(Student.user))
+            stmt.options(
+                contains_eager(Student.user).load_only(
+                    User.id,
+                    User.email,
+                    User.role,
+                    User.college_id,
+                    User.phone,
+                    User.is_verified,
+                )
+            )
         )
         return students.scalars().all()
 
     @sqlalchemy_exceptions
-    async def get_all_students_by_college(self, college_id: UUID) -> list[Student]:
-        """Get all students by college"""
-        students = await self.session.execute(
-            select(Student)
-            .join(User)
-            .where(User.college_id == college_id, Student.is_verified == True)
-            .options(joinedload(Student.user))
+    async def count_students(
+        self,
+        cap: int,
+        college_id: UUID | None = None,
+        branch: BranchEnum | None = None,
+        year_of_study: int | None = None,
+        roll_number: str | None = None,
+    ) -> int:
+        """Count verified students matching the filters, stopping at cap + 1"""
+        stmt = _verified_students(college_id, branch, year_of_study, roll_number)
+        result = await self.session.execute(
+            select(func.count()).select_from(
+                stmt.with_only_columns(Student.id).limit(cap + 1).subquery()
+            )
         )
-        return students.scalars().all()
+        return result.scalar_one()
 
     @sqlalchemy_exceptions
     async def create_student(self, student: Student) -> Student:
@@ -69,6 +121,140 @@ class StudentRepository:
         await self.session.execute(delete(Student).where(Student.id == student_id))
         await self.session.commit()
 
+    @sqlalchemy_exceptions
+    async def get_interest_profiles(self, college_id: UUID) -> list:
+        """
+        Get (id, user_id, first_name, last_name, branch, year_of_study,
+        interests) of the verified students of a college
+        """
+        result = await self.session.execute(
+            select(
+                Student.id,
+                Student.user_id,
+                Student.first_name,
+                Student.last_name,
+                Student.branch,
+                Student.year_of_study,
+                Student.interests,
+            )
+            .join(User)
+            .where(
+                Student.college_id == college_id,
+                ~User.is_deleted,
+                Student.is_verified == True,
+            )
+        )
+        return result.all()
+
+    @sqlalchemy_exceptions
+    async def college_exists(self, college_id: UUID) -> bool:
+        """Check that a college exists and is not deleted"""
+        result = await self.session.execute(
+            select(
+                exists().where(College.id == college_id, College.is_deleted == False)
+            )
+        )
+        return result.scalar()
+
+    @sqlalchemy_exceptions
+    async def get_taken_emails_and_phones(
+        self, emails: list[str], phones: list[str]
+    ) -> tuple[set[str], set[str]]:
+        """Which of the given emails and phones already belong to a user"""
+        result = await self.session.execute(
+            select(User.email, User.phone).where(
+                or_(User.email.in_(emails), User.phone.in_(phones))
+            )
+        )
+        taken_emails, taken_phones = set(), set()
+        for email, phone in result:
+            taken_emails.add(email)
+            taken_phones.add(phone)
+        return taken_emails, taken_phones
+
+    @sqlalchemy_exceptions
+    async def bulk_create_students(
+        self, users: list[dict], students: list[dict]
+    ) -> set[UUID]:
+        """
+        Insert users and their student profiles in one transaction.
+
+        Users whose email or phone, or students whose roll number, got taken
+        in the meantime are skipped by ON CONFLICT DO NOTHING, together with
+        their student or user. Returns the ids of the users that were inserted.
+        """
+        result = await self.session.execute(
+            insert(User).on_conflict_do_nothing().returning(User.id), users
+        )
+        created = set(result.scalars().all())
+
+        students = [student for student in students if student["user_id"] in created]
+        if students:
+            result = await self.session.execute(
+                insert(Student).on_conflict_do_nothing().returning(Student.user_id),
+                students,
+            )
+            orphans = created - set(result.scalars().all())
+            if orphans:
+                await self.session.execute(delete(User).where(User.id.in_(orphans)))
+                created -= orphans
+        await self.session.commit()
+        return created
+
+    @sqlalchemy_exceptions
+    async def get_by_roll_numbers(
+        self, college_id: UUID, roll_numbers: list[str]
+    ) -> list:
+        """
+        Get (roll_number, id, user_id) of the students of a college with the
+        given roll numbers, an index-only scan of the college roll number index
+        """
+        result = await self.session.execute(
+            select(Student.roll_number, Student.id, Student.user_id).where(
+                Student.college_id == college_id,
+                Student.roll_number.in_(roll_numbers),
+            )
+        )
+        return result.all()
+
+    @sqlalchemy_exceptions
+    async def stream_students_for_export(
+        self, college_id: UUID | None, batch_size: int
+    ) -> AsyncResult:
+        """
+        Open a server side cursor over students, of one college or all, as
+        (id, user_id, email, phone, first_name, middle_name, last_name,
+        roll_number, branch, year_of_study, is_verified, interests,
+        created_at) rows
+        """
+        stmt = (
+            select(
+                Student.id,
+                Student.user_id,
+                User.email,
+                User.phone,
+                Student.first_name,
+                Student.middle_name,
+                Student.last_name,
+                Student.roll_number,
+                Student.branch,
+                Student.year_of_study,
+                Student.is_verified,
+                Student.interests,
+                Student.created_at,
+            )
+            .join(User)
+            .where(User.is_deleted == False)
+        )
+        if college_id:
+            stmt = stmt.where(Student.college_id == college_id)
+
+        return await self.session.stream(
+            stmt.order_by(Student.created_at, Student.id).execution_options(
+                yield_per=batch_size
+            )
+        )
+
 
 def get_student_repository(
     db: AsyncSession = Depends(get_async_session),
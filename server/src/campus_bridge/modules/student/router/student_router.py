@@ -1,15 +1,30 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
-from campus_bridge.api.v1.dependencies import get_current_user
+from campus_bridge.api.v1.dependencies import (
+    get_current_user,
+    get_export_college_id,
+    get_roster_college_id,
+    require_admin,
+)
+from campus_bridge.data.database.session import read_only
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.data.enums.export import ExportFormatEnum
 from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.models import User
+from campus_bridge.data.schemas.pagination import CursorPage
 from campus_bridge.data.schemas.student import (
     StudentCreate,
-    StudentResponse,
+    StudentImportResponse,
+    StudentMatchResponse,
+    StudentProfileResponse,
+    StudentRollLookup,
+    StudentRollLookupRequest,
+    StudentRollLookupResponse,
     StudentUpdateRequest,
     StudentUpdateResponse,
+    StudentUserProfileResponse,
     StudentUserResponse,
 )
 from campus_bridge.errors.exc import UnauthorizedError
@@ -17,11 +32,15 @@ from campus_bridge.modules.student.service.student_service import (
     StudentService,
     get_student_service,
 )
+from campus_bridge.utils.multipart_stream import file_field_openapi
 
 router = APIRouter(prefix="/student", tags=["student"])
 
 
-@router.get("/me", status_code=status.HTTP_200_OK, response_model=StudentUserResponse)
+@router.get(
+    "/me", status_code=status.HTTP_200_OK, response_model=StudentUserProfileResponse
+)
+@read_only()
 async def get_current_student(
     current_user: User = Depends(get_current_user),
     student_service: StudentService = Depends(get_student_service),
@@ -31,45 +50,155 @@ async def get_current_student(
 
 
 @router.get(
-    "/", status_code=status.HTTP_200_OK, response_model=list[StudentUserResponse]
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[StudentUserResponse],
 )
+@read_only()
 async def get_all_students(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(None, description="Cursor for pagination"),
+    branch: BranchEnum | None = Query(None, description="Filter by branch"),
+    year_of_study: int | None = Query(None, description="Filter by year of study"),
+    roll_number: str | None = Query(None, description="Filter by roll number"),
     current_user: User = Depends(get_current_user),
     student_service: StudentService = Depends(get_student_service),
 ):
-    """Get all students"""
+    """Get a page of students of every college. Admin only."""
     if current_user.role != RoleEnum.ADMIN:
         raise UnauthorizedError(obj="student", act="get_all_students")
-    return await student_service.get_all_students(current_user)
+    return await student_service.get_students(
+        limit=limit,
+        cursor=cursor,
+        branch=branch,
+        year_of_study=year_of_study,
+        roll_number=roll_number,
+    )
 
 
 @router.get(
-    "/college", status_code=status.HTTP_200_OK, response_model=list[StudentUserResponse]
+    "/college",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[StudentUserResponse],
 )
+@read_only()
 async def get_all_students_by_college(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(None, description="Cursor for pagination"),
+    branch: BranchEnum | None = Query(None, description="Filter by branch"),
+    year_of_study: int | None = Query(None, description="Filter by year of study"),
+    roll_number: str | None = Query(None, description="Filter by roll number"),
+    current_user: User = Depends(get_current_user),
+    student_service: StudentService = Depends(get_student_service),
+):
+    """Get a page of students of current user college"""
+    return await student_service.get_students(
+        limit=limit,
+        cursor=cursor,
+        college_id=current_user.college_id,
+        branch=branch,
+        year_of_study=year_of_study,
+        roll_number=roll_number,
+    )
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_students(
+    format: ExportFormatEnum = Query(ExportFormatEnum.CSV, description="File format"),
+    college_id: UUID | None = Depends(get_export_college_id),
+    student_service: StudentService = Depends(get_student_service),
+):
+    """Download students as CSV or Parquet. Admins and officials of the college."""
+    return await student_service.export_students(
+        college_id=college_id, export_format=format
+    )
+
+
+@router.get(
+    "/by-roll/{roll_number}",
+    status_code=status.HTTP_200_OK,
+    response_model=StudentRollLookup,
+)
+@read_only()
+async def get_student_by_roll_number(
+    roll_number: str,
+    college_id: UUID = Depends(get_roster_college_id),
+    student_service: StudentService = Depends(get_student_service),
+):
+    """Find a student of a college by roll number. Admins and officials."""
+    return await student_service.get_by_roll_number(college_id, roll_number)
+
+
+@router.post(
+    "/by-roll",
+    status_code=status.HTTP_200_OK,
+    response_model=StudentRollLookupResponse,
+)
+async def get_students_by_roll_numbers(
+    lookup: StudentRollLookupRequest,
+    college_id: UUID = Depends(get_roster_college_id),
+    student_service: StudentService = Depends(get_student_service),
+):
+    """Find many students of a college by roll number in one query"""
+    return await student_service.get_by_roll_numbers(college_id, lookup.roll_numbers)
+
+
+@router.get(
+    "/matches",
+    status_code=status.HTTP_200_OK,
+    response_model=list[StudentMatchResponse],
+)
+@read_only()
+async def get_interest_matches(
+    limit: int = Query(default=10, ge=1, le=50),
     current_user: User = Depends(get_current_user),
     student_service: StudentService = Depends(get_student_service),
 ):
-    """Get all students of current user college"""
-    return await student_service.get_all_students_by_college(current_user.college_id)
+    """Get students of the current user's college with similar interests"""
+    return await student_service.get_interest_matches(current_user, limit=limit)
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED, response_model=StudentResponse)
+@router.post(
+    "/", status_code=status.HTTP_201_CREATED, response_model=StudentProfileResponse
+)
 async def create_student(
     student: StudentCreate,
     current_user: User = Depends(get_current_user),
     student_service: StudentService = Depends(get_student_service),
 ):
     """Create a new Student"""
-    if (
-        current_user.role != RoleEnum.ADMIN
-        or current_user.role != RoleEnum.STUDENT
-        or current_user.role != RoleEnum.OFFICIALS
-    ):
+    if current_user.role not in [RoleEnum.ADMIN, RoleEnum.STUDENT, RoleEnum.OFFICIALS]:
         raise UnauthorizedError(obj="student", act="create")
     return await student_service.create_student(student, current_user)
 
 
+@router.post(
+    "/import",
+    status_code=status.HTTP_200_OK,
+    response_model=StudentImportResponse,
+    openapi_extra=file_field_openapi("file"),
+)
+async def import_students(
+    request: Request,
+    college_id: UUID = Query(description="College the students belong to"),
+    mark_verified: bool = Query(
+        default=False, description="Mark imported students as verified"
+    ),
+    admin_user: User = Depends(require_admin),
+    student_service: StudentService = Depends(get_student_service),
+):
+    """
+    Bulk onboard students from a CSV file. Admin only.
+
+    Columns: email, phone, password, first_name, middle_name, last_name,
+    roll_number, branch, year_of_study, id_card_url, interests (JSON).
+    """
+    if admin_user:
+        return await student_service.import_students(
+            request, college_id=college_id, mark_verified=mark_verified
+        )
+
+
 @router.patch("/", status_code=status.HTTP_200_OK, response_model=StudentUpdateResponse)
 async def update_student(
     student: StudentUpdateRequest,
@@ -77,11 +206,7 @@ async def update_student(
     student_service: StudentService = Depends(get_student_service),
 ):
     """Partially update student details"""
-    if (
-        current_user.role != RoleEnum.ADMIN
-        or current_user.role != RoleEnum.STUDENT
-        or current_user.role != RoleEnum.OFFICIALS
-    ):
+    if current_user.role not in [RoleEnum.ADMIN, RoleEnum.STUDENT, RoleEnum.OFFICIALS]:
         raise UnauthorizedError(obj="student", act="update")
     return await student_service.update_student(student, current_user)
 
@@ -0,0 +1,146 @@
+import asyncio
+from typing import NamedTuple
+from uuid import UUID
+
+import numpy as np
+import structlog
+from scipy import sparse
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.modules.student.repository.student_repository import (
+    StudentRepository,
+)
+from campus_bridge.utils.college_cache import CollegeCache
+from campus_bridge.utils.interests import interest_tags
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class InterestMatch(NamedTuple):
+    student_id: UUID
+    user_id: UUID
+    first_name: str
+    last_name: str | None
+    branch: BranchEnum
+    year_of_study: int
+    score: float
+    shared_interests: list[str]
+
+
+class _CollegeMatrix:
+    """Interest tags of a college's students as L2-normalized sparse rows"""
+
+    def __init__(self, rows: list):
+        self.profiles = [row[:6] for row in rows]
+        self.tags = [interest_tags(row[6]) for row in rows]
+        self.row_of = {profile[0]: i for i, profile in enumerate(self.profiles)}
+        self.vocabulary: dict[str, int] = {}
+        self.cache: dict[UUID, list[InterestMatch]] = {}
+
+        indptr, indices = [0], []
+        for tags in self.tags:
+            indices.extend(
+                self.vocabulary.setdefault(tag, len(self.vocabulary)) for tag in tags
+            )
+            indptr.append(len(indices))
+        lengths = np.diff(indptr)
+        # binary rows scaled to unit length, so a dot product is the cosine
+        data = np.repeat(1.0 / np.sqrt(np.maximum(lengths, 1)), lengths).astype(
+            np.float32
+        )
+        self.matrix = sparse.csr_matrix(
+            (data, np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+            shape=(len(self.profiles), max(len(self.vocabulary), 1)),
+        )
+
+    def top_k(
+        self, student_id: UUID, tags: frozenset[str], k: int
+    ) -> list[InterestMatch]:
+        columns = [self.vocabulary[tag] for tag in tags if tag in self.vocabulary]
+        if not columns:
+            return []
+
+        query = np.zeros(self.matrix.shape[1], dtype=np.float32)
+        query[columns] = 1.0 / np.sqrt(len(tags))
+        # one sparse matrix-vector product scores the whole college
+        scores = self.matrix @ query
+        own_row = self.row_of.get(student_id)
+        if own_row is not None:
+            scores[own_row] = 0.0
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [
+            InterestMatch(
+                *self.profiles[i],
+                score=round(float(scores[i]), 4),
+                shared_interests=sorted(self.tags[i] & tags),
+            )
+            for i in candidates
+        ]
+
+
+class InterestMatcher:
+    """
+    Per-worker "students with similar interests" engine.
+
+    Each college's verified students are loaded once into a sparse matrix
+    and scored against a student with a single matrix-vector product.
+    Results are cached per student until the college is invalidated by an
+    interests update on this worker or its matrix outlives the TTL, which
+    also picks up changes made on other workers. At most `max_colleges`
+    matrices are kept, least recently used out first.
+    """
+
+    def __init__(self, max_colleges: int, ttl_seconds: int, top_k: int):
+        self.top_k = top_k
+        self._colleges: CollegeCache[_CollegeMatrix] = CollegeCache(
+            max_colleges=max_colleges, ttl_seconds=ttl_seconds
+        )
+
+    async def _build(
+        self, repository: StudentRepository, college_id: UUID
+    ) -> _CollegeMatrix:
+        rows = await repository.get_interest_profiles(college_id)
+        college = await asyncio.to_thread(_CollegeMatrix, rows)
+        logger.debug(
+            "interest_matrix_built",
+            college_id=str(college_id),
+            students=len(rows),
+            tags=len(college.vocabulary),
+        )
+        return college
+
+    async def matches(
+        self,
+        repository: StudentRepository,
+        college_id: UUID,
+        student_id: UUID,
+        interests: dict,
+        limit: int,
+    ) -> list[InterestMatch]:
+        """Students of the college with the most interests in common"""
+        college = await self._colleges.get(
+            college_id, lambda: self._build(repository, college_id)
+        )
+        cached = college.cache.get(student_id)
+        if cached is None:
+            cached = college.cache[student_id] = college.top_k(
+                student_id, interest_tags(interests), self.top_k
+            )
+        return cached[:limit]
+
+    def invalidate(self, college_id: UUID) -> None:
+        """Drop a college's matrix and cached matches after an interests change"""
+        self._colleges.invalidate(college_id)
+
+
+interest_matcher = InterestMatcher(
+    max_colleges=settings.INTEREST_MATCH_MAX_COLLEGES,
+    ttl_seconds=settings.INTEREST_MATCH_TTL_SECONDS,
+    top_k=settings.INTEREST_MATCH_TOP_K,
+)
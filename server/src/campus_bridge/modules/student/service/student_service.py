@@ -1,31 +1,104 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import structlog
-from fastapi import Depends
+from fastapi import Depends, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
+from campus_bridge.config.settings import settings
+from campus_bridge.core.security import hash_passwords
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.data.enums.export import ExportFormatEnum
+from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.models.student import Student
 from campus_bridge.data.models.user import User
+from campus_bridge.data.schemas.pagination import CursorPage
 from campus_bridge.data.schemas.student import (
     StudentCreate,
-    StudentResponse,
+    StudentImportError,
+    StudentImportResponse,
+    StudentImportRow,
+    StudentMatchResponse,
+    StudentProfileResponse,
+    StudentRollLookup,
+    StudentRollLookupResponse,
     StudentUpdateRequest,
     StudentUpdateResponse,
+    StudentUserProfileResponse,
     StudentUserResponse,
 )
 from campus_bridge.errors.exc import ConflictError, NotFoundError
+from campus_bridge.modules.search.service.people_index import (
+    PeopleIndex,
+    Person,
+    people_index,
+)
 from campus_bridge.modules.student.repository.student_repository import (
     StudentRepository,
     get_student_repository,
 )
+from campus_bridge.modules.student.service.interest_matcher import (
+    InterestMatcher,
+    interest_matcher,
+)
+from campus_bridge.modules.uploads.service.thumbnail_service import (
+    ThumbnailService,
+    thumbnail_service,
+)
+from campus_bridge.utils.csv_stream import iter_csv_records
+from campus_bridge.utils.cursor_pagination import encode_cursor
+from campus_bridge.utils.export_stream import ExportColumn, export_response
+from campus_bridge.utils.multipart_stream import stream_file_field
 
 logger = structlog.get_logger(__name__)
 
+STUDENT_EXPORT_COLUMNS = [
+    ExportColumn("id"),
+    ExportColumn("user_id"),
+    ExportColumn("email"),
+    ExportColumn("phone"),
+    ExportColumn("first_name"),
+    ExportColumn("middle_name"),
+    ExportColumn("last_name"),
+    ExportColumn("roll_number"),
+    ExportColumn("branch"),
+    ExportColumn("year_of_study", "int"),
+    ExportColumn("is_verified", "bool"),
+    ExportColumn("interests", "json"),
+    ExportColumn("created_at", "datetime"),
+]
+
 
 class StudentService:
-    def __init__(self, student_repository: StudentRepository):
+    def __init__(
+        self,
+        student_repository: StudentRepository,
+        people_index: PeopleIndex,
+        interest_matcher: InterestMatcher,
+        thumbnail_service: ThumbnailService,
+    ):
         self.student_repository = student_repository
+        self.people_index = people_index
+        self.interest_matcher = interest_matcher
+        self.thumbnail_service = thumbnail_service
 
-    async def get_current_student(self, user: User) -> StudentUserResponse:
+    def _sync_people_index(self, student: Student, user: User) -> None:
+        # only verified students are searchable
+        if not student.is_verified:
+            self.people_index.remove(user.college_id, user.id)
+            return
+        self.people_index.upsert(
+            user.college_id,
+            Person(
+                user.id,
+                RoleEnum.STUDENT,
+                user.email,
+                student.first_name,
+                student.last_name,
+            ),
+        )
+
+    async def get_current_student(self, user: User) -> StudentUserProfileResponse:
         """Get a current student profile"""
 
         student = await self.student_repository.get_by_user_id(user.id)
@@ -33,43 +106,67 @@ class StudentService:
             logger.error("Student not found", user_id=str(user.id))
             raise NotFoundError(resource="Student", message="Student not found")
         logger.info("Student found", user_id=str(user.id), student_id=str(student.id))
-        return StudentUserResponse(student=student, user=user)
+        response = StudentUserProfileResponse(student=student, user=user)
+        await self.thumbnail_service.fill_urls(
+            [(response.student, response.student.id_card_url)]
+        )
+        return response
 
-    async def get_all_students(self, user: User) -> list[StudentUserResponse]:
-        """Get all students"""
+    async def get_students(
+        self,
+        limit: int,
+        cursor: str | None,
+        college_id: UUID | None = None,
+        branch: BranchEnum | None = None,
+        year_of_study: int | None = None,
+        roll_number: str | None = None,
+    ) -> CursorPage[StudentUserResponse]:
+        """Get a page of verified students, of one college or all, filtered"""
+        filters = dict(
+            college_id=college_id,
+            branch=branch,
+            year_of_study=year_of_study,
+            roll_number=roll_number,
+        )
 
-        students = await self.student_repository.get_all_students()
-        if not students:
-            logger.error("Students not found", user_id=str(user.id))
-            raise NotFoundError(resource="Students", message="Students not found")
-        logger.info(
-            "Students found", user_id=str(user.id), students_count=len(students)
+        # one extra row tells whether there is a next page
+        students = await self.student_repository.get_students(
+            limit=limit + 1, cursor=cursor, **filters
+        )
+
+        next_cursor = None
+        if len(students) > limit:
+            students = students[:limit]
+            next_cursor = encode_cursor(students[-1].created_at, students[-1].id)
+
+        page = CursorPage[StudentUserResponse](
+            items=[
+                StudentUserResponse(student=student, user=student.user)
+                for student in students
+            ],
+            next_cursor=next_cursor,
         )
-        return [
-            StudentUserResponse(student=student, user=student.user)
-            for student in students
-        ]
 
-    async def get_all_students_by_college(
-        self, college_id: UUID
-    ) -> list[StudentUserResponse]:
-        """Get all students by college"""
+        # the total only changes the header of the listing, count it once
+        if cursor is None:
+            cap = settings.DIRECTORY_COUNT_CAP
+            if next_cursor is None:
+                total = len(students)
+            else:
+                total = await self.student_repository.count_students(cap=cap, **filters)
+            page.total = min(total, cap)
+            page.is_total_capped = total > cap
 
-        students = await self.student_repository.get_all_students_by_college(college_id)
-        if not students:
-            logger.error("Students not found", college_id=str(college_id))
-            raise NotFoundError(resource="Students", message="Students not found")
         logger.info(
-            "Students found", college_id=str(college_id), students_count=len(students)
+            "Students found",
+            college_id=str(college_id) if college_id else None,
+            students_count=len(students),
         )
-        return [
-            StudentUserResponse(student=student, user=student.user)
-            for student in students
-        ]
+        return page
 
     async def create_student(
         self, student: StudentCreate, user: User
-    ) -> StudentResponse:
+    ) -> StudentProfileResponse:
         """Create a new Student"""
 
         # check if student already exists with the current user id
@@ -78,21 +175,28 @@ class StudentService:
             logger.error("Student already exists", user_id=str(user.id))
             raise ConflictError(resource="Student", message="Student already exists")
 
+        await self._ensure_roll_number_free(user.college_id, student.roll_number)
+
         # create student
         student = Student(
             user_id=user.id,
+            college_id=user.college_id,
             first_name=student.first_name,
             middle_name=student.middle_name,
             last_name=student.last_name,
             roll_number=student.roll_number,
             branch=student.branch,
             year_of_study=student.year_of_study,
+            id_card_url=student.id_card_url,
             interests=student.interests,
         )
 
         student = await self.student_repository.create_student(student)
+        self._sync_people_index(student, user)
         logger.info("Student created", user_id=str(user.id), student_id=str(student.id))
-        return StudentResponse.model_validate(student)
+        response = StudentProfileResponse.model_validate(student)
+        await self.thumbnail_service.fill_urls([(response, response.id_card_url)])
+        return response
 
     async def update_student(
         self, student: StudentUpdateRequest, user: User
@@ -100,24 +204,89 @@ class StudentService:
         """Update student profile (partially)"""
 
         # check if the current user is a student
-        student = await self.student_repository.get_by_user_id(user.id)
-        if not student:
+        student_db = await self.student_repository.get_by_user_id(user.id)
+        if not student_db:
             logger.error("Student not found", user_id=str(user.id))
-            raise NotFoundError(resource="Student", message="Student not found")
-        logger.info("Student found", user_id=str(user.id), student_id=str(student.id))
+            raise NotFoundError(resource="Student", identifier=user.id)
+        logger.info(
+            "Student found", user_id=str(user.id), student_id=str(student_db.id)
+        )
 
-        for field, value in student.model_dump(exclude_unset=True).items():
-            setattr(student, field, value)
+        updated_data = student.model_dump(exclude_unset=True)
+        roll_number = updated_data.get("roll_number")
+        if roll_number and roll_number != student_db.roll_number:
+            await self._ensure_roll_number_free(user.college_id, roll_number)
 
-        updated_student = await self.student_repository.update_student(student)
+        for field, value in updated_data.items():
+            setattr(student_db, field, value)
+
+        updated_student = await self.student_repository.update_student(student_db)
+        if "interests" in updated_data:
+            self.interest_matcher.invalidate(user.college_id)
+        self._sync_people_index(updated_student, user)
         logger.info(
             "Student updated",
             user_id=str(user.id),
-            student_id=str(student.id),
-            updated_fields=list(updated_student.keys()),
+            student_id=str(student_db.id),
+            updated_fields=list(updated_data.keys()),
         )
         return StudentUpdateResponse.model_validate(updated_student)
 
+    async def _ensure_roll_number_free(self, college_id: UUID, roll_number: str):
+        if await self.student_repository.get_by_roll_numbers(college_id, [roll_number]):
+            logger.warning("Roll number taken", college_id=str(college_id))
+            raise ConflictError(message="Roll number already exists in this college")
+
+    async def get_by_roll_number(
+        self, college_id: UUID, roll_number: str
+    ) -> StudentRollLookup:
+        """Resolve one roll number of a college to its student"""
+        lookup = await self.get_by_roll_numbers(college_id, [roll_number])
+        if not lookup.found:
+            raise NotFoundError(resource="Student", identifier=roll_number)
+        return lookup.found[0]
+
+    async def get_by_roll_numbers(
+        self, college_id: UUID, roll_numbers: list[str]
+    ) -> StudentRollLookupResponse:
+        """Resolve roll numbers of a college to students in one query"""
+        roll_numbers = list(dict.fromkeys(roll_numbers))
+        rows = await self.student_repository.get_by_roll_numbers(
+            college_id, roll_numbers
+        )
+        found = {
+            roll_number: StudentRollLookup(
+                roll_number=roll_number, student_id=student_id, user_id=user_id
+            )
+            for roll_number, student_id, user_id in rows
+        }
+        return StudentRollLookupResponse(
+            found=[found[roll] for roll in roll_numbers if roll in found],
+            missing=[roll for roll in roll_numbers if roll not in found],
+        )
+
+    async def get_interest_matches(
+        self, user: User, limit: int
+    ) -> list[StudentMatchResponse]:
+        """Get students of the current user's college with similar interests"""
+
+        student = await self.student_repository.get_by_user_id(user.id)
+        if not student:
+            logger.error("Student not found", user_id=str(user.id))
+            raise NotFoundError(resource="Student", identifier=user.id)
+
+        matches = await self.interest_matcher.matches(
+            self.student_repository,
+            college_id=user.college_id,
+            student_id=student.id,
+            interests=student.interests,
+            limit=limit,
+        )
+        logger.info(
+            "Interest matches found", student_id=str(student.id), count=len(matches)
+        )
+        return [StudentMatchResponse(**match._asdict()) for match in matches]
+
     async def delete_student(self, user: User) -> None:
         """Delete student profile"""
 
@@ -129,10 +298,196 @@ class StudentService:
         logger.info("Student found", user_id=str(user.id), student_id=str(student.id))
 
         await self.student_repository.delete_student(student.id)
+        self.people_index.remove(user.college_id, user.id)
         logger.info("Student deleted", user_id=str(user.id), student_id=str(student.id))
 
+    async def import_students(
+        self, request: Request, college_id: UUID, mark_verified: bool
+    ) -> StudentImportResponse:
+        """
+        Bulk onboard students of a college from an uploaded CSV file.
+
+        The file is parsed while it streams in and imported in chunks: each
+        chunk is checked against existing users with one query, its passwords
+        are hashed in parallel, and its users and students are inserted with
+        one multi-row INSERT each. Bad rows are reported, not fatal.
+        """
+        if not await self.student_repository.college_exists(college_id):
+            raise NotFoundError(resource="College", identifier=college_id)
+
+        report = StudentImportResponse(
+            total_rows=0, imported=0, failed=0, errors=[], errors_truncated=False
+        )
+        seen_emails: set[str] = set()
+        seen_phones: set[str] = set()
+        seen_roll_numbers: set[str] = set()
+        chunk: list[tuple[int, StudentImportRow]] = []
+
+        records = iter_csv_records(stream_file_field(request, "file"))
+        async for line, record in records:
+            report.total_rows += 1
+            try:
+                row = StudentImportRow.model_validate(record)
+            except ValidationError as exc:
+                self._reject(report, line, _validation_message(exc))
+                continue
+
+            if row.email in seen_emails:
+                self._reject(report, line, "Duplicate email in file")
+                continue
+            if row.phone in seen_phones:
+                self._reject(report, line, "Duplicate phone in file")
+                continue
+            if row.roll_number in seen_roll_numbers:
+                self._reject(report, line, "Duplicate roll number in file")
+                continue
+            seen_emails.add(row.email)
+            seen_phones.add(row.phone)
+            seen_roll_numbers.add(row.roll_number)
+
+            chunk.append((line, row))
+            if len(chunk) >= settings.STUDENT_IMPORT_CHUNK_SIZE:
+                await self._import_chunk(college_id, chunk, mark_verified, report)
+                chunk = []
+
+        if chunk:
+            await self._import_chunk(college_id, chunk, mark_verified, report)
+        report.errors.sort(key=lambda error: error.line)
+
+        logger.info(
+            "Students imported",
+            college_id=str(college_id),
+            total_rows=report.total_rows,
+            imported=report.imported,
+            failed=report.failed,
+        )
+        return report
+
+    async def _import_chunk(
+        self,
+        college_id: UUID,
+        chunk: list[tuple[int, StudentImportRow]],
+        mark_verified: bool,
+        report: StudentImportResponse,
+    ) -> None:
+        taken_emails, taken_phones = (
+            await self.student_repository.get_taken_emails_and_phones(
+                emails=[row.email for _, row in chunk],
+                phones=[row.phone for _, row in chunk],
+            )
+        )
+
+        taken_roll_numbers = {
+            roll_number
+            for roll_number, _, _ in await self.student_repository.get_by_roll_numbers(
+                college_id, [row.roll_number for _, row in chunk]
+            )
+        }
+
+        rows = []
+        for line, row in chunk:
+            if row.email in taken_emails:
+                self._reject(report, line, "Email already registered")
+            elif row.phone in taken_phones:
+                self._reject(report, line, "Phone already registered")
+            elif row.roll_number in taken_roll_numbers:
+                self._reject(report, line, "Roll number already registered")
+            else:
+                rows.append((line, row, uuid4()))
+        if not rows:
+            return
+
+        hashed_passwords = await hash_passwords([row.password for _, row, _ in rows])
+        users = [
+            {
+                "id": user_id,
+                "college_id": college_id,
+                "email": row.email,
+                "password": hashed_password,
+                "phone": row.phone,
+                "role": RoleEnum.STUDENT,
+                "is_verified": mark_verified,
+            }
+            for (_, row, user_id), hashed_password in zip(rows, hashed_passwords)
+        ]
+        students = [
+            {
+                "user_id": user_id,
+                "college_id": college_id,
+                "is_verified": mark_verified,
+                **row.model_dump(exclude={"email", "phone", "password"}),
+            }
+            for _, row, user_id in rows
+        ]
+
+        created = await self.student_repository.bulk_create_students(users, students)
+        report.imported += len(created)
+
+        # only verified students are searchable
+        if mark_verified:
+            for _, row, user_id in rows:
+                if user_id in created:
+                    self.people_index.upsert(
+                        college_id,
+                        Person(
+                            user_id,
+                            RoleEnum.STUDENT,
+                            row.email,
+                            row.first_name,
+                            row.last_name,
+                        ),
+                    )
+
+        # registered by someone else between the lookup and the insert
+        for line, _, user_id in rows:
+            if user_id not in created:
+                self._reject(
+                    report, line, "Email, phone or roll number already registered"
+                )
+
+    async def export_students(
+        self, college_id: UUID | None, export_format: ExportFormatEnum
+    ) -> StreamingResponse:
+        """Stream students, of one college or all, as a CSV or Parquet file"""
+        rows = await self.student_repository.stream_students_for_export(
+            college_id=college_id, batch_size=settings.EXPORT_BATCH_SIZE
+        )
+        logger.info(
+            "Exporting students",
+            college_id=str(college_id) if college_id else None,
+            format=export_format.value,
+        )
+        return export_response(
+            rows,
+            STUDENT_EXPORT_COLUMNS,
+            export_format,
+            filename=f"students-{college_id or 'all'}",
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
+
+    @staticmethod
+    def _reject(report: StudentImportResponse, line: int, message: str) -> None:
+        report.failed += 1
+        if len(report.errors) < settings.STUDENT_IMPORT_MAX_ERRORS:
+            report.errors.append(StudentImportError(line=line, message=message))
+        else:
+            report.errors_truncated = True
+
+
+def _validation_message(exc: ValidationError) -> str:
+    # never echo the input back, the row carries a password
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
 
 def get_student_service(
     student_repository: StudentRepository = Depends(get_student_repository),
 ) -> StudentService:
-    return StudentService(student_repository)
+    return StudentService(
+        student_repository,
+        people_index=people_index,
+        interest_matcher=interest_matcher,
+        thumbnail_service=thumbnail_service,
+    )
@@ -0,0 +1,36 @@
+from fastapi import Depends
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from campus_bridge.data.database.session import get_async_session
+from campus_bridge.data.models import Alumni, CollegeOfficial, Student, User
+from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
+
+
+class UploadRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @sqlalchemy_exceptions
+    async def get_id_card_owners(self, id_card_urls: list[str]) -> list:
+        """
+        Get (user_id, college_id) of the users whose student, alumni or
+        official profile has one of the given id card URLs
+        """
+        result = await self.db.execute(
+            union(
+                *(
+                    select(User.id, User.college_id)
+                    .join(model, model.user_id == User.id)
+                    .where(model.id_card_url.in_(id_card_urls))
+                    for model in (Student, Alumni, CollegeOfficial)
+                )
+            )
+        )
+        return result.all()
+
+
+def get_upload_repository(
+    db: AsyncSession = Depends(get_async_session),
+) -> UploadRepository:
+    return UploadRepository(db)
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
+
+from campus_bridge.api.v1.dependencies import get_current_user
+from campus_bridge.data.database.session import read_only
+from campus_bridge.data.models.user import User
+from campus_bridge.data.schemas.upload import UploadResponse
+from campus_bridge.modules.uploads.service.upload_service import (
+    UploadService,
+    get_upload_service,
+)
+from campus_bridge.utils.multipart_stream import file_field_openapi
+
+router = APIRouter(prefix="/uploads", tags=["uploads"])
+# mounted at UPLOAD_BASE_URL, where the URLs of stored files point
+media_router = APIRouter(tags=["uploads"])
+
+
+@router.post(
+    "/id-card",
+    status_code=status.HTTP_201_CREATED,
+    response_model=UploadResponse,
+    openapi_extra=file_field_openapi("file"),
+)
+async def upload_id_card(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    upload_service: UploadService = Depends(get_upload_service),
+):
+    """Upload an ID card image or PDF and get the URL to store as id_card_url"""
+    return await upload_service.upload_id_card(request, current_user)
+
+
+@media_router.get("/{key:path}", response_class=StreamingResponse)
+@read_only()
+async def get_uploaded_file(
+    key: str,
+    current_user: User = Depends(get_current_user),
+    upload_service: UploadService = Depends(get_upload_service),
+):
+    """
+    Download an uploaded file or thumbnail by the key in its URL, for the ID
+    card's owner, admins and the officials of the owner's college
+    """
+    chunks, content_type = await upload_service.open_file(key, current_user)
+    return StreamingResponse(
+        chunks,
+        media_type=content_type,
+        headers={
+            # content addressed, a key never changes what it points to
+            "Cache-Control": "private, max-age=31536000, immutable",
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
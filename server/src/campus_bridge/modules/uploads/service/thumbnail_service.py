@@ -0,0 +1,156 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import PurePosixPath
+from typing import Iterable
+
+import structlog
+
+from campus_bridge.config.settings import settings
+from campus_bridge.core.storage import BlobStore, blob_store
+from campus_bridge.data.schemas.upload import IdCardThumbnails
+from campus_bridge.utils.thumbnails import (
+    render_thumbnails,
+    thumbnail_key,
+    uploaded_image_key,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# images that failed to render, not retried by profile reads
+MAX_FAILED = 10_000
+
+
+class ThumbnailService:
+    """
+    Background thumbnail stage for uploaded images.
+
+    Uploads enqueue (content hash, blob key) jobs; a few consumer tasks read
+    the source blob, hand the resizing to a process pool so the event loop
+    never runs Pillow, and store the results. Thumbnails are addressed by
+    content hash, so a job whose thumbnails already exist is skipped.
+
+    Profiles only report the thumbnails that exist. Reading one whose image
+    still misses some queues it again, so a job dropped on a full queue or a
+    restart, or one that failed, is retried by the next read; an image that
+    failed to render is not retried until the worker restarts.
+    """
+
+    def __init__(
+        self, store: BlobStore, sizes: list[int], processes: int, queue_size: int
+    ):
+        self.store = store
+        self.sizes = sizes
+        self.processes = processes
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(queue_size)
+        self._queued: set[str] = set()
+        self._failed: OrderedDict[str, None] = OrderedDict()
+        self._pool: ProcessPoolExecutor | None = None
+        self._consumers: list[asyncio.Task] = []
+
+    def enqueue(self, sha256: str, key: str) -> bool:
+        """Queue thumbnails for an uploaded image, False when the queue is full"""
+        if sha256 in self._queued or sha256 in self._failed:
+            return True
+        try:
+            self._queue.put_nowait((sha256, key))
+        except asyncio.QueueFull:
+            logger.warning("thumbnail_queue_full", sha256=sha256)
+            return False
+        self._queued.add(sha256)
+        return True
+
+    async def fill_urls(
+        self, profiles: Iterable[tuple[IdCardThumbnails, str | None]]
+    ) -> None:
+        """
+        Set the id card thumbnail URLs of (response, id_card_url) pairs to the
+        thumbnails that exist, in one store lookup
+        """
+        wanted = []
+        for response, id_card_url in profiles:
+            key = uploaded_image_key(id_card_url)
+            if key is not None:
+                sha256 = PurePosixPath(key).stem
+                sizes = {size: thumbnail_key(sha256, size) for size in self.sizes}
+                wanted.append((response, sha256, key, sizes))
+
+        existing = await self.store.existing(
+            [key for *_, sizes in wanted for key in sizes.values()]
+        )
+        for response, sha256, key, sizes in wanted:
+            response.id_card_thumbnail_urls = {
+                size: self.store.url_for(thumbnail)
+                for size, thumbnail in sizes.items()
+                if thumbnail in existing
+            }
+            if len(response.id_card_thumbnail_urls) < len(sizes):
+                self.enqueue(sha256, key)
+
+    async def _missing_sizes(self, sha256: str) -> list[int]:
+        return [
+            size
+            for size in self.sizes
+            if not await self.store.exists(thumbnail_key(sha256, size))
+        ]
+
+    async def generate(self, sha256: str, key: str) -> int:
+        """Render and store the missing thumbnails of one image"""
+        sizes = await self._missing_sizes(sha256)
+        if not sizes:
+            return 0
+
+        data = await self.store.read(key)
+        loop = asyncio.get_running_loop()
+        thumbnails = await loop.run_in_executor(
+            self._pool, render_thumbnails, data, sizes
+        )
+        for size, thumbnail in thumbnails.items():
+            await self.store.put(thumbnail_key(sha256, size), thumbnail)
+        return len(thumbnails)
+
+    async def _consume(self) -> None:
+        while True:
+            sha256, key = await self._queue.get()
+            try:
+                generated = await self.generate(sha256, key)
+                logger.debug("thumbnails_generated", sha256=sha256, count=generated)
+            except Exception as exc:
+                logger.exception("thumbnail_generation_failed", sha256=sha256, exc=exc)
+                self._failed[sha256] = None
+                if len(self._failed) > MAX_FAILED:
+                    self._failed.popitem(last=False)
+            finally:
+                self._queued.discard(sha256)
+                self._queue.task_done()
+
+    def start(self) -> None:
+        """Start the process pool and consumers (called from lifespan)"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processes)
+            # one consumer per process keeps the pool busy without queueing
+            # more decoded images in memory than it can work on
+            self._consumers = [
+                asyncio.create_task(self._consume()) for _ in range(self.processes)
+            ]
+
+    async def stop(self) -> None:
+        """Stop consumers and the process pool (called from lifespan)"""
+        for consumer in self._consumers:
+            consumer.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._consumers = []
+
+        if self._pool is not None:
+            if not self._queue.empty():
+                logger.warning("thumbnail_jobs_dropped", jobs=self._queue.qsize())
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+thumbnail_service = ThumbnailService(
+    store=blob_store,
+    sizes=settings.THUMBNAIL_SIZES,
+    processes=settings.THUMBNAIL_PROCESSES,
+    queue_size=settings.THUMBNAIL_QUEUE_SIZE,
+)
@@ -0,0 +1,194 @@
+import hashlib
+import mimetypes
+from pathlib import PurePosixPath
+from typing import AsyncIterator
+
+import structlog
+from fastapi import Depends, Request
+
+from campus_bridge.config.settings import settings
+from campus_bridge.core.storage import BlobStore, get_blob_store
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.data.models.user import User
+from campus_bridge.data.schemas.upload import UploadResponse
+from campus_bridge.errors.exc import (
+    BadRequestError,
+    NotFoundError,
+    PayloadTooLargeError,
+    UnauthorizedError,
+    UnsupportedMediaTypeError,
+)
+from campus_bridge.modules.uploads.repository.upload_repository import (
+    UploadRepository,
+    get_upload_repository,
+)
+from campus_bridge.modules.uploads.service.thumbnail_service import (
+    ThumbnailService,
+    thumbnail_service,
+)
+from campus_bridge.utils.multipart_stream import stream_file_field
+from campus_bridge.utils.thumbnails import SERVED_KEY
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# leading bytes -> (content type, extension), checked against the content
+# itself rather than the client supplied Content-Type
+ID_CARD_SIGNATURES: list[tuple[bytes, str, str]] = [
+    (b"\xff\xd8\xff", "image/jpeg", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png", ".png"),
+    (b"%PDF-", "application/pdf", ".pdf"),
+]
+SNIFF_BYTES = 12
+
+# room for boundaries and part headers on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+
+def _sniff(head: bytes) -> tuple[str, str] | None:
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp", ".webp"
+    for signature, content_type, extension in ID_CARD_SIGNATURES:
+        if head.startswith(signature):
+            return content_type, extension
+    return None
+
+
+class UploadService:
+    def __init__(
+        self,
+        repository: UploadRepository,
+        store: BlobStore,
+        thumbnail_service: ThumbnailService,
+        max_bytes: int,
+    ):
+        self.repository = repository
+        self.store = store
+        self.thumbnail_service = thumbnail_service
+        self.max_bytes = max_bytes
+
+    async def upload_id_card(self, request: Request, user: User) -> UploadResponse:
+        """Stream an ID card into the blob store, deduplicated by content hash"""
+        allowed = [content_type for _, content_type, _ in ID_CARD_SIGNATURES]
+        allowed.append("image/webp")
+
+        content_length = request.headers.get("content-length")
+        if (
+            content_length
+            and content_length.isdigit()
+            and int(content_length) > self.max_bytes + MULTIPART_OVERHEAD_BYTES
+        ):
+            raise PayloadTooLargeError(resource="ID card", max_bytes=self.max_bytes)
+
+        digest = hashlib.sha256()
+        size = 0
+        head = b""
+        detected: tuple[str, str] | None = None
+        committed = False
+
+        writer = await self.store.open_writer()
+        try:
+            async for chunk in stream_file_field(request, "file"):
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise PayloadTooLargeError(
+                        resource="ID card", max_bytes=self.max_bytes
+                    )
+
+                if detected is None and len(head) < SNIFF_BYTES:
+                    head += chunk[: SNIFF_BYTES - len(head)]
+                    if len(head) >= SNIFF_BYTES:
+                        detected = _sniff(head)
+                        if detected is None:
+                            raise UnsupportedMediaTypeError(
+                                resource="ID card", allowed=allowed
+                            )
+
+                digest.update(chunk)
+                await writer.write(chunk)
+
+            if size == 0:
+                raise BadRequestError(
+                    message="ID card file is empty", details="Uploaded file is empty"
+                )
+            detected = detected or _sniff(head)
+            if detected is None:
+                raise UnsupportedMediaTypeError(resource="ID card", allowed=allowed)
+
+            content_type, extension = detected
+            sha256 = digest.hexdigest()
+            key = f"id-cards/{sha256[:2]}/{sha256}{extension}"
+
+            is_duplicate = await self.store.exists(key)
+            if not is_duplicate:
+                await writer.commit(key)
+                committed = True
+        finally:
+            if not committed:
+                await writer.abort()
+
+        if content_type.startswith("image/"):
+            self.thumbnail_service.enqueue(sha256, key)
+
+        logger.info(
+            "id_card_uploaded",
+            user_id=str(user.id),
+            sha256=sha256,
+            size=size,
+            is_duplicate=is_duplicate,
+        )
+        return UploadResponse(
+            url=self.store.url_for(key),
+            sha256=sha256,
+            size=size,
+            content_type=content_type,
+            is_duplicate=is_duplicate,
+        )
+
+    def _id_card_urls(self, key: str) -> list[str]:
+        # a thumbnail belongs to the ID card it was rendered from, whichever
+        # image type that was
+        if key.startswith("thumbnails/"):
+            path = PurePosixPath(key)
+            sha256 = path.stem.split("_")[0]
+            return [
+                self.store.url_for(f"id-cards/{sha256[:2]}/{sha256}{extension}")
+                for extension in (".jpg", ".png", ".webp")
+            ]
+        return [self.store.url_for(key)]
+
+    async def _check_access(self, key: str, user: User) -> None:
+        """
+        Only the owner of an ID card, an admin, or an official of the owner's
+        college may read it or its thumbnails
+        """
+        if user.role == RoleEnum.ADMIN:
+            return
+
+        owners = await self.repository.get_id_card_owners(self._id_card_urls(key))
+        for owner_id, college_id in owners:
+            if owner_id == user.id or (
+                user.role == RoleEnum.OFFICIALS and college_id == user.college_id
+            ):
+                return
+        raise UnauthorizedError(obj="file", act="read")
+
+    async def open_file(self, key: str, user: User) -> tuple[AsyncIterator[bytes], str]:
+        """Stream an uploaded file or thumbnail back, with its content type"""
+        if not SERVED_KEY.fullmatch(key) or not await self.store.exists(key):
+            raise NotFoundError(resource="File", identifier=key)
+        await self._check_access(key, user)
+
+        content_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+        return self.store.read_chunks(key), content_type
+
+
+def get_upload_service(
+    repository: UploadRepository = Depends(get_upload_repository),
+    store: BlobStore = Depends(get_blob_store),
+) -> UploadService:
+    return UploadService(
+        repository,
+        store,
+        thumbnail_service=thumbnail_service,
+        max_bytes=settings.UPLOAD_MAX_BYTES,
+    )
@@ -1,15 +1,20 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select, update
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import DateTime, Uuid, column, func, or_, select, update, values
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 
 from campus_bridge.data.database.session import get_async_session
 from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.models.college import College
 from campus_bridge.data.models.user import User
 from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
+from campus_bridge.utils.cursor_pagination import cursor_pagination
+
+# rows per presence UPDATE, keeps every statement below asyncpg's bind limit
+LAST_SEEN_CHUNK_SIZE = 5000
 
 
 class UserRepository:
@@ -25,18 +30,45 @@ class UserRepository:
         return result.scalar_one_or_none()
 
     @sqlalchemy_exceptions
-    async def get_all_users_by_college_id_or_role(
-        self, college_id: UUID, role: Optional[RoleEnum] = None
+    async def get_users_by_college_id_or_role(
+        self,
+        college_id: UUID,
+        limit: int,
+        cursor: str | None,
+        role: Optional[RoleEnum] = None,
     ) -> list[User]:
-        """Fetch all users under a particular college, optionally filtered by role"""
+        """Fetch one keyset page of users of a college, optionally filtered by role"""
         query = select(User).where(User.college_id == college_id, ~User.is_deleted)
 
         if role is not None:
             query = query.where(User.role == role)
 
+        query = cursor_pagination(
+            stmt=query,
+            cursor=cursor,
+            limit=limit,
+            created_at_column=User.created_at,
+            id_column=User.id,
+        )
+
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    @sqlalchemy_exceptions
+    async def count_users_by_college_id_or_role(
+        self, college_id: UUID, cap: int, role: Optional[RoleEnum] = None
+    ) -> int:
+        """Count users of a college, stopping after `cap` + 1 rows"""
+        query = select(User.id).where(User.college_id == college_id, ~User.is_deleted)
+
+        if role is not None:
+            query = query.where(User.role == role)
+
+        result = await self.db.execute(
+            select(func.count()).select_from(query.limit(cap + 1).subquery())
+        )
+        return result.scalar_one()
+
     @sqlalchemy_exceptions
     async def update_user(self, user_id: UUID, updated_data: dict) -> User:
         """Update a single user"""
@@ -65,6 +97,72 @@ class UserRepository:
         )
         await self.db.flush()
 
+    @sqlalchemy_exceptions
+    async def stream_users_for_export(
+        self, college_id: UUID, role: Optional[RoleEnum], batch_size: int
+    ) -> AsyncResult:
+        """
+        Open a server side cursor over the users of a college, optionally of
+        one role, as (id, email, phone, role, is_verified, created_at) rows
+        """
+        stmt = select(
+            User.id,
+            User.email,
+            User.phone,
+            User.role,
+            User.is_verified,
+            User.created_at,
+        ).where(User.college_id == college_id, ~User.is_deleted)
+        if role:
+            stmt = stmt.where(User.role == role)
+
+        return await self.db.stream(
+            stmt.order_by(User.created_at, User.id).execution_options(
+                yield_per=batch_size
+            )
+        )
+
+    @sqlalchemy_exceptions
+    async def set_last_seen(self, seen: dict[UUID, datetime]) -> None:
+        """Move users' last_seen_at forward with UPDATE ... FROM (VALUES ...)"""
+        # a stable row order keeps concurrent flushes from deadlocking each other
+        rows = sorted(seen.items())
+
+        for start in range(0, len(rows), LAST_SEEN_CHUNK_SIZE):
+            seen_values = values(
+                column("id", Uuid),
+                column("seen_at", DateTime(timezone=True)),
+                name="seen",
+            ).data(rows[start : start + LAST_SEEN_CHUNK_SIZE])
+
+            await self.db.execute(
+                update(User)
+                .where(
+                    User.id == seen_values.c.id,
+                    or_(
+                        User.last_seen_at.is_(None),
+                        User.last_seen_at < seen_values.c.seen_at,
+                    ),
+                )
+                # being online is not a profile change, keep updated_at as is
+                .values(last_seen_at=seen_values.c.seen_at, updated_at=User.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+
+    @sqlalchemy_exceptions
+    async def get_last_seen(
+        self, user_ids: list[UUID], college_id: UUID | None = None
+    ) -> dict[UUID, datetime | None]:
+        """Get the stored last_seen_at of users that exist, of one college or any"""
+        stmt = select(User.id, User.last_seen_at).where(
+            User.id.in_(user_ids), ~User.is_deleted
+        )
+        if college_id is not None:
+            stmt = stmt.where(User.college_id == college_id)
+
+        result = await self.db.execute(stmt)
+        return dict(result.all())
+
 
 def get_user_repository(
     db: AsyncSession = Depends(get_async_session),
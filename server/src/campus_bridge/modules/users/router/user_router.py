@@ -4,9 +4,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
 
 from campus_bridge.api.v1.dependencies import get_current_user, require_admin
+from campus_bridge.data.database.session import read_only
+from campus_bridge.data.enums.export import ExportFormatEnum
 from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.models.user import User
+from campus_bridge.data.schemas.pagination import CursorPage
 from campus_bridge.data.schemas.user import (
+    PresenceResponse,
     UserResponse,
     UserUpdateRequest,
     UserUpdateResponse,
@@ -20,6 +24,7 @@ router = APIRouter(prefix="/user", tags=["users"])
 
 
 @router.get("/me", status_code=status.HTTP_200_OK, response_model=UserResponse)
+@read_only()
 async def get_current_user_profile(
     current_user: User = Depends(get_current_user),
 ) -> UserResponse:
@@ -27,25 +32,65 @@ async def get_current_user_profile(
     return UserResponse.model_validate(current_user)
 
 
+@router.get(
+    "/presence", status_code=status.HTTP_200_OK, response_model=list[PresenceResponse]
+)
+@read_only()
+async def get_users_presence(
+    user_ids: list[UUID] = Query(
+        description="Users to look up", min_length=1, max_length=100
+    ),
+    current_user: User = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service),
+) -> list[PresenceResponse]:
+    """
+    Get whether users are online and when they were last active, only users
+    of the current user's college unless an admin asks
+    """
+    college_id = (
+        None if current_user.role == RoleEnum.ADMIN else current_user.college_id
+    )
+    return await user_service.get_presence(user_ids, college_id=college_id)
+
+
 @router.get(
     "/college/{college_id}",
     status_code=status.HTTP_200_OK,
-    response_model=list[UserResponse],
+    response_model=CursorPage[UserResponse],
 )
-async def get_all_users_by_college_id_or_role(
+@read_only()
+async def get_users_by_college_id_or_role(
     college_id: UUID | str,
     role: Optional[RoleEnum] = Query(
         None, description="Filter by role (STUDENT, ADMIN, ALUMNI, OFFICIALS)"
     ),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(None, description="Cursor for pagination"),
+    admin_user: User = Depends(require_admin),
+    user_service: UserService = Depends(get_user_service),
+) -> CursorPage[UserResponse]:
+    """Get a page of users in a college, optionally filtered by role. Admin only."""
+    if admin_user:
+        return await user_service.get_users_by_college_id_or_role(
+            college_id=college_id, limit=limit, cursor=cursor, role=role
+        )
+
+
+@router.get("/college/{college_id}/export", status_code=status.HTTP_200_OK)
+async def export_users_by_college_id_or_role(
+    college_id: UUID,
+    role: Optional[RoleEnum] = Query(
+        None, description="Filter by role (STUDENT, ADMIN, ALUMNI, OFFICIALS)"
+    ),
+    format: ExportFormatEnum = Query(ExportFormatEnum.CSV, description="File format"),
     admin_user: User = Depends(require_admin),
     user_service: UserService = Depends(get_user_service),
-) -> list[UserResponse]:
-    """Get all users in a college, optionally filtered by role. Admin only."""
+):
+    """Download every user in a college as CSV or Parquet. Admin only."""
     if admin_user:
-        users = await user_service.get_all_users_by_college_id_or_role(
-            college_id=college_id, role=role
+        return await user_service.export_users(
+            college_id=college_id, role=role, export_format=format
         )
-        return [UserResponse.model_validate(user) for user in users]
 
 
 @router.patch(
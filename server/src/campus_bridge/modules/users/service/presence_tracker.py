@@ -0,0 +1,117 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import structlog
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.database.core import AsyncSessionLocal
+from campus_bridge.modules.users.repository.user_repository import UserRepository
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class PresenceTracker:
+    """
+    Per-worker last-seen tracking for authenticated users.
+
+    Requests only touch an in-memory map; every flush interval the users
+    seen since the last flush are written with one batched UPDATE, however
+    many requests they made. Users seen on this worker within the online
+    window are answered from memory, everyone else from `users.last_seen_at`.
+    """
+
+    def __init__(self, flush_interval_seconds: float, online_window_seconds: int):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.online_window = timedelta(seconds=online_window_seconds)
+        self._pending: dict[UUID, datetime] = {}
+        # user -> (last seen, college), the college scopes presence lookups
+        self._recent: dict[UUID, tuple[datetime, UUID]] = {}
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def touch(self, user_id: UUID, college_id: UUID) -> None:
+        """Record activity of a user, never awaits"""
+        now = datetime.now(timezone.utc)
+        self._pending[user_id] = now
+        self._recent[user_id] = (now, college_id)
+
+    def is_online(self, last_seen_at: datetime | None) -> bool:
+        return (
+            last_seen_at is not None
+            and datetime.now(timezone.utc) - last_seen_at <= self.online_window
+        )
+
+    def recent_last_seen(
+        self, user_ids: list[UUID], college_id: UUID | None = None
+    ) -> dict[UUID, datetime]:
+        """
+        Last activity of the given users seen on this worker recently, only
+        of those in `college_id` when given
+        """
+        last_seen = {}
+        for user_id in user_ids:
+            seen_at, user_college_id = self._recent.get(user_id, (None, None))
+            if self.is_online(seen_at) and college_id in (None, user_college_id):
+                last_seen[user_id] = seen_at
+        return last_seen
+
+    def _prune(self) -> None:
+        # older activity is in the database by now, the map only covers the window
+        cutoff = datetime.now(timezone.utc) - self.online_window
+        self._recent = {
+            user_id: recent
+            for user_id, recent in self._recent.items()
+            if recent[0] > cutoff
+        }
+
+    async def flush(self) -> int:
+        """Write pending last-seen times, returns the number of users flushed"""
+        self._prune()
+        if not self._pending:
+            return 0
+
+        seen, self._pending = self._pending, {}
+        try:
+            async with AsyncSessionLocal() as session:
+                await UserRepository(session).set_last_seen(seen)
+                await session.commit()
+        except Exception as exc:
+            # keep the newer of the failed and the meanwhile recorded times
+            for user_id, seen_at in seen.items():
+                if self._pending.get(user_id, seen_at) <= seen_at:
+                    self._pending[user_id] = seen_at
+            logger.exception("presence_flush_failed", users=len(seen), exc=exc)
+            return 0
+
+        logger.debug("presence_flushed", users=len(seen))
+        return len(seen)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self.flush_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the periodic flush loop (called from lifespan)"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop, its last iteration flushes (called from lifespan)"""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+presence_tracker = PresenceTracker(
+    flush_interval_seconds=settings.PRESENCE_FLUSH_INTERVAL_SECONDS,
+    online_window_seconds=settings.PRESENCE_ONLINE_WINDOW_SECONDS,
+)
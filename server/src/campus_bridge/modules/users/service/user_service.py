@@ -3,23 +3,55 @@ from uuid import UUID
 
 import structlog
 from fastapi import Depends
+from fastapi.responses import StreamingResponse
 
+from campus_bridge.config.settings import settings
+from campus_bridge.data.enums.export import ExportFormatEnum
 from campus_bridge.data.enums.role import RoleEnum
 from campus_bridge.data.models.user import User
-from campus_bridge.data.schemas.user import UserUpdateRequest, UserUpdateResponse
+from campus_bridge.data.schemas.pagination import CursorPage
+from campus_bridge.data.schemas.user import (
+    PresenceResponse,
+    UserResponse,
+    UserUpdateRequest,
+    UserUpdateResponse,
+)
 from campus_bridge.errors.exc import BadRequestError, UnAuthenticatedError
+from campus_bridge.modules.search.service.people_index import PeopleIndex, people_index
 from campus_bridge.modules.users.repository.user_repository import (
     UserRepository,
     get_user_repository,
 )
+from campus_bridge.modules.users.service.presence_tracker import (
+    PresenceTracker,
+    presence_tracker,
+)
+from campus_bridge.utils.cursor_pagination import encode_cursor
+from campus_bridge.utils.export_stream import ExportColumn, export_response
 from campus_bridge.utils.uuid import parse_uuid
 
 logger = structlog.stdlib.get_logger(__name__)
 
+USER_EXPORT_COLUMNS = [
+    ExportColumn("id"),
+    ExportColumn("email"),
+    ExportColumn("phone"),
+    ExportColumn("role"),
+    ExportColumn("is_verified", "bool"),
+    ExportColumn("created_at", "datetime"),
+]
+
 
 class UserService:
-    def __init__(self, repository: UserRepository):
+    def __init__(
+        self,
+        repository: UserRepository,
+        presence_tracker: PresenceTracker,
+        people_index: PeopleIndex,
+    ):
         self.repository = repository
+        self.presence_tracker = presence_tracker
+        self.people_index = people_index
 
     async def get_user_by_id(self, user_id: str | UUID) -> User:
         """Get user by id"""
@@ -41,10 +73,14 @@ class UserService:
         logger.debug("User resolved", user_id=str(user.id))
         return user
 
-    async def get_all_users_by_college_id_or_role(
-        self, college_id: str | UUID, role: Optional[RoleEnum] = None
-    ) -> list[User]:
-        """Get all users by college id, optionally filtered by role"""
+    async def get_users_by_college_id_or_role(
+        self,
+        college_id: str | UUID,
+        limit: int,
+        cursor: str | None,
+        role: Optional[RoleEnum] = None,
+    ) -> CursorPage[UserResponse]:
+        """Get a page of users by college id, optionally filtered by role"""
         college_id = (
             college_id if isinstance(college_id, UUID) else parse_uuid(college_id)
         )
@@ -61,12 +97,35 @@ class UserService:
             college_id=str(college_id),
             role=role.value if role else None,
         )
-        users = await self.repository.get_all_users_by_college_id_or_role(
-            college_id=college_id, role=role
+        # one extra row tells whether there is a next page
+        users = await self.repository.get_users_by_college_id_or_role(
+            college_id=college_id, limit=limit + 1, cursor=cursor, role=role
         )
-        logger.info("Users fetched successfully", count=len(users))
 
-        return users
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+
+        page = CursorPage[UserResponse](
+            items=[UserResponse.model_validate(user) for user in users],
+            next_cursor=next_cursor,
+        )
+
+        # the total only changes the header of the listing, count it once
+        if cursor is None:
+            cap = settings.DIRECTORY_COUNT_CAP
+            if next_cursor is None:
+                total = len(users)
+            else:
+                total = await self.repository.count_users_by_college_id_or_role(
+                    college_id=college_id, cap=cap, role=role
+                )
+            page.total = min(total, cap)
+            page.is_total_capped = total > cap
+
+        logger.info("Users fetched successfully", count=len(users))
+        return page
 
     async def update_user(
         self, user_id: UUID, user_data: UserUpdateRequest
@@ -89,6 +148,9 @@ class UserService:
         updated_user = await self.repository.update_user(
             user_id=user_id, updated_data=updated_data
         )
+        if "role" in updated_data:
+            # a student or alumni entry no longer applies, the rebuild adds it back
+            self.people_index.remove(updated_user.college_id, user_id)
         logger.info("User updated successfully", user_id=str(user_id))
         return UserUpdateResponse.model_validate(updated_user)
 
@@ -99,10 +161,63 @@ class UserService:
 
         logger.info("Deleting user", user_id=str(user.id))
         await self.repository.delete_user(user_id=user.id)
+        self.people_index.remove(user.college_id, user.id)
         logger.info("User deleted successfully", user_id=str(user.id))
 
+    async def get_presence(
+        self, user_ids: list[UUID], college_id: UUID | None = None
+    ) -> list[PresenceResponse]:
+        """
+        Get the online status of users, of one college or any; unknown users
+        and users of other colleges are left out
+        """
+        last_seen = self.presence_tracker.recent_last_seen(user_ids, college_id)
+
+        # only users not active on this worker lately need the database
+        missing = [user_id for user_id in user_ids if user_id not in last_seen]
+        if missing:
+            last_seen.update(
+                await self.repository.get_last_seen(missing, college_id=college_id)
+            )
+
+        return [
+            PresenceResponse(
+                user_id=user_id,
+                is_online=self.presence_tracker.is_online(last_seen[user_id]),
+                last_seen_at=last_seen[user_id],
+            )
+            for user_id in dict.fromkeys(user_ids)
+            if user_id in last_seen
+        ]
+
+    async def export_users(
+        self,
+        college_id: UUID,
+        role: Optional[RoleEnum],
+        export_format: ExportFormatEnum,
+    ) -> StreamingResponse:
+        """Stream the users of a college as a CSV or Parquet file"""
+        rows = await self.repository.stream_users_for_export(
+            college_id=college_id, role=role, batch_size=settings.EXPORT_BATCH_SIZE
+        )
+        logger.info(
+            "Exporting users",
+            college_id=str(college_id),
+            role=role.value if role else None,
+            format=export_format.value,
+        )
+        return export_response(
+            rows,
+            USER_EXPORT_COLUMNS,
+            export_format,
+            filename=f"users-{college_id}",
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
+
 
 def get_user_service(
     repository: UserRepository = Depends(get_user_repository),
 ) -> UserService:
-    return UserService(repository)
+    return UserService(
+        repository, presence_tracker=presence_tracker, people_index=people_index
+    )
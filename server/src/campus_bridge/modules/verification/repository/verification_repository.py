@@ -0,0 +1,169 @@
+from datetime import timedelta
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import func, null, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from campus_bridge.data.database.session import get_async_session
+from campus_bridge.data.models import Alumni, CollegeOfficial, Student, User
+from campus_bridge.errors.decorators.sqlalchemy import sqlalchemy_exceptions
+
+ReviewProfile = type[Student] | type[Alumni] | type[CollegeOfficial]
+
+
+def _in_college(model: ReviewProfile, college_id: UUID):
+    if model is not CollegeOfficial:
+        return model.college_id == college_id
+    return model.user_id.in_(select(User.id).where(User.college_id == college_id))
+
+
+class VerificationRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @sqlalchemy_exceptions
+    async def claim(
+        self,
+        model: ReviewProfile,
+        college_id: UUID,
+        reviewer_id: UUID,
+        limit: int,
+        lease: timedelta,
+    ) -> list:
+        """
+        Lease the oldest unreviewed profiles of a college to a reviewer.
+
+        Rows another reviewer holds a lease on, or is claiming right now, are
+        skipped (FOR UPDATE SKIP LOCKED) instead of waited for, so concurrent
+        reviewers get disjoint batches. Expired leases are up for grabs again.
+        Returns (id, user_id, id_card_url, created_at, review_claim_expires_at)
+        rows.
+        """
+        now = func.now()
+        pending = (
+            select(model.id)
+            .where(
+                ~model.is_verified,
+                model.reviewed_at.is_(None),
+                _in_college(model, college_id),
+                or_(
+                    model.review_claim_expires_at.is_(None),
+                    model.review_claim_expires_at < now,
+                    model.review_claimed_by == reviewer_id,
+                ),
+            )
+            .order_by(model.created_at, model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=model)
+        )
+
+        result = await self.db.execute(
+            update(model)
+            .where(model.id.in_(pending.scalar_subquery()))
+            .values(
+                review_claimed_by=reviewer_id,
+                review_claim_expires_at=now + lease,
+                # a lease is queue bookkeeping, not a profile change
+                updated_at=model.updated_at,
+            )
+            .returning(
+                model.id,
+                model.user_id,
+                model.id_card_url,
+                model.created_at,
+                model.review_claim_expires_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = sorted(result.all(), key=lambda row: (row.created_at, row.id))
+        await self.db.commit()
+        return rows
+
+    @sqlalchemy_exceptions
+    async def decide(
+        self,
+        model: ReviewProfile,
+        profile_ids: list[UUID],
+        reviewer_id: UUID,
+        approve: bool,
+        reason: str | None,
+    ) -> list:
+        """
+        Approve or reject, in one statement, the given profiles that the
+        reviewer still holds an unexpired lease on.
+
+        Returns (id, user_id) of the profiles that were decided; the others
+        were never claimed by this reviewer or their lease ran out.
+        """
+        result = await self.db.execute(
+            update(model)
+            .where(
+                model.id.in_(profile_ids),
+                model.review_claimed_by == reviewer_id,
+                model.review_claim_expires_at >= func.now(),
+                model.reviewed_at.is_(None),
+            )
+            .values(
+                is_verified=approve,
+                reviewed_by=reviewer_id,
+                reviewed_at=func.now(),
+                rejection_reason=reason,
+                review_claimed_by=None,
+                review_claim_expires_at=None,
+            )
+            .returning(model.id, model.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await self.db.commit()
+        return rows
+
+    @sqlalchemy_exceptions
+    async def get_people(
+        self, model: type[Student] | type[Alumni], user_ids: list[UUID]
+    ) -> list:
+        """
+        (user_id, role, email, first_name, last_name) of the users of the
+        given student or alumni profiles, alumni have no name
+        """
+        if model is Student:
+            names = (Student.first_name, Student.last_name)
+        else:
+            names = (null(), null())
+        result = await self.db.execute(
+            select(User.id, User.role, User.email, *names)
+            .join(model, model.user_id == User.id)
+            .where(User.id.in_(user_ids), ~User.is_deleted)
+        )
+        return result.all()
+
+    @sqlalchemy_exceptions
+    async def release(
+        self, model: ReviewProfile, profile_ids: list[UUID], reviewer_id: UUID
+    ) -> list[UUID]:
+        """Give back leases of the reviewer so others can claim the profiles"""
+        result = await self.db.execute(
+            update(model)
+            .where(
+                model.id.in_(profile_ids),
+                model.review_claimed_by == reviewer_id,
+                model.reviewed_at.is_(None),
+            )
+            .values(
+                review_claimed_by=None,
+                review_claim_expires_at=None,
+                updated_at=model.updated_at,
+            )
+            .returning(model.id)
+            .execution_options(synchronize_session=False)
+        )
+        released = result.scalars().all()
+        await self.db.commit()
+        return released
+
+
+def get_verification_repository(
+    db: AsyncSession = Depends(get_async_session),
+) -> VerificationRepository:
+    return VerificationRepository(db)
@@ -0,0 +1,96 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+
+from campus_bridge.api.v1.dependencies import get_current_user, get_roster_college_id
+from campus_bridge.data.models import User
+from campus_bridge.data.schemas.verification import (
+    VerificationClaimItem,
+    VerificationClaimRequest,
+    VerificationDecisionRequest,
+    VerificationDecisionResponse,
+    VerificationRejectRequest,
+)
+from campus_bridge.modules.verification.service.verification_service import (
+    VerificationService,
+    get_verification_service,
+)
+
+router = APIRouter(prefix="/verification", tags=["verification"])
+
+
+@router.post(
+    "/claim",
+    status_code=status.HTTP_200_OK,
+    response_model=list[VerificationClaimItem],
+)
+async def claim_profiles(
+    body: VerificationClaimRequest,
+    college_id: UUID = Depends(get_roster_college_id),
+    current_user: User = Depends(get_current_user),
+    verification_service: VerificationService = Depends(get_verification_service),
+):
+    """Lease a batch of unverified profiles to review. Admin or officials only."""
+    return await verification_service.claim(
+        current_user, college_id, profile_type=body.profile_type, limit=body.limit
+    )
+
+
+@router.post(
+    "/approve",
+    status_code=status.HTTP_200_OK,
+    response_model=VerificationDecisionResponse,
+)
+async def approve_profiles(
+    body: VerificationDecisionRequest,
+    college_id: UUID = Depends(get_roster_college_id),
+    current_user: User = Depends(get_current_user),
+    verification_service: VerificationService = Depends(get_verification_service),
+):
+    """Verify claimed profiles. Admin or officials only."""
+    return await verification_service.decide(
+        current_user,
+        college_id,
+        profile_type=body.profile_type,
+        profile_ids=body.profile_ids,
+        approve=True,
+    )
+
+
+@router.post(
+    "/reject",
+    status_code=status.HTTP_200_OK,
+    response_model=VerificationDecisionResponse,
+)
+async def reject_profiles(
+    body: VerificationRejectRequest,
+    college_id: UUID = Depends(get_roster_college_id),
+    current_user: User = Depends(get_current_user),
+    verification_service: VerificationService = Depends(get_verification_service),
+):
+    """Reject claimed profiles with a reason. Admin or officials only."""
+    return await verification_service.decide(
+        current_user,
+        college_id,
+        profile_type=body.profile_type,
+        profile_ids=body.profile_ids,
+        approve=False,
+        reason=body.reason,
+    )
+
+
+@router.post(
+    "/release",
+    status_code=status.HTTP_200_OK,
+    response_model=VerificationDecisionResponse,
+)
+async def release_profiles(
+    body: VerificationDecisionRequest,
+    _: UUID = Depends(get_roster_college_id),
+    current_user: User = Depends(get_current_user),
+    verification_service: VerificationService = Depends(get_verification_service),
+):
+    """Hand claimed profiles back to the queue. Admin or officials only."""
+    return await verification_service.release(
+        current_user, profile_type=body.profile_type, profile_ids=body.profile_ids
+    )
@@ -0,0 +1,178 @@
+from datetime import timedelta
+from uuid import UUID
+
+import structlog
+from fastapi import Depends
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.data.models import Alumni, CollegeOfficial, Student, User
+from campus_bridge.data.schemas.verification import (
+    VerificationClaimItem,
+    VerificationDecisionResponse,
+)
+from campus_bridge.errors.exc import UnauthorizedError
+from campus_bridge.modules.alumni.service.mentor_matcher import (
+    MentorMatcher,
+    mentor_matcher,
+)
+from campus_bridge.modules.search.service.people_index import (
+    PeopleIndex,
+    Person,
+    people_index,
+)
+from campus_bridge.modules.student.service.interest_matcher import (
+    InterestMatcher,
+    interest_matcher,
+)
+from campus_bridge.modules.uploads.service.thumbnail_service import (
+    ThumbnailService,
+    thumbnail_service,
+)
+from campus_bridge.modules.verification.repository.verification_repository import (
+    VerificationRepository,
+    get_verification_repository,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+PROFILE_MODELS = {
+    RoleEnum.STUDENT: Student,
+    RoleEnum.ALUMNI: Alumni,
+    RoleEnum.OFFICIALS: CollegeOfficial,
+}
+
+
+class VerificationService:
+    def __init__(
+        self,
+        repository: VerificationRepository,
+        interest_matcher: InterestMatcher,
+        mentor_matcher: MentorMatcher,
+        thumbnail_service: ThumbnailService,
+        people_index: PeopleIndex,
+    ):
+        self.repository = repository
+        self.interest_matcher = interest_matcher
+        self.mentor_matcher = mentor_matcher
+        self.thumbnail_service = thumbnail_service
+        self.people_index = people_index
+
+    async def claim(
+        self, reviewer: User, college_id: UUID, profile_type: RoleEnum, limit: int
+    ) -> list[VerificationClaimItem]:
+        """Lease a batch of a college's unreviewed profiles to the reviewer"""
+        model = self._model(reviewer, profile_type)
+        rows = await self.repository.claim(
+            model,
+            college_id=college_id,
+            reviewer_id=reviewer.id,
+            limit=limit,
+            lease=timedelta(seconds=settings.VERIFICATION_LEASE_SECONDS),
+        )
+        logger.info(
+            "verification_claimed",
+            reviewer_id=str(reviewer.id),
+            profile_type=profile_type.value,
+            claimed=len(rows),
+        )
+        items = [VerificationClaimItem.model_validate(row) for row in rows]
+        await self.thumbnail_service.fill_urls(
+            (item, item.id_card_url) for item in items
+        )
+        return items
+
+    async def decide(
+        self,
+        reviewer: User,
+        college_id: UUID,
+        profile_type: RoleEnum,
+        profile_ids: list[UUID],
+        approve: bool,
+        reason: str | None = None,
+    ) -> VerificationDecisionResponse:
+        """Approve or reject claimed profiles in one statement"""
+        model = self._model(reviewer, profile_type)
+        rows = await self.repository.decide(
+            model,
+            profile_ids=profile_ids,
+            reviewer_id=reviewer.id,
+            approve=approve,
+            reason=reason,
+        )
+        if approve and rows and model is Student:
+            # newly verified students join the interest matches
+            self.interest_matcher.invalidate(college_id)
+        if approve and rows and model is Alumni:
+            # and newly verified alumni the mentor recommendations
+            self.mentor_matcher.invalidate(college_id)
+        if rows and model is not CollegeOfficial:
+            await self._sync_people_index(
+                model, college_id, [row.user_id for row in rows], approve
+            )
+
+        logger.info(
+            "verification_decided",
+            reviewer_id=str(reviewer.id),
+            profile_type=profile_type.value,
+            approve=approve,
+            decided=len(rows),
+        )
+        return _decision_response(profile_ids, [row.id for row in rows])
+
+    async def _sync_people_index(
+        self,
+        model: type[Student] | type[Alumni],
+        college_id: UUID,
+        user_ids: list[UUID],
+        approve: bool,
+    ) -> None:
+        # approved students and alumni become searchable, rejected ones not
+        if not approve:
+            for user_id in user_ids:
+                self.people_index.remove(college_id, user_id)
+            return
+        for row in await self.repository.get_people(model, user_ids):
+            self.people_index.upsert(college_id, Person(*row))
+
+    async def release(
+        self, reviewer: User, profile_type: RoleEnum, profile_ids: list[UUID]
+    ) -> VerificationDecisionResponse:
+        """Hand claimed profiles back to the queue before the lease runs out"""
+        model = self._model(reviewer, profile_type)
+        released = await self.repository.release(
+            model, profile_ids=profile_ids, reviewer_id=reviewer.id
+        )
+        return _decision_response(profile_ids, released)
+
+    def _model(self, reviewer: User, profile_type: RoleEnum):
+        # officials verify their students and alumni, not their peers
+        if profile_type == RoleEnum.OFFICIALS and reviewer.role != RoleEnum.ADMIN:
+            raise UnauthorizedError(obj="official verification", act="review")
+        return PROFILE_MODELS[profile_type]
+
+
+def _decision_response(
+    profile_ids: list[UUID], updated: list[UUID]
+) -> VerificationDecisionResponse:
+    done = set(updated)
+    return VerificationDecisionResponse(
+        updated=list(updated),
+        skipped=[
+            profile_id
+            for profile_id in dict.fromkeys(profile_ids)
+            if profile_id not in done
+        ],
+    )
+
+
+def get_verification_service(
+    repository: VerificationRepository = Depends(get_verification_repository),
+) -> VerificationService:
+    return VerificationService(
+        repository,
+        interest_matcher=interest_matcher,
+        mentor_matcher=mentor_matcher,
+        thumbnail_service=thumbnail_service,
+        people_index=people_index,
+    )
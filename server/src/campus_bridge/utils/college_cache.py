@@ -0,0 +1,51 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class CollegeCache(Generic[T]):
+    """
+    Per-worker LRU of one value per college, e.g. a matcher's index.
+
+    A value is built on first use and rebuilt once older than `ttl_seconds`;
+    concurrent requests for a cold or stale college wait for a single build.
+    At most `max_colleges` values are kept, least recently used out first.
+    """
+
+    def __init__(self, max_colleges: int, ttl_seconds: int):
+        self.max_colleges = max_colleges
+        self.ttl_seconds = ttl_seconds
+        self._values: OrderedDict[UUID, tuple[float, T]] = OrderedDict()
+        self._locks: dict[UUID, asyncio.Lock] = {}
+
+    def _fresh(self, college_id: UUID) -> T | None:
+        cached = self._values.get(college_id)
+        if cached is None or time.monotonic() - cached[0] > self.ttl_seconds:
+            return None
+        self._values.move_to_end(college_id)
+        return cached[1]
+
+    async def get(self, college_id: UUID, build: Callable[[], Awaitable[T]]) -> T:
+        """The college's value, built with `build` when missing or stale"""
+        value = self._fresh(college_id)
+        if value is not None:
+            return value
+
+        lock = self._locks.setdefault(college_id, asyncio.Lock())
+        async with lock:
+            value = self._fresh(college_id)
+            if value is None:
+                value = await build()
+                self._values[college_id] = (time.monotonic(), value)
+            while len(self._values) > self.max_colleges:
+                evicted, _ = self._values.popitem(last=False)
+                self._locks.pop(evicted, None)
+        return value
+
+    def invalidate(self, college_id: UUID) -> None:
+        """Drop a college's value, the next get builds it again"""
+        self._values.pop(college_id, None)
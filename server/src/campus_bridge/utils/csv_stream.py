@@ -0,0 +1,56 @@
+import codecs
+import csv
+from typing import AsyncIterator
+
+
+async def _iter_lines(
+    chunks: AsyncIterator[bytes], encoding: str
+) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+async def iter_csv_records(
+    chunks: AsyncIterator[bytes], encoding: str = "utf-8-sig"
+) -> AsyncIterator[tuple[int, dict[str, str]]]:
+    """
+    Parse CSV from a stream of byte chunks, one record at a time.
+
+    The first record is the header; column names are stripped and lowercased.
+    Yields (line number of the record, {column: value}) so errors can point at
+    the line a user sees in their spreadsheet. Only the current record is kept
+    in memory; a record continues over line breaks inside quoted fields.
+    """
+    header: list[str] | None = None
+    record = ""
+    record_line = line_number = 0
+
+    async for line in _iter_lines(chunks, encoding):
+        line_number += 1
+        if not record:
+            record_line = line_number
+        record += line + "\n"
+        # an odd number of quotes means a quoted field is still open
+        if record.count('"') % 2:
+            continue
+
+        values = next(csv.reader([record]), [])
+        record = ""
+        if not any(value.strip() for value in values):
+            continue
+        if header is None:
+            header = [column.strip().lower() for column in values]
+            continue
+        yield record_line, dict(zip(header, values))
+
+    if record and header is not None:
+        # unterminated quote on the last record, let row validation report it
+        yield record_line, dict(zip(header, next(csv.reader([record]), [])))
@@ -3,13 +3,61 @@ from uuid import UUID
 
 import structlog
 from sqlalchemy import and_, desc, or_
-from sqlalchemy.sql import Select
+from sqlalchemy.sql import ColumnElement, Select
 
 from campus_bridge.errors.exc import BadRequestError
 
 logger = structlog.stdlib.get_logger(__name__)
 
 
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Build the "<created_at_iso>|<uuid>" cursor for a row"""
+    return f"{created_at.isoformat()}|{id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Split a "<created_at_iso>|<uuid>" cursor into its keyset values"""
+    try:
+        cursor_created_at_str, cursor_id_str = cursor.split("|")
+        logger.info(
+            "cursor_values",
+            extra={"created_at": cursor_created_at_str, "id": cursor_id_str},
+        )
+        return datetime.fromisoformat(cursor_created_at_str), UUID(cursor_id_str)
+    except ValueError as e:
+        logger.warning("invalid_cursor_format", cursor=cursor)
+        raise BadRequestError(
+            message="Invalid cursor format",
+            details=f"Invalid cursor format: {cursor}",
+        )
+
+
+def keyset_before(
+    created_at_column, id_column, cursor_created_at: datetime, cursor_id: UUID
+) -> ColumnElement[bool]:
+    """Rows strictly older than the cursor in (created_at, id) DESC order"""
+    return or_(
+        created_at_column < cursor_created_at,
+        and_(
+            created_at_column == cursor_created_at,
+            id_column < cursor_id,
+        ),
+    )
+
+
+def keyset_after(
+    created_at_column, id_column, cursor_created_at: datetime, cursor_id: UUID
+) -> ColumnElement[bool]:
+    """Rows strictly newer than the cursor in (created_at, id) DESC order"""
+    return or_(
+        created_at_column > cursor_created_at,
+        and_(
+            created_at_column == cursor_created_at,
+            id_column > cursor_id,
+        ),
+    )
+
+
 def cursor_pagination(
     stmt: Select,
     *,
@@ -29,29 +77,9 @@ def cursor_pagination(
     """
 
     if cursor:
-        try:
-            cursor_created_at_str, cursor_id_str = cursor.split("|")
-            logger.info(
-                "cursor_values",
-                extra={"created_at": cursor_created_at_str, "id": cursor_id_str},
-            )
-            cursor_created_at = datetime.fromisoformat(cursor_created_at_str)
-            cursor_id = UUID(cursor_id_str)
-        except ValueError as e:
-            logger.warning("invalid_cursor_format", cursor=cursor)
-            raise BadRequestError(
-                message="Invalid cursor format",
-                details=f"Invalid cursor format: {cursor}",
-            )
-
+        cursor_created_at, cursor_id = decode_cursor(cursor)
         stmt = stmt.where(
-            or_(
-                created_at_column < cursor_created_at,
-                and_(
-                    created_at_column == cursor_created_at,
-                    id_column < cursor_id,
-                ),
-            )
+            keyset_before(created_at_column, id_column, cursor_created_at, cursor_id)
         )
 
     return stmt.order_by(desc(created_at_column), desc(id_column)).limit(limit)
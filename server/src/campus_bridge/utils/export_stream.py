@@ -0,0 +1,156 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterable, AsyncIterator, Literal, NamedTuple, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi.responses import StreamingResponse
+
+from campus_bridge.data.enums.export import ExportFormatEnum
+
+# flush CSV output to the client in pieces of about this size
+CSV_CHUNK_BYTES = 64 * 1024
+
+ColumnKind = Literal["string", "int", "bool", "datetime", "json"]
+
+
+_ARROW_TYPES = {
+    "string": pa.string(),
+    "int": pa.int64(),
+    "bool": pa.bool_(),
+    "datetime": pa.timestamp("us", tz="UTC"),
+    "json": pa.string(),
+}
+
+
+class ExportColumn(NamedTuple):
+    name: str
+    kind: ColumnKind = "string"
+
+
+def _to_python(value: Any, kind: ColumnKind) -> Any:
+    if value is None:
+        return None
+    if kind == "json":
+        return json.dumps(value)
+    if kind == "string":
+        return value.value if isinstance(value, Enum) else str(value)
+    return value
+
+
+def _to_csv(value: Any, kind: ColumnKind) -> Any:
+    value = _to_python(value, kind)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+async def _stream_csv(
+    columns: Sequence[ExportColumn], rows: AsyncIterable[Sequence]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(column.name for column in columns)
+
+    async for row in rows:
+        writer.writerow(
+            _to_csv(value, column.kind) for value, column in zip(row, columns)
+        )
+        if buffer.tell() >= CSV_CHUNK_BYTES:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out what was written since the last drain"""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _stream_parquet(
+    columns: Sequence[ExportColumn], rows: AsyncIterable[Sequence], batch_size: int
+) -> AsyncIterator[bytes]:
+    schema = pa.schema([(column.name, _ARROW_TYPES[column.kind]) for column in columns])
+
+    def to_row_group(batch: list[Sequence]) -> pa.Table:
+        return pa.Table.from_arrays(
+            [
+                pa.array(
+                    [_to_python(row[i], column.kind) for row in batch],
+                    type=schema.field(i).type,
+                )
+                for i, column in enumerate(columns)
+            ],
+            schema=schema,
+        )
+
+    # parquet puts its footer at the end, so every row group can be sent as
+    # soon as it is encoded and only one batch is ever held in memory
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    batch: list[Sequence] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            writer.write_table(to_row_group(batch))
+            batch = []
+            yield sink.drain()
+
+    if batch:
+        writer.write_table(to_row_group(batch))
+    writer.close()
+    yield sink.drain()
+
+
+def export_response(
+    rows: AsyncIterable[Sequence],
+    columns: Sequence[ExportColumn],
+    export_format: ExportFormatEnum,
+    filename: str,
+    batch_size: int,
+) -> StreamingResponse:
+    """
+    Stream rows as a CSV or Parquet download.
+
+    `rows` should come from a server side cursor (AsyncSession.stream with
+    yield_per) so neither the database driver nor the encoder ever holds more
+    than one batch, whatever the size of the export.
+    """
+    if export_format == ExportFormatEnum.PARQUET:
+        body = _stream_parquet(columns, rows, batch_size)
+        media_type = "application/vnd.apache.parquet"
+    else:
+        body = _stream_csv(columns, rows)
+        media_type = "text/csv"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'
+        },
+    )
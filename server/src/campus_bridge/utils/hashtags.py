@@ -0,0 +1,35 @@
+import re
+
+from campus_bridge.data.enums.tag import TagTypeEnum
+
+MAX_TAG_LENGTH = 100
+
+# not preceded by a word character, so "a@b.com" or "issue#12" don't count
+_HASHTAG_RE = re.compile(r"(?<![\w#])#(\w+)")
+_MENTION_RE = re.compile(r"(?<![\w@])@(\w+(?:\.\w+)*)")
+
+
+def extract_tags(content: str) -> list[tuple[TagTypeEnum, str]]:
+    """
+    Utility function to extract hashtags and mentions from post content.
+
+    Args:
+        content: Free text of the post.
+
+    Returns:
+        list: Unique (tag type, tag) pairs in order of first appearance.
+              Tags are lowercased and stored without the leading symbol.
+    """
+    tags: dict[tuple[TagTypeEnum, str], None] = {}
+
+    for tag_type, pattern in (
+        (TagTypeEnum.HASHTAG, _HASHTAG_RE),
+        (TagTypeEnum.MENTION, _MENTION_RE),
+    ):
+        for match in pattern.finditer(content):
+            tag = match.group(1).lower()
+            if tag.isdigit() or len(tag) > MAX_TAG_LENGTH:
+                continue
+            tags[(tag_type, tag)] = None
+
+    return list(tags)
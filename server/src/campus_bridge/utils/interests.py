@@ -0,0 +1,24 @@
+def interest_tags(interests: dict | None) -> frozenset[str]:
+    """
+    Flatten a student's free-form interests JSON into lowercase tags.
+
+    String values and the strings of list values become tags, keys flagged
+    with a truthy scalar (e.g. {"chess": true}) become tags themselves, and
+    nested objects are flattened the same way.
+    """
+    tags: set[str] = set()
+
+    def visit(value, key: str | None = None) -> None:
+        if isinstance(value, dict):
+            for child_key, child in value.items():
+                visit(child, child_key)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                visit(item)
+        elif isinstance(value, str):
+            tags.add(value)
+        elif value and key is not None:
+            tags.add(key)
+
+    visit(interests or {})
+    return frozenset(tag.strip().lower() for tag in tags if tag.strip())
@@ -0,0 +1,103 @@
+from collections import deque
+from typing import AsyncIterator
+
+import structlog
+from fastapi import Request
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from campus_bridge.errors.exc import BadRequestError
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+def file_field_openapi(field_name: str = "file") -> dict:
+    """OpenAPI request body for routes that read a file with stream_file_field"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": [field_name],
+                        "properties": {
+                            field_name: {"type": "string", "format": "binary"}
+                        },
+                    }
+                }
+            },
+        }
+    }
+
+
+async def stream_file_field(request: Request, field_name: str) -> AsyncIterator[bytes]:
+    """
+    Yield the bytes of one file field of a multipart/form-data body.
+
+    The body is parsed as it arrives, so at most one network chunk of the file
+    is held in memory at a time and the consumer can stop reading early (e.g.
+    once a size limit is hit) without the rest of the upload being buffered.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type"))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        logger.warning("multipart_invalid_content_type")
+        raise BadRequestError(
+            message="Expected a multipart/form-data body",
+            details="Missing multipart content type or boundary",
+        )
+
+    chunks: deque[bytes] = deque()
+    part = {"header": b"", "value": b"", "target": False, "seen": False, "done": False}
+
+    def on_part_begin():
+        part["target"] = False
+
+    def on_header_field(data: bytes, start: int, end: int):
+        part["header"] += data[start:end]
+
+    def on_header_value(data: bytes, start: int, end: int):
+        part["value"] += data[start:end]
+
+    def on_header_end():
+        if part["header"].lower() == b"content-disposition":
+            _, disposition = parse_options_header(part["value"])
+            part["target"] = (
+                disposition.get(b"name") == field_name.encode()
+                and b"filename" in disposition
+                and not part["seen"]
+            )
+        part["header"] = part["value"] = b""
+
+    def on_part_data(data: bytes, start: int, end: int):
+        if part["target"]:
+            chunks.append(data[start:end])
+
+    def on_part_end():
+        if part["target"]:
+            part["seen"] = part["done"] = True
+
+    parser = MultipartParser(
+        boundary,
+        {
+            "on_part_begin": on_part_begin,
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+        },
+    )
+
+    async for body_chunk in request.stream():
+        parser.write(body_chunk)
+        while chunks:
+            yield chunks.popleft()
+        if part["done"]:
+            return
+
+    logger.warning("multipart_file_field_missing", field=field_name)
+    raise BadRequestError(
+        message=f"Missing file field '{field_name}'",
+        details=f"No complete '{field_name}' file part in the multipart body",
+    )
@@ -0,0 +1,58 @@
+from bisect import bisect_left, insort
+from typing import Generic, Hashable, Iterable, Iterator, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class PrefixIndex(Generic[K]):
+    """
+    Sorted (token, key) pairs answering "which keys have a token starting
+    with this prefix" with a binary search plus a scan of the matches.
+
+    Keys must be orderable (ties between equal tokens are broken by key).
+    Adding or removing a key is a few list inserts/deletes, cheap enough for
+    incremental updates of indexes up to some hundred thousand tokens.
+    """
+
+    def __init__(self):
+        self._pairs: list[tuple[str, K]] = []
+        self._tokens: dict[K, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._tokens
+
+    def tokens(self, key: K) -> tuple[str, ...]:
+        return self._tokens.get(key, ())
+
+    def add(self, key: K, tokens: Iterable[str]) -> None:
+        """Index a key under its tokens, replacing the tokens it had"""
+        self.remove(key)
+        tokens = tuple(dict.fromkeys(token for token in tokens if token))
+        self._tokens[key] = tokens
+        for token in tokens:
+            insort(self._pairs, (token, key))
+
+    def bulk_load(self, items: Iterable[tuple[K, Iterable[str]]]) -> None:
+        """Index many keys at once, one sort instead of an insert per token"""
+        for key, tokens in items:
+            self.remove(key)
+            tokens = tuple(dict.fromkeys(token for token in tokens if token))
+            self._tokens[key] = tokens
+            self._pairs.extend((token, key) for token in tokens)
+        self._pairs.sort()
+
+    def remove(self, key: K) -> None:
+        for token in self._tokens.pop(key, ()):
+            i = bisect_left(self._pairs, (token, key))
+            if i < len(self._pairs) and self._pairs[i] == (token, key):
+                del self._pairs[i]
+
+    def search(self, prefix: str) -> Iterator[K]:
+        """Keys with a token starting with `prefix`, in token order"""
+        i = bisect_left(self._pairs, (prefix,))
+        while i < len(self._pairs) and self._pairs[i][0].startswith(prefix):
+            yield self._pairs[i][1]
+            i += 1
@@ -0,0 +1,173 @@
+import heapq
+import random
+from array import array
+from collections import deque
+from typing import Hashable
+
+# Mersenne prime for the (a * x + b) mod p row hashes
+_PRIME = (1 << 61) - 1
+
+
+class CountMinSketch:
+    """
+    Fixed-size frequency sketch.
+
+    Estimates never undercount and overcount by at most ~e/width of the total
+    added, with probability 1 - e^-depth.
+    """
+
+    __slots__ = ("width", "depth", "table", "_seeds")
+
+    def __init__(self, width: int, depth: int, seed: int = 0):
+        self.width = width
+        self.depth = depth
+        self.table = array("i", bytes(4 * width * depth))
+        # sketches built with the same seed hash alike and can be merged
+        rng = random.Random(seed)
+        self._seeds = [
+            (rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(depth)
+        ]
+
+    def _cells(self, key: Hashable) -> list[int]:
+        # hash() is salted per process, which is fine for a per-worker sketch
+        x = hash(key) % _PRIME
+        return [
+            row * self.width + (a * x + b) % _PRIME % self.width
+            for row, (a, b) in enumerate(self._seeds)
+        ]
+
+    def add(self, key: Hashable, count: int = 1) -> None:
+        for cell in self._cells(key):
+            self.table[cell] += count
+
+    def estimate(self, key: Hashable) -> int:
+        return min(self.table[cell] for cell in self._cells(key))
+
+    def merge(self, other: "CountMinSketch", sign: int = 1) -> None:
+        """Add (or with sign=-1 subtract) another sketch of the same shape"""
+        table = self.table
+        for cell, value in enumerate(other.table):
+            if value:
+                table[cell] += sign * value
+
+
+class SlidingWindowTopK:
+    """
+    Approximate heavy hitters over the last `buckets * bucket_seconds`.
+
+    Every bucket keeps its own sketch and `window` is their running sum, so
+    expiring a bucket is one subtraction. A bounded candidate set, ordered by
+    a lazily cleaned min-heap, tracks the keys worth reporting.
+    """
+
+    def __init__(
+        self,
+        *,
+        width: int,
+        depth: int,
+        bucket_seconds: int,
+        buckets: int,
+        k: int,
+    ):
+        self.width = width
+        self.depth = depth
+        self.bucket_seconds = bucket_seconds
+        self.buckets = buckets
+        self.k = k
+        self.capacity = 4 * k
+
+        self.window = CountMinSketch(width, depth)
+        self._buckets: deque[tuple[int, CountMinSketch]] = deque()
+        self._candidates: dict[Hashable, int] = {}
+        self._heap: list[tuple[int, Hashable]] = []
+        self._top: list[tuple[Hashable, int]] | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._buckets
+
+    def _advance(self, bucket_no: int) -> None:
+        expired = False
+        while self._buckets and self._buckets[0][0] <= bucket_no - self.buckets:
+            _, sketch = self._buckets.popleft()
+            self.window.merge(sketch, sign=-1)
+            expired = True
+
+        if expired:
+            self._rescore()
+
+    def _rescore(self) -> None:
+        candidates = {}
+        for key in self._candidates:
+            estimate = self.window.estimate(key)
+            if estimate > 0:
+                candidates[key] = estimate
+        self._candidates = candidates
+        self._heap = [(estimate, key) for key, estimate in candidates.items()]
+        heapq.heapify(self._heap)
+        self._top = None
+
+    def _bucket_for(self, bucket_no: int) -> CountMinSketch | None:
+        if self._buckets and bucket_no < self._buckets[-1][0]:
+            # late event, find its bucket if it is still inside the window
+            for number, sketch in self._buckets:
+                if number == bucket_no:
+                    return sketch
+            return None
+
+        if not self._buckets or bucket_no > self._buckets[-1][0]:
+            self._buckets.append((bucket_no, CountMinSketch(self.width, self.depth)))
+        return self._buckets[-1][1]
+
+    def add(self, key: Hashable, at: float, count: int = 1) -> None:
+        """Count `key` at unix time `at`, a negative count takes back earlier adds"""
+        bucket_no = int(at // self.bucket_seconds)
+        self._advance(max(bucket_no, self._buckets[-1][0] if self._buckets else 0))
+
+        sketch = self._bucket_for(bucket_no)
+        if sketch is None:
+            return
+        sketch.add(key, count)
+        self.window.add(key, count)
+
+        estimate = self.window.estimate(key)
+        if count < 0:
+            # the stale heap entries are dropped lazily
+            if key in self._candidates:
+                if estimate > 0:
+                    self._candidates[key] = estimate
+                    heapq.heappush(self._heap, (estimate, key))
+                else:
+                    del self._candidates[key]
+                self._top = None
+            return
+
+        if key not in self._candidates and len(self._candidates) >= self.capacity:
+            self._drop_stale()
+            if estimate <= self._heap[0][0]:
+                return
+            _, evicted = heapq.heappop(self._heap)
+            del self._candidates[evicted]
+
+        self._candidates[key] = estimate
+        heapq.heappush(self._heap, (estimate, key))
+        if len(self._heap) > 4 * self.capacity:
+            self._rescore()
+        self._top = None
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and self._candidates.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def expire(self, now: float) -> None:
+        """Drop buckets that fell out of the window as of unix time `now`"""
+        self._advance(int(now // self.bucket_seconds))
+
+    def top(self, limit: int) -> list[tuple[Hashable, int]]:
+        """Up to `limit` (key, estimated count) pairs, highest first"""
+        if self._top is None:
+            self._top = heapq.nlargest(
+                self.k, self._candidates.items(), key=lambda item: item[1]
+            )
+        return self._top[:limit]
@@ -0,0 +1,96 @@
+import re
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from campus_bridge.config.settings import settings
+
+THUMBNAIL_FORMAT = "WEBP"
+THUMBNAIL_EXTENSION = ".webp"
+THUMBNAIL_QUALITY = 80
+
+# largest decoded image we agree to resize, guards against decompression bombs
+MAX_SOURCE_PIXELS = 40_000_000
+
+# keys the upload service hands out, nothing else in the store is ever served
+SERVED_KEY = re.compile(
+    r"(id-cards|thumbnails)/[0-9a-f]{2}/[0-9a-f]{64}(_[0-9]+)?\.[a-z]+"
+)
+ID_CARD_KEY = re.compile(
+    r"id-cards/(?P<prefix>[0-9a-f]{2})/(?P<sha256>[0-9a-f]{64})\.(jpg|png|webp|pdf)"
+)
+
+
+def thumbnail_key(sha256: str, size: int) -> str:
+    """
+    Utility function to get the blob key of a thumbnail.
+
+    Thumbnails are addressed by the content hash of their source, so the same
+    image uploaded twice shares them.
+    """
+    return f"thumbnails/{sha256[:2]}/{sha256}_{size}{THUMBNAIL_EXTENSION}"
+
+
+def id_card_key(file_url: str | None) -> str | None:
+    """
+    Utility function to get the blob key of an uploaded ID card from its URL.
+
+    Args:
+        file_url: URL returned by the upload endpoint.
+
+    Returns:
+        str | None: Blob key, None for anything the upload endpoint does not
+                    hand out (e.g. external URLs, other keys, "..").
+    """
+    base_url = settings.UPLOAD_BASE_URL.rstrip("/") + "/"
+    if not file_url or not file_url.startswith(base_url):
+        return None
+
+    key = file_url.removeprefix(base_url)
+    match = ID_CARD_KEY.fullmatch(key)
+    if match is None or match["prefix"] != match["sha256"][:2]:
+        return None
+    return key
+
+
+def uploaded_image_key(file_url: str | None) -> str | None:
+    """
+    Utility function to get the blob key of an uploaded image from its URL.
+
+    Args:
+        file_url: URL returned by the upload endpoint.
+
+    Returns:
+        str | None: Blob key, None for anything that is not a content-addressed
+                    image upload (e.g. PDFs, external URLs).
+    """
+    key = id_card_key(file_url)
+    if key is None or PurePosixPath(key).suffix == ".pdf":
+        return None
+    return key
+
+
+def render_thumbnails(data: bytes, sizes: list[int]) -> dict[int, bytes]:
+    """
+    Resize and re-encode an image into one thumbnail per bounding box size.
+
+    CPU bound, meant to run in a process pool. Pillow is imported here so the
+    API process only loads it when it renders in-process.
+    """
+    from PIL import Image, ImageOps
+
+    Image.MAX_IMAGE_PIXELS = MAX_SOURCE_PIXELS
+
+    with Image.open(BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGB")
+
+        thumbnails = {}
+        # largest first so every smaller size resizes an already reduced image
+        for size in sorted(sizes, reverse=True):
+            image.thumbnail((size, size), Image.Resampling.LANCZOS)
+            output = BytesIO()
+            image.save(output, THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY)
+            thumbnails[size] = output.getvalue()
+
+    return thumbnails
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from campus_bridge.modules.alumni.service.alumni_service import AlumniService
+
+ID_CARD_URL = f"/media/id-cards/ab/{'ab' * 32}.png"
+
+
+def alumni_row():
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        user_id=uuid4(),
+        college_id=uuid4(),
+        graduation_year=2020,
+        company="Acme",
+        designation="Engineer",
+        experience_years=4,
+        expertise_areas={},
+        is_available=True,
+        is_verified=True,
+        id_card_url=ID_CARD_URL,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class FakeAlumniRepository:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def get_alumni_page(self, limit, cursor, **filters):
+        return self.rows[:limit]
+
+    async def get_current_alumni(self, user_id):
+        return self.rows[0]
+
+
+class FakeThumbnailService:
+    async def fill_urls(self, profiles):
+        for response, _ in profiles:
+            response.id_card_thumbnail_urls = {128: "/media/thumbnails/x.webp"}
+
+
+def test_directory_hides_id_cards_the_own_profile_shows_them():
+    service = AlumniService(
+        FakeAlumniRepository([alumni_row(), alumni_row()]),
+        None,
+        None,
+        FakeThumbnailService(),
+        None,
+    )
+
+    page = asyncio.run(service.get_alumni_directory(limit=10, cursor=None))
+    for item in page.model_dump()["items"]:
+        assert "id_card_url" not in item
+        assert "id_card_thumbnail_urls" not in item
+
+    profile = asyncio.run(service.get_current_alumni(SimpleNamespace(id=uuid4())))
+    assert profile.id_card_url == ID_CARD_URL
+    assert profile.id_card_thumbnail_urls == {128: "/media/thumbnails/x.webp"}
@@ -0,0 +1,144 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.schemas.alumni import UpdateAlumni
+from campus_bridge.modules.alumni.service.alumni_service import AlumniService
+from campus_bridge.modules.alumni.service.facet_cache import CompanyFacetCache
+from campus_bridge.modules.search.service.people_index import PeopleIndex
+
+COLLEGE_ID = uuid4()
+
+
+class FakeAlumniRepository:
+    """The alumni of one college, counted the way the SQL queries count"""
+
+    def __init__(self, alumni):
+        self.alumni = alumni
+        self.company_count_queries = 0
+
+    async def get_alumni_page(self, limit, cursor, college_id, **filters):
+        rows = sorted(
+            (row for row in self.alumni if row.college_id == college_id),
+            key=lambda row: (row.created_at, row.id),
+            reverse=True,
+        )
+        return rows[:limit]
+
+    async def count_alumni(self, cap, college_id, **filters):
+        return min(sum(row.college_id == college_id for row in self.alumni), cap + 1)
+
+    async def get_company_counts(self, college_id, limit):
+        self.company_count_queries += 1
+        counts = Counter(
+            row.company for row in self.alumni if row.college_id == college_id
+        )
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    async def get_graduation_year_counts(self, college_id):
+        counts = Counter(
+            row.graduation_year for row in self.alumni if row.college_id == college_id
+        )
+        return sorted(counts.items())
+
+    async def get_alumni(self, alumni_id=None, user_id=None):
+        return next(row for row in self.alumni if row.id == alumni_id)
+
+    async def update_alumni(self, alumni):
+        return alumni
+
+    async def get_user_email(self, user_id):
+        return None
+
+
+class FakeMentorMatcher:
+    def invalidate(self, college_id):
+        pass
+
+
+class FakeThumbnailService:
+    async def fill_urls(self, profiles):
+        pass
+
+
+def alumni(company: str, graduation_year: int, n: int):
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=n)
+    return SimpleNamespace(
+        id=uuid4(),
+        user_id=uuid4(),
+        college_id=COLLEGE_ID,
+        graduation_year=graduation_year,
+        company=company,
+        designation="Engineer",
+        experience_years=3,
+        expertise_areas={},
+        is_available=True,
+        is_verified=False,
+        id_card_url="",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def service_for(rows):
+    repository = FakeAlumniRepository(rows)
+    service = AlumniService(
+        repository,
+        FakeMentorMatcher(),
+        CompanyFacetCache(ttl_seconds=300),
+        FakeThumbnailService(),
+        PeopleIndex(max_colleges=1, max_profiles=10, ttl_seconds=60),
+    )
+    return service, repository
+
+
+def first_page(service, limit=2):
+    return asyncio.run(
+        service.get_alumni_directory(limit=limit, cursor=None, college_id=COLLEGE_ID)
+    )
+
+
+def test_first_page_counts_companies_and_years(monkeypatch):
+    monkeypatch.setattr(settings, "ALUMNI_FACET_TOP_COMPANIES", 2)
+    monkeypatch.setattr(settings, "DIRECTORY_COUNT_CAP", 4)
+    companies = ["Acme", "Globex", "Acme", "Initech", "Globex", "Acme"]
+    years = [2020, 2021, 2020, 2022, 2021, 2020]
+    service, _ = service_for(
+        [alumni(c, y, n) for n, (c, y) in enumerate(zip(companies, years))]
+    )
+
+    page = first_page(service)
+
+    assert [(f.company, f.count) for f in page.facets.companies] == [
+        ("Acme", 3),
+        ("Globex", 2),
+    ]
+    assert [(f.graduation_year, f.count) for f in page.facets.graduation_years] == [
+        (2020, 3),
+        (2021, 2),
+        (2022, 1),
+    ]
+    # six alumni, counted only up to the cap
+    assert (page.total, page.is_total_capped) == (4, True)
+
+
+def test_company_counts_are_cached_until_an_alumni_changes():
+    rows = [alumni("Acme", 2020, 0), alumni("Globex", 2021, 1)]
+    service, repository = service_for(rows)
+
+    first_page(service)
+    first_page(service)
+    assert repository.company_count_queries == 1
+
+    asyncio.run(
+        service.update_alumni(
+            UpdateAlumni.model_construct(company="Globex"), alumni_id=rows[0].id
+        )
+    )
+    page = first_page(service)
+
+    assert repository.company_count_queries == 2
+    assert [(f.company, f.count) for f in page.facets.companies] == [("Globex", 2)]
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from campus_bridge.data.enums.state import StateEnum
+from campus_bridge.data.schemas.college import CollegeUpdateRequest
+from campus_bridge.modules.college.service import college_catalog
+from campus_bridge.modules.college.service.college_catalog import CollegeCatalog
+from campus_bridge.modules.college.service.college_service import CollegeService
+
+STATE = list(StateEnum)[0]
+
+
+def college(name: str):
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        name=name,
+        is_government=False,
+        state=STATE,
+        city="Pune",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class FakeTable:
+    """The colleges table as committed, with its catalog fingerprint"""
+
+    def __init__(self, colleges):
+        self.colleges = {row.id: row for row in colleges}
+        self.version = (1,)
+        self.loads = 0
+
+    def commit(self, row):
+        self.colleges[row.id] = row
+        self.version = (self.version[0] + 1,)
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = FakeTable([college("Alpha Institute"), college("Beta College")])
+
+    class FakeSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class FakeCollegeRepository:
+        def __init__(self, session):
+            pass
+
+        async def get_catalog_version(self):
+            return table.version
+
+        async def get_all_college(self):
+            table.loads += 1
+            return [SimpleNamespace(**vars(row)) for row in table.colleges.values()]
+
+        async def get_college_by_id(self, college_id):
+            return SimpleNamespace(**vars(table.colleges[college_id]))
+
+        async def update_college(self, college):
+            return college
+
+    monkeypatch.setattr(college_catalog, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(college_catalog, "CollegeRepository", FakeCollegeRepository)
+    table.repository = FakeCollegeRepository(None)
+    return table
+
+
+def names(snapshot):
+    return [item["name"] for item in json.loads(snapshot.list_json)]
+
+
+def test_refresh_reloads_only_when_the_table_changed(table):
+    catalog = CollegeCatalog(refresh_interval_seconds=60)
+    snapshot = asyncio.run(catalog.snapshot())
+    assert names(snapshot) == ["Alpha Institute", "Beta College"]
+
+    assert asyncio.run(catalog.refresh()) is False
+    assert table.loads == 1
+
+    # a write committed by another worker
+    table.commit(college("Gamma University"))
+    assert asyncio.run(catalog.refresh()) is True
+    assert names(asyncio.run(catalog.snapshot())) == [
+        "Alpha Institute",
+        "Beta College",
+        "Gamma University",
+    ]
+
+
+def test_local_update_is_served_at_once_and_changes_the_etag(table):
+    catalog = CollegeCatalog(refresh_interval_seconds=60)
+    service = CollegeService(table.repository, None, catalog, None)
+    alpha = next(iter(table.colleges))
+    before = asyncio.run(service.get_college_by_id(alpha))
+
+    asyncio.run(
+        service.update_college(alpha, CollegeUpdateRequest(name="Alpha University"))
+    )
+    after = asyncio.run(
+        service.get_college_by_id(alpha, if_none_match=before.headers["ETag"])
+    )
+
+    assert after.status_code == 200
+    assert json.loads(after.body)["name"] == "Alpha University"
+    assert after.headers["ETag"] != before.headers["ETag"]
+
+
+def test_refresh_after_a_local_write_reloads_what_was_committed(table):
+    catalog = CollegeCatalog(refresh_interval_seconds=60)
+    asyncio.run(catalog.snapshot())
+    alpha = next(iter(table.colleges.values()))
+
+    # applied locally, but the transaction rolled back
+    catalog.apply(saved=[SimpleNamespace(**{**vars(alpha), "name": "Rolled Back"})])
+    assert "Rolled Back" in names(asyncio.run(catalog.snapshot()))
+
+    assert asyncio.run(catalog.refresh()) is True
+    assert names(asyncio.run(catalog.snapshot())) == [
+        "Alpha Institute",
+        "Beta College",
+    ]
@@ -0,0 +1,134 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from campus_bridge.data.enums.state import StateEnum
+from campus_bridge.data.schemas.college import CollegeResponse
+from campus_bridge.modules.college.service.college_catalog import CatalogSnapshot
+from campus_bridge.modules.college.service.college_search import CollegeSearch
+from campus_bridge.modules.college.service.college_service import CollegeService
+
+STATE, OTHER_STATE = list(StateEnum)[:2]
+
+
+def college(name: str, city: str, state: StateEnum = STATE) -> CollegeResponse:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return CollegeResponse(
+        id=uuid4(),
+        name=name,
+        is_government=False,
+        state=state,
+        city=city,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+COLLEGES = [
+    college("Zeta College", "Mumbai"),
+    college("Bharati Technical College", "Nagpur"),
+    college("Technology Institute", "Mumbai"),
+    college("Anand College", "Techpur"),
+    college("Amrita Institute of Technology", "Pune"),
+    college("Techno Polytechnic", "Chennai", state=OTHER_STATE),
+]
+
+
+class FakeCatalog:
+    def __init__(self, colleges):
+        self.current = CatalogSnapshot.build(colleges, version=(1,))
+
+    async def snapshot(self):
+        return self.current
+
+
+def search(query, state=STATE, limit=10, colleges=COLLEGES):
+    results = asyncio.run(
+        CollegeSearch(FakeCatalog(colleges)).search(query, state=state, limit=limit)
+    )
+    return [college.name for college in results]
+
+
+def test_names_starting_with_query_rank_above_name_words_then_city_words():
+    assert search("tech") == [
+        # the name starts with the query
+        "Technology Institute",
+        # a word of the name does, in name order
+        "Amrita Institute of Technology",
+        "Bharati Technical College",
+        # a word of the city does
+        "Anand College",
+    ]
+
+
+def test_every_query_word_must_prefix_a_word():
+    assert search("inst tech") == [
+        "Amrita Institute of Technology",
+        "Technology Institute",
+    ]
+    assert search("tech nagpur") == ["Bharati Technical College"]
+    assert search("tech chennai") == []
+
+
+def test_search_stops_at_limit_keeping_the_best_ranked():
+    assert search("tech", limit=2) == [
+        "Technology Institute",
+        "Amrita Institute of Technology",
+    ]
+
+
+def test_state_filter_and_every_state():
+    assert search("techno", state=OTHER_STATE) == ["Techno Polytechnic"]
+    assert search("techno", state=None) == [
+        "Techno Polytechnic",
+        "Technology Institute",
+        "Amrita Institute of Technology",
+    ]
+    # no college in the state at all
+    assert search("tech", state=list(StateEnum)[2]) == []
+
+
+def test_index_is_rebuilt_when_the_snapshot_is_replaced():
+    catalog = FakeCatalog(COLLEGES)
+    college_search = CollegeSearch(catalog)
+
+    def names(query):
+        results = asyncio.run(college_search.search(query, state=STATE, limit=10))
+        return [college.name for college in results]
+
+    assert names("omega") == []
+    index = college_search._index
+    assert names("zeta") == ["Zeta College"]
+    assert college_search._index is index
+
+    catalog.current = CatalogSnapshot.build(
+        [*COLLEGES, college("Omega College", "Pune")], version=(2,)
+    )
+    assert names("omega") == ["Omega College"]
+    assert college_search._index is not index
+
+
+class FakeCollegeRepository:
+    def __init__(self, college_ids):
+        self.college_ids = college_ids
+        self.queries = []
+
+    async def search_colleges(self, query, state, limit):
+        self.queries.append(query)
+        return self.college_ids
+
+
+def test_service_falls_back_to_the_database_only_without_prefix_matches():
+    catalog = FakeCatalog(COLLEGES)
+    # the database matches misspellings, including a college it no longer has
+    amrita = COLLEGES[4]
+    repository = FakeCollegeRepository([amrita.id, uuid4()])
+    service = CollegeService(repository, None, catalog, CollegeSearch(catalog))
+
+    found = asyncio.run(service.search_colleges("tech", state=STATE, limit=1))
+    assert [college.name for college in found] == ["Technology Institute"]
+    assert repository.queries == []
+
+    found = asyncio.run(service.search_colleges("amritta", state=STATE, limit=5))
+    assert [college.id for college in found] == [amrita.id]
+    assert repository.queries == ["amritta"]
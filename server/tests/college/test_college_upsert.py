@@ -0,0 +1,184 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy.dialects import postgresql
+
+from campus_bridge.config.settings import settings
+from campus_bridge.data.enums.state import StateEnum
+from campus_bridge.data.schemas.college import CreateCollegeRequest
+from campus_bridge.modules.college.repository.college_repository import (
+    CollegeRepository,
+)
+from campus_bridge.modules.college.service.college_service import CollegeService
+
+STATE = list(StateEnum)[0]
+NOW = datetime.now(timezone.utc)
+
+
+class RecordingSession:
+    def __init__(self):
+        self.sql = None
+
+    async def execute(self, statement, params=None):
+        self.sql = str(statement.compile(dialect=postgresql.dialect()))
+        return SimpleNamespace(all=lambda: [])
+
+    async def commit(self):
+        pass
+
+
+def upsert_sql(update: bool) -> str:
+    session = RecordingSession()
+    asyncio.run(
+        CollegeRepository(session).upsert_colleges(
+            [{"name": "A", "city": "Pune", "state": STATE, "is_government": False}],
+            update=update,
+        )
+    )
+    return " ".join(session.sql.split())
+
+
+def test_upsert_statement_updates_only_changed_or_deleted_colleges():
+    sql = upsert_sql(update=True)
+
+    assert "ON CONFLICT (name, city, state) DO UPDATE SET" in sql
+    assert (
+        "WHERE colleges.is_deleted OR colleges.is_government !="
+        " excluded.is_government" in sql
+    )
+    assert "xmax = %(xmax_1)s::INTEGER AS inserted" in sql
+
+
+def test_insert_statement_skips_existing_colleges():
+    sql = upsert_sql(update=False)
+
+    assert "ON CONFLICT (name, city, state) DO NOTHING" in sql
+    assert "DO UPDATE" not in sql
+
+
+class FakeCollegeRepository:
+    """ON CONFLICT semantics of upsert_colleges over an in-memory table"""
+
+    def __init__(self, existing: list[dict]):
+        self.table = {
+            (row["name"], row["city"], row["state"]): dict(
+                row, id=uuid4(), created_at=NOW, updated_at=NOW
+            )
+            for row in existing
+        }
+        self.statements = []
+
+    async def upsert_colleges(self, colleges, update):
+        self.statements.append(len(colleges))
+        returned = []
+        for college in colleges:
+            key = (college["name"], college["city"], college["state"])
+            row = self.table.get(key)
+            if row is None:
+                row = self.table[key] = dict(
+                    college,
+                    id=uuid4(),
+                    is_deleted=False,
+                    created_at=NOW,
+                    updated_at=NOW,
+                )
+                returned.append(SimpleNamespace(**row, inserted=True))
+            elif update and (
+                row["is_deleted"] or row["is_government"] != college["is_government"]
+            ):
+                row.update(is_government=college["is_government"], is_deleted=False)
+                returned.append(SimpleNamespace(**row, inserted=False))
+        return returned
+
+
+class FakeCatalog:
+    def __init__(self):
+        self.saved = []
+
+    def apply(self, saved=(), deleted=()):
+        self.saved.extend(saved)
+
+
+def existing(name, is_government=False, is_deleted=False):
+    return dict(
+        name=name,
+        city="Pune",
+        state=STATE,
+        is_government=is_government,
+        is_deleted=is_deleted,
+    )
+
+
+def test_create_skips_existing_and_repeated_colleges():
+    repository = FakeCollegeRepository([existing("Alpha Institute")])
+    catalog = FakeCatalog()
+    service = CollegeService(repository, None, catalog, None)
+    payload = [
+        CreateCollegeRequest(name=name, city="Pune", state=STATE)
+        for name in ["Alpha Institute", "Beta College", "Beta College"]
+    ]
+
+    response = asyncio.run(service.create_colleges(payload))
+
+    assert (response.inserted, response.updated, response.skipped) == (1, 0, 2)
+    assert [college.name for college in response.colleges] == ["Beta College"]
+    assert [row.name for row in catalog.saved] == ["Beta College"]
+
+
+def csv_request(text: str) -> Request:
+    boundary = b"college-import"
+    body = (
+        b"--" + boundary + b"\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="colleges.csv"\r\n'
+        b"Content-Type: text/csv\r\n\r\n" + text.encode() + b"\r\n"
+        b"--" + boundary + b"--\r\n"
+    )
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "headers": [
+                (b"content-type", b"multipart/form-data; boundary=" + boundary)
+            ],
+        },
+        receive,
+    )
+
+
+def test_import_upserts_in_chunks_and_counts_each_outcome(monkeypatch):
+    monkeypatch.setattr(settings, "COLLEGE_IMPORT_CHUNK_SIZE", 2)
+    repository = FakeCollegeRepository(
+        [
+            existing("Alpha Institute"),
+            existing("Beta College", is_government=True),
+            existing("Delta College", is_deleted=True),
+        ]
+    )
+    service = CollegeService(repository, None, FakeCatalog(), None)
+    rows = [
+        "name,is_government,state,city",
+        f"Alpha Institute,false,{STATE.value},Pune",  # unchanged, skipped
+        f"Beta College,false,{STATE.value},Pune",  # updated
+        f"Gamma University,true,{STATE.value},Pune",  # inserted
+        f"Delta College,false,{STATE.value},Pune",  # restored
+        f",false,{STATE.value},Pune",  # no name
+        f"Gamma University,true,{STATE.value},Pune",  # repeated
+    ]
+
+    report = asyncio.run(
+        service.import_colleges(csv_request("\n".join(rows)), update_existing=True)
+    )
+
+    assert (report.inserted, report.updated, report.skipped) == (1, 2, 1)
+    assert (report.total_rows, report.failed) == (6, 2)
+    assert [error.line for error in report.errors] == [6, 7]
+    # four valid rows, one INSERT ... ON CONFLICT per chunk of two
+    assert repository.statements == [2, 2]
+    assert repository.table[("Delta College", "Pune", STATE)]["is_deleted"] is False
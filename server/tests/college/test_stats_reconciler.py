@@ -0,0 +1,126 @@
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy.sql import Delete, Insert, Select, TextClause
+
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.data.models import CollegeStudentStat
+from campus_bridge.modules.college.repository.college_stats_repository import (
+    STATS_KEYS,
+    CollegeStatsRepository,
+)
+from campus_bridge.modules.college.service import stats_reconciler
+from campus_bridge.modules.college.service.stats_reconciler import (
+    CollegeStatsReconciler,
+)
+
+CSE, ECE, CIVIL, ME = (
+    BranchEnum.CSE,
+    BranchEnum.ECE,
+    BranchEnum.CIVIL,
+    BranchEnum.MECHNICAL,
+)
+
+
+class FakeResult(list):
+    def all(self):
+        return list(self)
+
+
+class FakeStatsSession:
+    """Answers the stats table and source table reads of one college"""
+
+    def __init__(self, stored: list[tuple], counted: list[tuple]):
+        self.stored, self.counted = stored, counted
+        self.statements = []
+        self.upserted, self.deleted, self.commits = [], None, 0
+
+    async def execute(self, statement, params=None):
+        self.statements.append(type(statement))
+        if isinstance(statement, Insert):
+            self.upserted = params
+        elif isinstance(statement, Delete):
+            self.deleted = statement.compile().params
+        elif isinstance(statement, Select):
+            froms = statement.get_final_froms()
+            if CollegeStudentStat.__table__ in froms:
+                return FakeResult(self.stored)
+            return FakeResult(self.counted)
+        return FakeResult()
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_recount_fixes_drifted_missing_and_stale_rows():
+    session = FakeStatsSession(
+        stored=[(CSE, 1, 10, 8), (ECE, 2, 3, 3), (ME, 4, 1, 0)],
+        counted=[(CSE, 1, 11, 8), (ECE, 2, 3, 3), (CIVIL, 3, 2, 1)],
+    )
+    college_id = uuid4()
+
+    fixed = asyncio.run(
+        CollegeStatsRepository(session).reconcile(CollegeStudentStat, college_id)
+    )
+
+    # locked before anything is read, committed once at the end
+    assert session.statements[0] is TextClause
+    assert session.commits == 1
+    assert fixed == 3
+    assert sorted(
+        (row["branch"], row["year_of_study"], row["total"], row["verified"])
+        for row in session.upserted
+    ) == sorted([(CSE, 1, 11, 8), (CIVIL, 3, 2, 1)])
+    assert all(row["college_id"] == college_id for row in session.upserted)
+    assert [(ME, 4)] in session.deleted.values()
+    assert college_id in session.deleted.values()
+
+
+def test_recount_of_exact_stats_writes_nothing():
+    rows = [(CSE, 1, 10, 8), (ECE, 2, 3, 3)]
+    session = FakeStatsSession(stored=rows, counted=rows)
+
+    fixed = asyncio.run(
+        CollegeStatsRepository(session).reconcile(CollegeStudentStat, uuid4())
+    )
+
+    assert fixed == 0
+    assert Insert not in session.statements
+    assert Delete not in session.statements
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+
+def test_reconcile_recounts_every_table_of_every_college(monkeypatch):
+    colleges = [uuid4(), uuid4()]
+    recounted = []
+
+    class FakeStatsRepository:
+        def __init__(self, session):
+            pass
+
+        async def get_college_ids(self):
+            return colleges
+
+        async def reconcile(self, model, college_id):
+            recounted.append((model, college_id))
+            return 2 if model is CollegeStudentStat else 0
+
+    monkeypatch.setattr(stats_reconciler, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(stats_reconciler, "CollegeStatsRepository", FakeStatsRepository)
+
+    fixed = asyncio.run(CollegeStatsReconciler(interval_seconds=60).reconcile())
+
+    assert fixed == 2 * len(colleges)
+    assert recounted == [
+        (model, college_id) for college_id in colleges for model in STATS_KEYS
+    ]
@@ -0,0 +1,159 @@
+import asyncio
+import random
+import time
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+
+from campus_bridge.modules.feed.service import impression_tracker as tracker_module
+from campus_bridge.modules.feed.service.impression_tracker import ImpressionTracker
+
+
+class FakeDatabase:
+    """The counters table, reachable or not"""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.down = False
+        self.flushes = 0
+
+
+class FakeSession:
+    def __init__(self, db: FakeDatabase):
+        self.db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        await asyncio.sleep(0)
+
+
+class FakeImpressionRepository:
+    def __init__(self, session: FakeSession):
+        self.db = session.db
+
+    async def add_counts(self, deltas: Counter) -> None:
+        self.db.flushes += 1
+        # let feed reads interleave with the flush
+        await asyncio.sleep(0)
+        if self.db.down:
+            raise ConnectionRefusedError("database is down")
+        self.db.counts.update(deltas)
+
+
+@pytest.fixture
+def db(monkeypatch) -> FakeDatabase:
+    db = FakeDatabase()
+    monkeypatch.setattr(tracker_module, "AsyncSessionLocal", lambda: FakeSession(db))
+    monkeypatch.setattr(
+        tracker_module, "ImpressionRepository", FakeImpressionRepository
+    )
+    return db
+
+
+def make_tracker(**options) -> ImpressionTracker:
+    return ImpressionTracker(
+        **{
+            "flush_interval_seconds": 0.01,
+            "max_pending": 50,
+            "max_buffered": 10_000,
+            "max_backoff_seconds": 0.2,
+            **options,
+        }
+    )
+
+
+def test_no_impression_lost_or_double_counted(db):
+    post_ids = [uuid4() for _ in range(500)]
+    served: Counter = Counter()
+
+    async def reader(tracker: ImpressionTracker, rng: random.Random):
+        for _ in range(300):
+            page = rng.sample(post_ids, 20)
+            tracker.record(page)
+            served.update(page)
+            await asyncio.sleep(0)
+
+    async def flaky_database(rng: random.Random):
+        for _ in range(50):
+            db.down = rng.random() < 0.3
+            await asyncio.sleep(0.005)
+        db.down = False
+
+    async def scenario():
+        tracker = make_tracker()
+        tracker.start()
+        rng = random.Random(27)
+        await asyncio.gather(
+            flaky_database(random.Random(rng.random())),
+            *(reader(tracker, random.Random(rng.random())) for _ in range(20)),
+        )
+        db.down = False
+        await tracker.stop()
+
+    asyncio.run(scenario())
+
+    assert db.flushes > 1
+    assert db.counts == served
+
+
+def test_failing_flushes_back_off(db):
+    db.down = True
+
+    async def scenario():
+        tracker = make_tracker(max_pending=1, max_backoff_seconds=10)
+        tracker.start()
+        deadline = time.monotonic() + 0.3
+        while time.monotonic() < deadline:
+            tracker.record([uuid4()])
+            await asyncio.sleep(0.001)
+        assert tracker.backing_off
+        db.down = False
+        await tracker.stop()
+        return tracker
+
+    tracker = asyncio.run(scenario())
+
+    # 0.01 + 0.02 + 0.04 + 0.08 + 0.16 s of backoff fit in the 0.3 s window,
+    # without it every record would have woken a flush
+    assert db.flushes <= 7
+    assert not tracker.backing_off
+
+
+def test_pending_posts_capped_while_database_down(db):
+    db.down = True
+    tracker = make_tracker(max_buffered=100)
+    kept = [uuid4() for _ in range(100)]
+    tracker.record(kept)
+    asyncio.run(tracker.flush())
+
+    tracker.record(uuid4() for _ in range(1000))
+    tracker.record(kept)
+
+    assert tracker.backing_off
+    assert all(tracker.pending_count(post_id) == 2 for post_id in kept)
+
+    db.down = False
+    assert asyncio.run(tracker.flush()) == 100
+    assert sum(db.counts.values()) == 200
+
+
+def test_repeated_pages_flush_as_one_count_per_post(db):
+    tracker = make_tracker(max_pending=10**9, max_buffered=10**9)
+    pages = [[uuid4() for _ in range(20)] for _ in range(500)]
+
+    for _ in range(20):
+        for page in pages:
+            tracker.record(page)
+
+    post_ids = [post_id for page in pages for post_id in page]
+    assert all(tracker.pending_count(post_id) == 20 for post_id in post_ids)
+    # one row per post reaches the database, however often it was served
+    assert asyncio.run(tracker.flush()) == 10_000
+    assert db.counts == Counter({post_id: 20 for post_id in post_ids})
+    assert tracker.pending_count(post_ids[0]) == 0
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from campus_bridge.data.enums.post import PostTypeEnum, PostVisibilityEnum
+from campus_bridge.data.schemas.feed import PostCreate
+from campus_bridge.modules.feed.service.feed_service import FeedService
+from campus_bridge.modules.feed.service.head_counter import CollegeHeadCounter
+
+SINCE = (datetime(2026, 1, 1, tzinfo=timezone.utc), UUID(int=0))
+
+
+class FakeFeedRepository:
+    def __init__(self, commit_fails: bool = False):
+        self.commit_fails = commit_fails
+
+    async def create_post(self, post):
+        now = datetime.now(timezone.utc)
+        post.id, post.created_at, post.updated_at = uuid4(), now, now
+        return post
+
+    async def create_post_tags(self, tags):
+        pass
+
+    async def add_trending_tag_events(self, post_id, hashtags, is_public, delta):
+        pass
+
+    async def commit(self):
+        if self.commit_fails:
+            raise RuntimeError("commit failed")
+
+
+def create_post(repository, head_counter, college_id):
+    service = FeedService(repository, None, head_counter, None, None)
+    user = SimpleNamespace(id=uuid4(), college_id=college_id)
+    post = PostCreate(
+        content="hello #campus",
+        post_type=PostTypeEnum.TEXT,
+        visibility=PostVisibilityEnum.COLLEGE,
+    )
+    return asyncio.run(service.create_post(post, user))
+
+
+def test_committed_post_is_counted():
+    head_counter, college_id = CollegeHeadCounter(cap=10, ttl_seconds=60), uuid4()
+    head_counter.store(college_id, [], SINCE)
+
+    create_post(FakeFeedRepository(), head_counter, college_id)
+
+    assert head_counter.count_since(college_id, SINCE) == 1
+
+
+def test_failed_commit_leaves_no_phantom_post():
+    head_counter, college_id = CollegeHeadCounter(cap=10, ttl_seconds=60), uuid4()
+    head_counter.store(college_id, [], SINCE)
+
+    with pytest.raises(RuntimeError):
+        create_post(FakeFeedRepository(commit_fails=True), head_counter, college_id)
+
+    assert head_counter.count_since(college_id, SINCE) == 0
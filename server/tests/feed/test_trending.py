@@ -0,0 +1,99 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from campus_bridge.data.enums.post import PostVisibilityEnum
+from campus_bridge.data.enums.tag import TagTypeEnum
+from campus_bridge.modules.feed.service.feed_service import FeedService
+from campus_bridge.utils.sketches import SlidingWindowTopK
+
+HASHTAG, MENTION = TagTypeEnum.HASHTAG, TagTypeEnum.MENTION
+
+
+class FakeFeedRepository:
+    def __init__(self):
+        self.tags: set = set()
+        self.events: list[tuple[str, bool, int]] = []
+
+    async def get_post_tags(self, post_id):
+        return set(self.tags)
+
+    async def create_post_tags(self, tags):
+        self.tags |= {(tag.tag_type, tag.tag) for tag in tags}
+
+    async def delete_post_tags(self, post_id, tags):
+        self.tags -= tags
+
+    async def add_trending_tag_events(self, post_id, hashtags, is_public, delta):
+        assert all((HASHTAG, tag) in self.tags for tag in hashtags)
+        self.events += [(tag, is_public, delta) for tag in hashtags]
+
+
+def make_post(**fields):
+    return SimpleNamespace(
+        id=uuid4(),
+        college_id=uuid4(),
+        visibility=PostVisibilityEnum.COLLEGE,
+        is_hidden=False,
+        is_deleted=False,
+        **fields,
+    )
+
+
+def save_tags(repository, post, new_tags, was_counted=True, was_public=False):
+    service = FeedService(repository, None, None, None, None)
+    asyncio.run(
+        service._save_post_tags(
+            post,
+            old_tags=set(repository.tags),
+            new_tags=new_tags,
+            was_counted=was_counted,
+            was_public=was_public,
+        )
+    )
+
+
+def net_counts(events):
+    counts = {}
+    for tag, is_public, delta in events:
+        counts[(tag, is_public)] = counts.get((tag, is_public), 0) + delta
+    return {key: count for key, count in counts.items() if count}
+
+
+def test_edit_counts_only_changed_hashtags():
+    repository, post = FakeFeedRepository(), make_post()
+    save_tags(repository, post, {(HASHTAG, "a"), (HASHTAG, "b")}, was_counted=False)
+    repository.events.clear()
+
+    save_tags(repository, post, {(HASHTAG, "b"), (HASHTAG, "c"), (MENTION, "x")})
+
+    assert sorted(repository.events) == [("a", False, -1), ("c", False, 1)]
+    assert repository.tags == {(HASHTAG, "b"), (HASHTAG, "c"), (MENTION, "x")}
+
+
+def test_hidden_deleted_and_moved_posts_give_counts_back():
+    repository, post = FakeFeedRepository(), make_post()
+    tags = {(HASHTAG, "a"), (HASHTAG, "b")}
+    save_tags(repository, post, tags, was_counted=False)
+
+    post.visibility = PostVisibilityEnum.PUBLIC
+    save_tags(repository, post, tags)
+    assert net_counts(repository.events) == {("a", True): 1, ("b", True): 1}
+
+    post.is_deleted = True
+    save_tags(repository, post, tags, was_public=True)
+    assert net_counts(repository.events) == {}
+
+
+def test_taken_back_counts_leave_the_top():
+    window = SlidingWindowTopK(width=256, depth=4, bucket_seconds=60, buckets=10, k=5)
+    for _ in range(3):
+        window.add("a", at=100)
+    window.add("b", at=100)
+    window.add("b", at=130)
+
+    window.add("a", at=100, count=-2)
+    assert window.top(5) == [("b", 2), ("a", 1)]
+
+    window.add("a", at=100, count=-1)
+    assert window.top(5) == [("b", 2)]
@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from campus_bridge.api.v1.app import app
+from campus_bridge.api.v1.dependencies import get_current_user
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.data.models.student import Student
+from campus_bridge.modules.student.service.student_service import (
+    StudentService,
+    get_student_service,
+)
+
+ID_CARD_URL = f"/media/id-cards/ab/{'ab' * 32}.png"
+
+
+class FakeStudentRepository:
+    def __init__(self):
+        self.created = []
+
+    async def get_by_user_id(self, user_id):
+        return None
+
+    async def get_by_roll_numbers(self, college_id, roll_numbers):
+        return []
+
+    async def create_student(self, student):
+        # what the database would refuse: a NOT NULL column left without value
+        for column in Student.__table__.columns:
+            if column.nullable or column.default or column.server_default:
+                continue
+            assert getattr(student, column.key) is not None, column.key
+
+        now = datetime.now(timezone.utc)
+        student.id, student.created_at, student.updated_at = uuid4(), now, now
+        student.is_verified = False
+        self.created.append(student)
+        return student
+
+
+class FakePeopleIndex:
+    def remove(self, college_id, user_id):
+        pass
+
+
+class FakeThumbnailService:
+    async def fill_urls(self, profiles):
+        pass
+
+
+def test_create_student():
+    repository = FakeStudentRepository()
+    user = SimpleNamespace(id=uuid4(), college_id=uuid4(), role=RoleEnum.STUDENT)
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_student_service] = lambda: StudentService(
+        repository, FakePeopleIndex(), None, FakeThumbnailService()
+    )
+    try:
+        response = TestClient(app).post(
+            "/api/v1/student/",
+            json={
+                "first_name": "Asha",
+                "middle_name": None,
+                "last_name": "Rao",
+                "roll_number": "21CS001",
+                "branch": list(BranchEnum)[0].value,
+                "year_of_study": 2,
+                "id_card_url": ID_CARD_URL,
+                "interests": {"clubs": ["robotics"]},
+            },
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 201, response.text
+    assert response.json()["id_card_url"] == ID_CARD_URL
+    [student] = repository.created
+    assert (student.user_id, student.college_id) == (user.id, user.college_id)
+    assert student.id_card_url == ID_CARD_URL
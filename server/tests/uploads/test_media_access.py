@@ -0,0 +1,73 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from campus_bridge.core.storage import LocalBlobStore
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.errors.exc import UnauthorizedError
+from campus_bridge.modules.uploads.service.upload_service import UploadService
+from campus_bridge.utils.thumbnails import thumbnail_key
+
+SHA256 = "ab" * 32
+ID_CARD_KEY = f"id-cards/ab/{SHA256}.png"
+
+
+class FakeUploadRepository:
+    def __init__(self, owners: dict[str, tuple]):
+        self.owners = owners
+
+    async def get_id_card_owners(self, id_card_urls):
+        return [self.owners[url] for url in id_card_urls if url in self.owners]
+
+
+@pytest.fixture
+def setup(tmp_path):
+    store = LocalBlobStore(tmp_path, "/media")
+    asyncio.run(store.put(ID_CARD_KEY, b"\x89PNG\r\n\x1a\nimage"))
+    asyncio.run(store.put(thumbnail_key(SHA256, 128), b"thumbnail"))
+
+    owner = SimpleNamespace(id=uuid4(), college_id=uuid4(), role=RoleEnum.STUDENT)
+    repository = FakeUploadRepository(
+        {store.url_for(ID_CARD_KEY): (owner.id, owner.college_id)}
+    )
+    service = UploadService(repository, store, thumbnail_service=None, max_bytes=1)
+    return service, owner
+
+
+def read(service, key, user):
+    async def run():
+        chunks, _ = await service.open_file(key, user)
+        return b"".join([chunk async for chunk in chunks])
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("key", [ID_CARD_KEY, thumbnail_key(SHA256, 128)])
+def test_owner_admin_and_college_officials_can_read(setup, key):
+    service, owner = setup
+    readers = [
+        owner,
+        SimpleNamespace(id=uuid4(), college_id=None, role=RoleEnum.ADMIN),
+        SimpleNamespace(
+            id=uuid4(), college_id=owner.college_id, role=RoleEnum.OFFICIALS
+        ),
+    ]
+
+    for user in readers:
+        assert read(service, key, user)
+
+
+@pytest.mark.parametrize("key", [ID_CARD_KEY, thumbnail_key(SHA256, 128)])
+def test_others_cannot_read(setup, key):
+    service, owner = setup
+    others = [
+        # same college but not an official
+        SimpleNamespace(id=uuid4(), college_id=owner.college_id, role=RoleEnum.STUDENT),
+        SimpleNamespace(id=uuid4(), college_id=uuid4(), role=RoleEnum.OFFICIALS),
+    ]
+
+    for user in others:
+        with pytest.raises(UnauthorizedError):
+            read(service, key, user)
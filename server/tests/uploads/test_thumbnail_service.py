@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from campus_bridge.core.storage import LocalBlobStore
+from campus_bridge.data.enums.branch import BranchEnum
+from campus_bridge.data.schemas.student import StudentCreate
+from campus_bridge.data.schemas.upload import IdCardThumbnails
+from campus_bridge.modules.uploads.service.thumbnail_service import ThumbnailService
+from campus_bridge.utils.thumbnails import thumbnail_key
+
+SHA256 = "ab" * 32
+
+
+def test_only_generated_thumbnails_are_reported(tmp_path):
+    store = LocalBlobStore(tmp_path, "/media")
+    service = ThumbnailService(store, sizes=[128, 512], processes=1, queue_size=10)
+    image_url = store.url_for(f"id-cards/ab/{SHA256}.jpg")
+    asyncio.run(store.put(thumbnail_key(SHA256, 128), b"thumbnail"))
+
+    image, pdf = IdCardThumbnails(), IdCardThumbnails()
+    asyncio.run(
+        service.fill_urls([(image, image_url), (pdf, "/media/id-cards/cd/x.pdf")])
+    )
+
+    assert image.id_card_thumbnail_urls == {
+        128: store.url_for(thumbnail_key(SHA256, 128))
+    }
+    assert pdf.id_card_thumbnail_urls == {}
+    # the missing size is queued again, once
+    assert service._queue.qsize() == 1
+    asyncio.run(service.fill_urls([(IdCardThumbnails(), image_url)]))
+    assert service._queue.qsize() == 1
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        f"/media/../../etc/{SHA256}.png",
+        f"/media/id-cards/ab/../../../etc/{SHA256}.png",
+        f"/media/id-cards/cd/{SHA256}.png",
+        f"/media/thumbnails/ab/{SHA256}_128.webp",
+        "/media/id-cards/ab/passwd.png",
+        "https://example.com/id.png",
+    ],
+)
+def test_unserved_id_card_urls_are_rejected_and_never_queued(tmp_path, url):
+    store = LocalBlobStore(tmp_path, "/media")
+    service = ThumbnailService(store, sizes=[128], processes=1, queue_size=10)
+
+    with pytest.raises(ValidationError):
+        StudentCreate(
+            first_name="Asha",
+            middle_name=None,
+            last_name=None,
+            roll_number="21CS001",
+            branch=list(BranchEnum)[0],
+            year_of_study=1,
+            id_card_url=url,
+            interests={},
+        )
+
+    response = IdCardThumbnails()
+    asyncio.run(service.fill_urls([(response, url)]))
+    assert response.id_card_thumbnail_urls == {}
+    assert service._queue.qsize() == 0
@@ -0,0 +1,67 @@
+import asyncio
+import tracemalloc
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from campus_bridge.data.enums.export import ExportFormatEnum
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.modules.users.service.user_service import UserService
+
+ROWS = 30_000
+
+
+class FakeUserRepository:
+    def __init__(self):
+        self.streamed = 0
+
+    async def _rows(self):
+        created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for n in range(ROWS):
+            self.streamed += 1
+            yield (
+                UUID(int=n),
+                f"user{n}@college.example.edu",
+                f"+9199{n:08d}",
+                RoleEnum.STUDENT,
+                n % 2 == 0,
+                created_at,
+            )
+
+    async def stream_users_for_export(self, college_id, role, batch_size):
+        return self._rows()
+
+
+def export(export_format):
+    repository = FakeUserRepository()
+    service = UserService(repository, None, None)
+
+    async def run():
+        response = await service.export_users(uuid4(), None, export_format)
+        body = response.body_iterator
+
+        first = await anext(body)
+        streamed_before_first_chunk = repository.streamed
+
+        tracemalloc.start()
+        size = len(first)
+        async for chunk in body:
+            size += len(chunk)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return streamed_before_first_chunk, size, peak
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("export_format", list(ExportFormatEnum))
+def test_export_streams_in_bounded_memory(export_format):
+    streamed_before_first_chunk, size, peak = export(export_format)
+
+    # the first bytes go out long before the last row is read
+    assert streamed_before_first_chunk < ROWS
+    # and the encoder never holds more than a batch, not the whole file
+    assert peak < 4 * 1024 * 1024
+    if export_format == ExportFormatEnum.CSV:
+        assert size > 4 * peak
@@ -0,0 +1,81 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from campus_bridge.data.enums.role import RoleEnum
+from campus_bridge.modules.search.service.people_index import (
+    PeopleIndex,
+    Person,
+    _CollegeIndex,
+)
+from campus_bridge.modules.verification.service.verification_service import (
+    VerificationService,
+)
+
+
+class FakeVerificationRepository:
+    def __init__(self, people: list[Person]):
+        self.people = {person.user_id: person for person in people}
+        self.profiles = {uuid4(): person.user_id for person in people}
+
+    async def decide(self, model, profile_ids, reviewer_id, approve, reason):
+        return [
+            SimpleNamespace(id=profile_id, user_id=self.profiles[profile_id])
+            for profile_id in profile_ids
+        ]
+
+    async def get_people(self, model, user_ids):
+        return [tuple(self.people[user_id]) for user_id in user_ids]
+
+
+class FakeMatcher:
+    def __init__(self):
+        self.invalidated = []
+
+    def invalidate(self, college_id):
+        self.invalidated.append(college_id)
+
+
+def decide(approve: bool, indexed: list[Person], pending: list[Person]):
+    college_id = uuid4()
+    index = PeopleIndex(max_colleges=1, max_profiles=100, ttl_seconds=3600)
+    index._colleges[college_id] = _CollegeIndex(indexed)
+    repository = FakeVerificationRepository(pending)
+    service = VerificationService(repository, FakeMatcher(), FakeMatcher(), None, index)
+    reviewer = SimpleNamespace(id=uuid4(), role=RoleEnum.OFFICIALS)
+
+    response = asyncio.run(
+        service.decide(
+            reviewer,
+            college_id,
+            RoleEnum.STUDENT,
+            list(repository.profiles),
+            approve=approve,
+            reason=None if approve else "blurry id card",
+        )
+    )
+    assert len(response.updated) == len(pending)
+    return index, college_id, service
+
+
+def student(first_name: str) -> Person:
+    return Person(
+        uuid4(), RoleEnum.STUDENT, f"{first_name}@college.edu", first_name, None
+    )
+
+
+def test_approved_students_become_searchable():
+    asha = student("asha")
+    index, college_id, service = decide(True, [], [asha])
+
+    assert index.search(college_id, "ash", 10) == [asha]
+    assert service.interest_matcher.invalidated == [college_id]
+
+
+def test_rejected_students_leave_the_index():
+    asha, ravi = student("asha"), student("ravi")
+    index, college_id, service = decide(False, [asha, ravi], [asha])
+
+    assert index.search(college_id, "ash", 10) == []
+    assert index.search(college_id, "ravi", 10) == [ravi]
+    assert service.interest_matcher.invalidated == []